@@ -1,46 +1,185 @@
-# Importing Modules
-import os
-from moviepy.editor import AudioFileClip, VideoFileClip
-
-# Combining Audio and Video Files with the Same Name
-def combineAudioVideo(dirPath, fps):
-    # Setting FilePath
-    dirPath = dirPath
-
-    # Iterating Through Directory
-    for path in os.listdir(dirPath):
-        # Check if Path is .avi File
-        fileName, fileExtension = os.path.splitext(path)
-        
-        # If File is .avi
-        if fileExtension == '.avi':
-            try:
-                # Try Loading .avi and .wav file
-                fileLocation = os.path.join(dirPath, fileName)
-                videoClip = VideoFileClip(f"{fileLocation}.avi")
-                audioClip = AudioFileClip(f"{fileLocation}.wav")
-
-                # Setting Video Audio
-                videoClip = videoClip.set_audio(audioClip)
-
-                # Setting Output Name
-                outputFile = f"{fileLocation}.mp4"
-
-                # Writting to Output File
-                videoClip.write_videofile(outputFile, codec='libx264', audio_codec='aac', fps = fps)
-
-                # Closing Video and Audio File
-                videoClip.close()
-                audioClip.close()
-
-            except Exception as e:
-                print(e)
-
-            # Deleting Previous Audio and Video File
-            try:
-                # Attempt to Delete FIle
-                os.remove(f"{fileLocation}.avi")
-                os.remove(f"{fileLocation}.wav")
-
-            except Exception as e:
-                print(e)
+# Importing Modules
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+# Codecs the .mp4 Container Takes Without Re-Encoding
+copyVideoCodecs = ['h264', 'hevc', 'mpeg4']
+copyAudioCodecs = ['aac', 'mp3']
+
+# Finding FFmpeg, Bundled With imageio-ffmpeg (Installed With moviepy) or on PATH
+def ffmpegExecutable():
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+
+    except Exception:
+        return shutil.which('ffmpeg')
+
+def probeMedia(path):
+    """
+    Returns {'duration', 'videoCodec', 'audioCodec'} for a media file from the FFmpeg input summary. Missing
+    values are None.
+    """
+    result = subprocess.run([ffmpegExecutable(), '-hide_banner', '-i', path], capture_output = True, text = True)
+
+    # FFmpeg Prints Input Summary to stderr
+    duration = re.search(r"Duration: (\d+):(\d+):([\d.]+)", result.stderr)
+    videoCodec = re.search(r"Stream #\d+:\d+.*?: Video: (\w+)", result.stderr)
+    audioCodec = re.search(r"Stream #\d+:\d+.*?: Audio: (\w+)", result.stderr)
+
+    return {'duration' : int(duration[1]) * 3600 + int(duration[2]) * 60 + float(duration[3]) if duration else None,
+            'videoCodec' : videoCodec[1] if videoCodec else None,
+            'audioCodec' : audioCodec[1] if audioCodec else None}
+
+def streamDuration(path, streamType = 'a'):
+    """
+    Returns the duration in seconds of the first streamType ('v' or 'a') stream of a media file, found by
+    stream copying it to FFmpeg's null output. Returns None if the file has no such stream.
+    """
+    result = subprocess.run([ffmpegExecutable(), '-hide_banner', '-i', path, '-map', f"0:{streamType}:0", '-c', 'copy', '-f', 'null', '-'],
+                            capture_output = True, text = True)
+
+    # Last Progress Time Is the End of the Stream
+    times = re.findall(r"time=(\d+):(\d+):([\d.]+)", result.stderr)
+    if result.returncode != 0 or len(times) == 0:
+        return None
+
+    return int(times[-1][0]) * 3600 + int(times[-1][1]) * 60 + float(times[-1][2])
+
+def muxCommand(videoPath, audioPath, outputPath, fps, videoInfo, audioInfo, copyVideo, copyAudio, threads = 0):
+    """
+    Returns the FFmpeg command that writes outputPath from the video and optional audio file, copying or
+    encoding (libx264 / aac) each stream. Output is cut to the video duration, like moviepy set_audio.
+    """
+    command = [ffmpegExecutable(), '-hide_banner', '-loglevel', 'error', '-y', '-i', videoPath]
+    if audioPath is not None:
+        command += ['-i', audioPath, '-map', '0:v:0', '-map', '1:a:0']
+
+    # Video Stream
+    if copyVideo:
+        command += ['-c:v', 'copy']
+    else:
+        command += ['-c:v', 'libx264', '-r', str(fps), '-threads', str(threads)]
+
+    # Audio Stream
+    if audioPath is not None:
+        command += ['-c:a', 'copy'] if copyAudio else ['-c:a', 'aac']
+
+    # Keeping Video Length
+    if videoInfo['duration'] is not None:
+        command += ['-t', f"{videoInfo['duration']:.3f}"]
+
+    return command + [outputPath]
+
+def muxAudioVideo(videoPath, audioPath, outputPath, fps, mode = 'copy', durationTolerance = 0.5, threads = 0):
+    """
+    Combines one video file and its audio file (or None) into outputPath. In 'copy' mode each stream is
+    copied if the .mp4 container takes its codec and encoded otherwise, and the whole file is re-encoded if
+    that fails. 'encode' always re-encodes both streams. The output is verified when its duration is within
+    durationTolerance seconds of the video, it has a video stream and, with an audio file, an audio stream
+    whose duration is within durationTolerance of the audio (cut to the video). Returns a result dict with
+    'verified' and, on failure, 'error'.
+    """
+    result = {'videoPath' : videoPath, 'audioPath' : audioPath, 'outputPath' : outputPath, 'method' : None, 'verified' : False, 'error' : None}
+
+    try:
+        videoInfo = probeMedia(videoPath)
+        audioInfo = probeMedia(audioPath) if audioPath is not None else {'audioCodec' : None}
+
+        # Streams That Can Be Copied
+        copyVideo = mode == 'copy' and videoInfo['videoCodec'] in copyVideoCodecs
+        copyAudio = mode == 'copy' and audioInfo['audioCodec'] in copyAudioCodecs
+
+        # Trying Copy First, Then Full Re-Encode
+        attempts = [(copyVideo, copyAudio)]
+        if copyVideo or copyAudio:
+            attempts.append((False, False))
+
+        for copyVideo, copyAudio in attempts:
+            process = subprocess.run(muxCommand(videoPath, audioPath, outputPath, fps, videoInfo, audioInfo, copyVideo, copyAudio, threads),
+                                     capture_output = True, text = True)
+            result['method'] = 'copy' if copyVideo else 'encode'
+
+            # Verifying Output Duration Against Video
+            outputInfo = probeMedia(outputPath) if os.path.exists(outputPath) else {'duration' : None, 'videoCodec' : None, 'audioCodec' : None}
+            result['duration'] = outputInfo['duration']
+            if process.returncode != 0:
+                result['error'] = process.stderr.strip()
+                continue
+
+            if outputInfo['duration'] is None or videoInfo['duration'] is None or abs(outputInfo['duration'] - videoInfo['duration']) > durationTolerance:
+                result['error'] = f"Output duration {outputInfo['duration']} does not match video duration {videoInfo['duration']}"
+                continue
+
+            # Verifying Output Has Every Input Stream
+            if outputInfo['videoCodec'] is None or (audioPath is not None and outputInfo['audioCodec'] is None):
+                result['error'] = f"Output is missing a stream, video {outputInfo['videoCodec']}, audio {outputInfo['audioCodec']}"
+                continue
+
+            # Verifying Audio Duration, Audio Longer Than the Video Is Cut to It
+            if audioPath is not None:
+                audioDuration = streamDuration(outputPath, 'a')
+                expectedDuration = min(audioInfo['duration'], videoInfo['duration']) if audioInfo['duration'] is not None else videoInfo['duration']
+                result['audioDuration'] = audioDuration
+                if audioDuration is None or abs(audioDuration - expectedDuration) > durationTolerance:
+                    result['error'] = f"Output audio duration {audioDuration} does not match expected {expectedDuration}"
+                    continue
+
+            result['verified'] = True
+            result['error'] = None
+            break
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+def muxPair(fileLocation, fps, mode, deleteInputs, durationTolerance, threads):
+    """
+    Muxes fileLocation.avi and fileLocation.wav into fileLocation.mp4 and deletes the inputs only if the
+    output was verified. Runs in a worker process of combineAudioVideo.
+    """
+    audioPath = f"{fileLocation}.wav" if os.path.exists(f"{fileLocation}.wav") else None
+    result = muxAudioVideo(f"{fileLocation}.avi", audioPath, f"{fileLocation}.mp4", fps, mode, durationTolerance, threads)
+
+    # Deleting Previous Audio and Video File
+    if result['verified'] and deleteInputs:
+        try:
+            os.remove(f"{fileLocation}.avi")
+            if audioPath is not None:
+                os.remove(audioPath)
+
+        except Exception as e:
+            print(e)
+
+    return result
+
+# Combining Audio and Video Files with the Same Name
+def combineAudioVideo(dirPath, fps, mode = 'copy', numWorkers = None, deleteInputs = True, durationTolerance = 0.5):
+    """
+    Muxes every .avi file in dirPath with the .wav file of the same name into an .mp4, in parallel over a
+    process pool with one worker per core. Inputs are kept when the output could not be verified. Returns
+    the result dict of every pair.
+    """
+    # Finding .avi Files
+    fileLocations = [os.path.join(dirPath, os.path.splitext(path)[0]) for path in sorted(os.listdir(dirPath)) if os.path.splitext(path)[1] == '.avi']
+    if len(fileLocations) == 0:
+        return []
+
+    # Splitting Cores Between Workers for Re-Encoding
+    numWorkers = min(numWorkers or os.cpu_count() or 1, len(fileLocations))
+    threads = max((os.cpu_count() or 1) // numWorkers, 1)
+
+    with ProcessPoolExecutor(max_workers = numWorkers) as executor:
+        results = list(executor.map(muxPair, fileLocations, [fps] * len(fileLocations), [mode] * len(fileLocations),
+                                    [deleteInputs] * len(fileLocations), [durationTolerance] * len(fileLocations), [threads] * len(fileLocations)))
+
+    # Reporting Failures
+    for result in results:
+        if not result['verified']:
+            print(f"Unable to combine {result['videoPath']}, inputs kept: {result['error']}")
+
+    return results
@@ -0,0 +1,666 @@
+"""
+Benchmarks for the data collection pipeline. Every benchmark runs on synthetic data, so none of the Delsys base,
+XSensor insoles or camera need to be connected.
+
+Written by Sonny Jones & Grange Simpson
+Version: 2026.10.18
+
+Usage: python -m RLDependencies.Benchmarks storage saver insole emgGrid terrain mvc features video mux
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+import contextlib
+import io
+import numpy as np
+
+#-----------------------------------------------------------------------------------
+# ---- Synthetic Data
+
+def syntheticEMG(numChannels, numSamples, sampleRate = 2148.1481, seed = 0):
+    """
+    Returns (numChannels, numSamples) float32 EMG-like data: white noise shaped by slow contraction bursts.
+    """
+    rng = np.random.default_rng(seed)
+    time = np.arange(numSamples) / sampleRate
+
+    # Contraction Envelope Around 1 Hz Gait Cycle
+    envelope = 0.05 + 0.5 * np.clip(np.sin(2 * np.pi * 1.0 * time[None, :] + rng.uniform(0, 2 * np.pi, (numChannels, 1))), 0, None) ** 4
+
+    return (rng.normal(0, 1, (numChannels, numSamples)) * envelope * 1e-3).astype(np.float32)
+
+def syntheticPressure(numFrames, rows = 31, columns = 11, seed = 0):
+    """
+    Returns (numFrames, rows * columns) float32 insole-like pressure maps: a heel and forefoot blob that load
+    and unload over the gait cycle, with unloaded sensels at zero.
+    """
+    rng = np.random.default_rng(seed)
+    rowGrid, columnGrid = np.mgrid[0:rows, 0:columns]
+
+    # Heel and Forefoot Pressure Blobs
+    heel = np.exp(-(((rowGrid - 25) / 3.0) ** 2 + ((columnGrid - 5) / 2.5) ** 2))
+    forefoot = np.exp(-(((rowGrid - 8) / 4.0) ** 2 + ((columnGrid - 5) / 3.5) ** 2))
+
+    # Loading Over Gait Cycle at 100 Hz
+    phase = 2 * np.pi * np.arange(numFrames) / 100.0
+    heelLoad = np.clip(np.sin(phase), 0, None)[:, None, None]
+    forefootLoad = np.clip(np.sin(phase - 1.0), 0, None)[:, None, None]
+
+    frames = 40 * (heelLoad * heel + forefootLoad * forefoot) + rng.normal(0, 0.2, (numFrames, rows, columns))
+    frames[frames < 0.5] = 0
+
+    return frames.reshape(numFrames, rows * columns).astype(np.float32)
+
+#-----------------------------------------------------------------------------------
+# ---- Storage Profile Benchmark
+
+def benchmarkStorageProfiles(duration = 60, profiles = None, numEMGChannels = 16, sampleRate = 2148.1481, pressureRate = 100, tickMs = 30):
+    """
+    Writes duration seconds of synthetic EMG and two-foot pressure data through DataFileHandler for each
+    storage profile, in the same 30 ms ticks as the GUI, and reports write throughput and file size.
+    """
+    from RLDependencies.DataFileHandler import DataFileHandler, storageProfiles
+
+    if profiles is None:
+        profiles = list(storageProfiles.keys())
+
+    # Synthetic Session
+    numSamples = int(duration * sampleRate)
+    numFrames = int(duration * pressureRate)
+    emgData = syntheticEMG(numEMGChannels, numSamples, sampleRate)
+    pressureData = [syntheticPressure(numFrames, seed = foot) for foot in range(2)]
+    pressureTimestamps = 1_800_000_000_000_000 + (np.arange(numFrames) * 1e6 / pressureRate).astype(np.int64)
+    rawBytes = emgData.nbytes + sum(frames.nbytes for frames in pressureData)
+
+    # File Structures Matching DelsysEMG and XSensorForce
+    sensorDictDelsys = {f"Sensor {i + 1}" : {'Channels' : [f"EMG {i + 1}"], 'SampleRates' : [sampleRate], 'Attachment' : 'None'} for i in range(numEMGChannels)}
+    sensorDictXSensor = {f"Foot {i + 1}" : {'Channels' : ['Pressure'], 'SampleRates' : [pressureRate], 'Foot' : foot, 'SensorSize' : 'M'} for i, foot in enumerate(['Left', 'Right'])}
+
+    # Tick Boundaries
+    numTicks = int(duration * 1000 / tickMs)
+    sampleEdges = np.linspace(0, numSamples, numTicks + 1).astype(int)
+    frameEdges = np.linspace(0, numFrames, numTicks + 1).astype(int)
+
+    results = []
+
+    for profile in profiles:
+        with tempfile.TemporaryDirectory() as tempDir:
+            handler = DataFileHandler(tempDir)
+
+            # Creating and Formatting File Quietly
+            with contextlib.redirect_stdout(io.StringIO()):
+                handler.createFile('Benchmark')
+                handler.formatFile(sensorDictDelsys, sensorDictXSensor, storageProfile = profile)
+
+            startTime = time.perf_counter()
+
+            # Writing Ticks
+            for tick in range(numTicks):
+                handler.saveDelsysData(list(emgData[:, sampleEdges[tick]:sampleEdges[tick + 1]]))
+                handler.saveXSensorData([frames[frameEdges[tick]:frameEdges[tick + 1]] for frames in pressureData], pressureTimestamps[frameEdges[tick]:frameEdges[tick + 1]])
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                handler.closeFile()
+
+            elapsed = time.perf_counter() - startTime
+            fileSize = os.path.getsize(os.path.join(tempDir, 'Benchmark.h5'))
+
+        results.append((profile, elapsed, rawBytes / elapsed / 1e6, fileSize / 1e6, rawBytes / fileSize))
+
+    # Printing Results
+    print(f"Storage profiles: {duration} s session, {numEMGChannels} EMG channels at {sampleRate:.0f} Hz, 2 insoles at {pressureRate} Hz")
+    print(f"{'Profile':<10}{'Write (s)':>12}{'MB/s':>10}{'File (MB)':>12}{'Ratio':>8}")
+    for profile, elapsed, throughput, fileSize, ratio in results:
+        print(f"{profile:<10}{elapsed:>12.3f}{throughput:>10.1f}{fileSize:>12.2f}{ratio:>8.2f}")
+
+    return results
+
+#-----------------------------------------------------------------------------------
+# ---- Data Saver Benchmark
+
+def benchmarkDataSaver(duration = 60, speedup = 10, numEMGChannels = 16, sampleRate = 2148.1481, pressureRate = 100, tickMs = 30, storageProfile = 'raw'):
+    """
+    Feeds duration seconds of full sensor load through DataSaver, speedup times faster than real time, with
+    and without coalescing, and reports the saver metrics. The saver keeps up if latency stays bounded and
+    nothing is dropped.
+    """
+    from RLDependencies.DataFileHandler import DataFileHandler
+    from RLDependencies.DataSaver import DataSaver
+
+    # Synthetic Session
+    numSamples = int(duration * sampleRate)
+    numFrames = int(duration * pressureRate)
+    emgData = syntheticEMG(numEMGChannels, numSamples, sampleRate)
+    pressureData = [syntheticPressure(numFrames, seed = foot) for foot in range(2)]
+    pressureTimestamps = 1_800_000_000_000_000 + (np.arange(numFrames) * 1e6 / pressureRate).astype(np.int64)
+
+    # File Structures Matching DelsysEMG and XSensorForce
+    sensorDictDelsys = {f"Sensor {i + 1}" : {'Channels' : [f"EMG {i + 1}"], 'SampleRates' : [sampleRate], 'Attachment' : 'None'} for i in range(numEMGChannels)}
+    sensorDictXSensor = {f"Foot {i + 1}" : {'Channels' : ['Pressure'], 'SampleRates' : [pressureRate], 'Foot' : foot, 'SensorSize' : 'M'} for i, foot in enumerate(['Left', 'Right'])}
+
+    # Tick Boundaries
+    numTicks = int(duration * 1000 / tickMs)
+    sampleEdges = np.linspace(0, numSamples, numTicks + 1).astype(int)
+    frameEdges = np.linspace(0, numFrames, numTicks + 1).astype(int)
+    tickPeriod = tickMs / 1000 / speedup
+
+    print(f"Data saver: {duration} s session at {speedup}x real time, {numEMGChannels} EMG channels, 2 insoles, '{storageProfile}' profile")
+
+    results = {}
+
+    for maxCoalesce in (1, 64):
+        with tempfile.TemporaryDirectory() as tempDir:
+            handler = DataFileHandler(tempDir)
+            dataSaver = DataSaver(handler, maxQueueSize = 256, policy = 'block', maxCoalesce = maxCoalesce)
+            dataSaver.start()
+
+            # Creating and Formatting File Quietly
+            with contextlib.redirect_stdout(io.StringIO()):
+                dataSaver.submitCommand('createFile', fileName = 'Benchmark')
+                dataSaver.submitCommand('formatFile', sensorDictDelsys = sensorDictDelsys, sensorDictXSensor = sensorDictXSensor, storageProfile = storageProfile)
+                dataSaver.waitUntilEmpty()
+
+            dataSaver.metrics.reset()
+            nextTick = time.perf_counter()
+
+            # Producing Ticks at Paced Rate
+            for tick in range(numTicks):
+                dataSaver.submitData('saveDelsysData', list(emgData[:, sampleEdges[tick]:sampleEdges[tick + 1]]))
+                dataSaver.submitData('saveXSensorData', [frames[frameEdges[tick]:frameEdges[tick + 1]] for frames in pressureData], pressureTimestamps[frameEdges[tick]:frameEdges[tick + 1]])
+
+                nextTick += tickPeriod
+                time.sleep(max(nextTick - time.perf_counter(), 0))
+
+            dataSaver.waitUntilEmpty()
+            results[maxCoalesce] = dataSaver.metrics.summary()
+            print(f"maxCoalesce {maxCoalesce:>3}: {dataSaver.metrics.report()}")
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                dataSaver.submitCommand('closeFile')
+                dataSaver.stop()
+                dataSaver.join()
+
+    return results
+
+#-----------------------------------------------------------------------------------
+# ---- Insole Display Benchmark
+
+def legacyQImage(data, minValue, maxValue):
+    """
+    The per-frame RGBA build and scaled copy XSensorWidget.getQImage used before the lookup table renderer,
+    kept as the reference for benchmarkInsoleDisplay.
+    """
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage
+
+    mappedValue = abs((data - minValue) / (maxValue - minValue))
+    colormap = np.zeros((data.shape[0], data.shape[1], 4), dtype = np.uint8)
+    colormap[..., 0] = (255 * (1 - mappedValue)).astype(np.uint8)
+    colormap[..., 1] = (255 * (1 - mappedValue)).astype(np.uint8)
+    colormap[..., 2] = 255
+    colormap[..., 3] = 255
+
+    height, width, channels = colormap.shape
+    qImage = QImage(colormap.data, width, height, channels * width, QImage.Format_RGBA8888)
+
+    return qImage.scaled(220, 620, Qt.KeepAspectRatio)
+
+def benchmarkInsoleDisplay(numFrames = 500, numSensors = 2):
+    """
+    Renders numFrames synthetic pressure frames for numSensors insoles and reports the mean and p95 time per
+    display update (colormap, image update and repaint) for the legacy QLabel pixmap path and for both
+    XSensorWidget display backends. Needs the XSensor library, since XSensorWidget creates an XSensorForce.
+    """
+    from PySide6.QtWidgets import QApplication, QLabel, QWidget, QHBoxLayout
+    from PySide6.QtGui import QPixmap
+    from RLDependencies.XSensorWidget import XSensorWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # Synthetic Frames in XSensorForce Layout
+    frames = np.stack([syntheticPressure(numFrames, seed = sensor) for sensor in range(numSensors)], axis = 1)
+
+    results = {}
+
+    # Legacy QLabel and QPixmap Path
+    legacyWidget = QWidget()
+    legacyLayout = QHBoxLayout(legacyWidget)
+    labels = [QLabel() for _ in range(numSensors)]
+    for label in labels:
+        legacyLayout.addWidget(label)
+    legacyWidget.show()
+
+    frameTimes = []
+    for frame in range(numFrames):
+        startTime = time.perf_counter()
+        for sensor, label in enumerate(labels):
+            label.setPixmap(QPixmap.fromImage(legacyQImage(frames[frame, sensor].reshape(31, 11), 0, 40)))
+        app.processEvents()
+        frameTimes.append(time.perf_counter() - startTime)
+    results['legacy'] = np.array(frameTimes) * 1000
+    legacyWidget.close()
+
+    # XSensorWidget Display Backends
+    for displayBackend in ('qimage', 'pyqtgraph'):
+        widget = XSensorWidget(recordingRate = 30, displayBackend = displayBackend)
+        widget.numRows, widget.numCols, widget.minValue, widget.maxValue = 31, 11, 0, 40
+        for sensor in range(numSensors):
+            widget.splitter.addWidget(widget.XSensorDisplay(sensor))
+        widget.show()
+
+        frameTimes = []
+        for frame in range(numFrames):
+            widget.XSensorForce.data = frames[frame:frame + 1]
+            startTime = time.perf_counter()
+            widget.updateDisplay()
+            app.processEvents()
+            frameTimes.append(time.perf_counter() - startTime)
+        results[displayBackend] = np.array(frameTimes) * 1000
+        widget.close()
+
+    # Printing Results
+    print(f"Insole display: {numFrames} frames, {numSensors} insoles, time per display update")
+    for name, frameTimes in results.items():
+        print(f"{name:<10} mean {frameTimes.mean():.3f} ms   p95 {np.percentile(frameTimes, 95):.3f} ms")
+
+    return results
+
+def benchmarkEMGGrid(duration = 10, numEMGChannels = 16, numGoniometerChannels = 4, sampleRate = 2148.1481, goniometerRate = 518.5185,
+                     tickMs = 30, windowSeconds = 5):
+    """
+    Streams duration seconds of synthetic raw EMG and goniometer blocks into an EMGPlot, one block per channel
+    every tickMs, and reports the time per tick (buffer writes, decimation, setData and repaint) for the
+    single channel layout and the grid layout with every channel shown. The render clock is disabled so every
+    tick redraws, which is an upper bound on the live load where rendering runs every other tick. Timing
+    starts after one window of warm-up, once the plot window is full of data.
+    """
+    from PySide6.QtWidgets import QApplication
+    from RLDependencies.EMGPlot import EMGPlot
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # Synthetic Channels, EMG First Then Goniometers
+    numTicks = int(duration * 1000 / tickMs)
+    warmupTicks = int(windowSeconds * 1000 / tickMs)
+    sampleRates = [sampleRate] * numEMGChannels + [goniometerRate] * numGoniometerChannels
+    channels = [syntheticEMG(1, int(rate * (duration + windowSeconds)) + 1, rate, seed = channel)[0] for channel, rate in enumerate(sampleRates)]
+    channelLabels = [f"Sensor {channel + 1} : EMG" for channel in range(numEMGChannels)] + [f"Goniometer {channel + 1}" for channel in range(numGoniometerChannels)]
+
+    results = {}
+
+    for layout in ('single', 'grid'):
+        plot = EMGPlot(len(channels), recordingRate = tickMs, sampleRate = sampleRates, windowSeconds = windowSeconds,
+                       layout = layout, channelLabels = channelLabels)
+        plot.renderInterval = 0
+        plot.plottingPanel.resize(1200, 800)
+        plot.plottingPanel.show()
+        app.processEvents()
+
+        tickTimes = []
+        for tick in range(warmupTicks + numTicks):
+            # Samples Arriving During This Tick
+            blocks = [channel[int(tick * tickMs * rate / 1000):int((tick + 1) * tickMs * rate / 1000)] for channel, rate in zip(channels, sampleRates)]
+
+            startTime = time.perf_counter()
+            plot.plotEMG(blocks)
+            app.processEvents()
+            tickTimes.append(time.perf_counter() - startTime)
+
+        results[layout] = np.array(tickTimes[warmupTicks:]) * 1000
+        plot.plottingPanel.close()
+
+    # Printing Results
+    print(f"EMG plot: {numEMGChannels} EMG at {sampleRate:.0f} Hz + {numGoniometerChannels} goniometer at {goniometerRate:.0f} Hz, "
+          f"{windowSeconds} s window, {numTicks} ticks, frame budget {tickMs} ms")
+    for layout, tickTimes in results.items():
+        print(f"{layout:<8} mean {tickTimes.mean():.3f} ms   p95 {np.percentile(tickTimes, 95):.3f} ms   max {tickTimes.max():.3f} ms   "
+              f"over budget {np.mean(tickTimes > tickMs) * 100:.1f} %")
+
+    return results
+
+class LegacyTerrainPlot():
+    """
+    The terrain prediction plot update as it was before RLWidget used ring buffers: curves stored as numbered
+    attributes reached through exec and both buffers shifted with np.roll on every update.
+    """
+    def __init__(self, plotWidget, numberOfTerrains = 7, bufferSize = 100):
+        self.numberOfTerrains = numberOfTerrains
+        self.predPlottingBuffer = np.zeros((numberOfTerrains, bufferSize))
+        self.terrainPlottingBuffer = np.zeros((numberOfTerrains, bufferSize))
+        self.samples = np.arange(-(bufferSize - 1), 1)
+        self.sampleCount = 0
+        self.terrainPlot = plotWidget
+
+        for i in range(numberOfTerrains):
+            exec(f"self.terrainPlot{i} = self.terrainPlot.addPlot(row = {i}, col = 0)")
+            exec(f"self.terrainPlotItem{i} = self.terrainPlot{i}.plot(self.samples, self.predPlottingBuffer[{i}])")
+
+    def updateTerrainPlot(self, data, terrain, render = True):
+        self.predPlottingBuffer[:, -1] = data
+        self.terrainPlottingBuffer[:, -1] = terrain
+
+        self.sampleCount += 1
+        self.samples = np.roll(self.samples, -1)
+        self.samples[-1] = self.sampleCount
+
+        if render:
+            for i in range(self.numberOfTerrains):
+                exec(f"self.terrainPlotItem{i}.setData(self.samples, self.predPlottingBuffer[i])")
+
+        self.predPlottingBuffer = np.roll(self.predPlottingBuffer, -1)
+        self.terrainPlottingBuffer = np.roll(self.terrainPlottingBuffer, -1)
+
+def benchmarkTerrainPlot(numUpdates = 2000):
+    """
+    Times RLWidget.updateTerrainPlot against the legacy exec and np.roll path, with and without the setData
+    calls, on the same seven curve layout. Needs the TOTD and SwiftTD modules, since RLWidget imports them.
+    """
+    import pyqtgraph as pg
+    from PySide6.QtWidgets import QApplication
+    from RLDependencies.RLWidget import RLWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    predictions = np.random.default_rng(0).uniform(0, 1, (numUpdates, 7))
+
+    # Legacy Path
+    legacyPlot = LegacyTerrainPlot(pg.GraphicsLayoutWidget())
+
+    # Ring Buffer Path
+    widget = RLWidget(recordingRate = 30)
+    widget.evenGround = widget.unevenGround = widget.upStairs = widget.downStairs = widget.upRamp = widget.downRamp = widget.turn = 0
+    widget.terrainPlots = widget.terrainPlottingPanel()
+    terrainPlotItems = widget.terrainPlotItems
+
+    results = {}
+    for render in (False, True):
+        # Buffers Only, Then Buffers and setData
+        widget.terrainPlotItems = terrainPlotItems if render else []
+        mode = 'update' if render else 'buffers'
+
+        startTime = time.perf_counter()
+        for prediction in predictions:
+            legacyPlot.updateTerrainPlot(prediction, widget.getCurrentTerrain()[1], render)
+        results[f'legacy {mode}'] = (time.perf_counter() - startTime) / numUpdates * 1e6
+
+        startTime = time.perf_counter()
+        for prediction in predictions:
+            widget.updateTerrainPlot(prediction)
+        results[f'ring {mode}'] = (time.perf_counter() - startTime) / numUpdates * 1e6
+
+    # Printing Results
+    print(f"Terrain plot: {numUpdates} updates, 7 terrains, time per update")
+    for name, updateTime in results.items():
+        print(f"{name:<16} {updateTime:.1f} us")
+
+    return results
+
+def legacyMVC(trials):
+    """
+    MVC as DelsysEMG.createMVCNorm computed it before MVCEstimator: a full sort of every rectified trial and
+    channel, averaging sortedMVCList[-106:-6]. Returns (numTrials, numChannels).
+    """
+    values = np.zeros(trials.shape[:2])
+
+    for trial in range(trials.shape[0]):
+        for channel in range(trials.shape[1]):
+            sortedMVCList = np.sort(np.abs(trials[trial, channel] - np.average(trials[trial, channel])), kind = 'quicksort')
+            values[trial, channel] = np.average(sortedMVCList[-106:-6])
+
+    return values
+
+def benchmarkMVC(durations = (5, 30, 120), numTrials = 3, numEMGChannels = 16, sampleRate = 2148.1481, repeats = 5):
+    """
+    Times MVC estimation for numTrials trials of numEMGChannels channels at several trial lengths: the legacy
+    per trial sort, MVCEstimator 'topk' on all trials and channels at once, and the moving RMS envelope
+    definition. Checks that 'topk' matches the legacy values.
+    """
+    from RLDependencies.MVCEstimator import MVCEstimator
+
+    topKEstimator = MVCEstimator(method = 'topk')
+    rmsEstimator = MVCEstimator(method = 'rms', sampleRate = sampleRate)
+
+    results = {}
+    print(f"MVC: {numTrials} trials x {numEMGChannels} channels at {sampleRate:.0f} Hz, best of {repeats}")
+
+    for duration in durations:
+        trials = np.stack([syntheticEMG(numEMGChannels, int(duration * sampleRate), sampleRate, seed = trial) for trial in range(numTrials)])
+
+        # Checking Top-K Matches Legacy Definition
+        if not np.allclose(legacyMVC(trials), topKEstimator.trialMVC(trials)):
+            print("Warning: topk values differ from legacy sort")
+
+        for name, function in (('legacy sort', legacyMVC), ('topk', topKEstimator.trialMVC), ('rms', rmsEstimator.trialMVC)):
+            runTimes = []
+            for _ in range(repeats):
+                startTime = time.perf_counter()
+                function(trials)
+                runTimes.append(time.perf_counter() - startTime)
+
+            results[(duration, name)] = min(runTimes) * 1000
+            print(f"{duration:>4} s   {name:<12} {results[(duration, name)]:.1f} ms")
+
+    return results
+
+def benchmarkFeatures(duration = 60, numEMGChannels = 16, numGoniometerChannels = 4, sampleRate = 2148.1481, goniometerRate = 518.5185, tickMs = 30,
+                      windowSeconds = 0.2, hopSeconds = 0.05):
+    """
+    Streams duration seconds of synthetic EMG and goniometer data through EMGFeatureExtractor in tickMs blocks
+    and prints its latency report. Also recomputes the EMG features of the final window directly to check
+    the running sums.
+    """
+    from RLDependencies.EMGFeatures import EMGFeatureExtractor
+
+    # Synthetic Streams as (numSamples, numChannels)
+    emg = syntheticEMG(numEMGChannels, int(duration * sampleRate), sampleRate).T.astype(np.float64)
+    goniometer = np.cumsum(np.random.default_rng(0).normal(0, 0.1, (int(duration * goniometerRate), numGoniometerChannels)), axis = 0)
+
+    featureExtractor = EMGFeatureExtractor(numEMGChannels, numGoniometerChannels, sampleRate, goniometerRate, windowSeconds, hopSeconds)
+
+    # Feeding Ticks, Stopping on the Last Hop Boundary for the Check
+    numTicks = int(duration * 1000 / tickMs)
+    emgEnd = goniometerEnd = 0
+    for tick in range(numTicks):
+        emgStart, emgEnd = emgEnd, int((tick + 1) * tickMs * sampleRate / 1000)
+        goniometerStart, goniometerEnd = goniometerEnd, int((tick + 1) * tickMs * goniometerRate / 1000)
+        featureExtractor.update(emg[emgStart:emgEnd], goniometer[goniometerStart:goniometerEnd])
+
+    # Direct Features of Window Ending at Last Hop
+    hopEnd = emgEnd - (featureExtractor.hopSize - featureExtractor.samplesToHop)
+    window = emg[hopEnd - featureExtractor.windowSize - 2:hopEnd]
+    differences = np.diff(window, axis = 0)
+    expected = np.concatenate([np.abs(window[2:]).mean(axis = 0), np.sqrt(np.square(window[2:]).mean(axis = 0)), np.abs(differences[1:]).sum(axis = 0),
+                               (window[1:-1] * window[2:] < 0).sum(axis = 0), (differences[:-1] * -differences[1:] > 0).sum(axis = 0)])
+
+    print(f"Features: {numEMGChannels} EMG + {numGoniometerChannels} goniometer channels, {windowSeconds * 1000:.0f} ms window, "
+          f"{hopSeconds * 1000:.0f} ms hop, {numTicks} ticks of {tickMs} ms")
+    print(featureExtractor.latencyReport())
+    if not np.allclose(featureExtractor.features[:featureExtractor.numEMGFeatures], expected, rtol = 1e-4):
+        print("Warning: running window features differ from direct computation")
+
+    return featureExtractor
+
+class SyntheticCamera():
+    """
+    Stands in for cv2.VideoCapture: read() blocks until the next frame time at fps, like a camera, and fills
+    the given array (or a new one) with one of a few precomputed 1080p frames: a smooth pattern drifting
+    across the image with a little sensor noise.
+    """
+    def __init__(self, width = 1920, height = 1080, fps = 30, numFrames = 8):
+        rng = np.random.default_rng(0)
+        x, y = np.meshgrid(np.arange(width), np.arange(height))
+        self.frames = []
+        for frame in range(numFrames):
+            pattern = 127 + 60 * np.sin((x + 8 * frame) / 90) * np.cos(y / 70) + rng.normal(0, 3, (height, width))
+            self.frames.append(np.repeat(np.clip(pattern, 0, 255).astype(np.uint8)[:, :, None], 3, axis = 2))
+        self.frameInterval = 1 / fps
+        self.nextFrameTime = time.perf_counter()
+        self.frameCount = 0
+
+    def read(self, image = None):
+        # Waiting for Next Frame Time
+        delay = self.nextFrameTime - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.nextFrameTime = max(self.nextFrameTime + self.frameInterval, time.perf_counter() - self.frameInterval)
+
+        frame = self.frames[self.frameCount % len(self.frames)]
+        self.frameCount += 1
+
+        if image is None:
+            return True, frame.copy()
+
+        np.copyto(image, frame)
+        return True, image
+
+def benchmarkVideoCapture(duration = 10, tickMs = 30, fps = 30, width = 1920, height = 1080):
+    """
+    Times the GUI timer side of VideoWidget for duration seconds of recording from a synthetic 1080p camera:
+    the legacy synchronous read, resize, rgbSwapped and XVID write on every tick, against VideoCaptureThread
+    and VideoWriterThread with only the display update on the tick, writing in the writer thread or through
+    the VideoEncoder process. Reports tick time and frames written.
+    """
+    import cv2
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QImage, QPixmap
+    from RLDependencies.VideoPipeline import VideoCaptureThread, VideoWriterThread, VideoEncoder
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    numTicks = int(duration * 1000 / tickMs)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Legacy Path, Everything on the Tick
+        camera = SyntheticCamera(width, height, fps)
+        videoWriter = cv2.VideoWriter(os.path.join(directory, 'legacy.avi'), cv2.VideoWriter_fourcc(*'XVID'), fps, (width, height))
+        tickTimes = []
+        startTime = time.perf_counter()
+        for tick in range(numTicks):
+            tickStart = time.perf_counter()
+            ret, frame = camera.read()
+            displayFrame = cv2.resize(frame, (720, 480))
+            pixmap = QPixmap.fromImage(QImage(displayFrame.data, 720, 480, 3 * 720, QImage.Format_RGB888).rgbSwapped())
+            videoWriter.write(frame)
+            tickTimes.append(time.perf_counter() - tickStart)
+
+            # Waiting for Next Timer Tick
+            time.sleep(max(startTime + (tick + 1) * tickMs / 1000 - time.perf_counter(), 0))
+        videoWriter.release()
+        results['legacy'] = (np.array(tickTimes) * 1000, camera.frameCount, camera.frameCount)
+
+        # Threaded Paths, Display Only on the Tick, Writing In-Process or Through Encoder Process
+        for name in ('threaded', 'encoder'):
+            camera = SyntheticCamera(width, height, fps)
+            captureThread = VideoCaptureThread(camera)
+            writerThread = VideoWriterThread(captureThread)
+            videoPath = os.path.join(directory, f'{name}.avi')
+            if name == 'encoder':
+                videoEncoder = VideoEncoder(frameShape = (height, width, 3))
+                videoEncoder.openFile(videoPath, 'XVID', fps)
+                writerThread.setOutput(videoEncoder)
+            else:
+                writerThread.setOutput(cv2.VideoWriter(videoPath, cv2.VideoWriter_fourcc(*'XVID'), fps, (width, height)))
+            captureThread.startRecording()
+            captureThread.start()
+            writerThread.start()
+
+            displayFrame = np.empty((480, 720, 3), dtype = np.uint8)
+            tickTimes = []
+            startTime = time.perf_counter()
+            for tick in range(numTicks):
+                tickStart = time.perf_counter()
+                latest = captureThread.acquireLatest()
+                if latest is not None:
+                    cv2.resize(latest[1], (720, 480), dst = displayFrame)
+                    captureThread.releaseFrame(latest[0])
+                    pixmap = QPixmap.fromImage(QImage(displayFrame.data, 720, 480, 3 * 720, QImage.Format_BGR888))
+                tickTimes.append(time.perf_counter() - tickStart)
+
+                time.sleep(max(startTime + (tick + 1) * tickMs / 1000 - time.perf_counter(), 0))
+
+            captureThread.stopRecording()
+            writerThread.join()
+            captureThread.stop()
+            captureThread.join()
+
+            # Frames Dropped Anywhere Before the File
+            encoderResults = writerThread.output.release()
+            if name == 'encoder':
+                videoEncoder.stop()
+                framesWritten = encoderResults['framesEncoded']
+            else:
+                framesWritten = writerThread.framesWritten
+            results[name] = (np.array(tickTimes) * 1000, captureThread.framesCaptured, framesWritten)
+
+    # Printing Results
+    print(f"Video: {duration} s at {width}x{height}, {fps} fps camera, {tickMs} ms GUI timer")
+    for name, (tickTimes, framesCaptured, framesWritten) in results.items():
+        print(f"{name:<9} tick p50/p95/max {np.percentile(tickTimes, 50):.1f}/{np.percentile(tickTimes, 95):.1f}/{tickTimes.max():.1f} ms, "
+              f"captured {framesCaptured}, written {framesWritten}")
+    print(f"encoder   {encoderResults['ringFullDrops']} dropped at full ring, {encoderResults['framesMissing']} lost in capture, "
+          f"encode p50/p95 {encoderResults['encodeP50']:.1f}/{encoderResults['encodeP95']:.1f} ms")
+
+    return results
+
+def benchmarkMuxing(numTrials = 4, duration = 5, fps = 30, width = 1920, height = 1080):
+    """
+    Writes numTrials synthetic XVID trials with WAV audio and times AudioVideoMuxing.combineAudioVideo in
+    'copy' mode (video stream copied, audio to AAC) against 'encode' mode (libx264 and AAC, as moviepy did),
+    both over the process pool. Needs FFmpeg from imageio-ffmpeg or PATH.
+    """
+    import wave
+    import cv2
+    from RLDependencies.AudioVideoMuxing import combineAudioVideo
+
+    camera = SyntheticCamera(width, height, fps)
+    results = {}
+    print(f"Muxing: {numTrials} trials of {duration} s at {width}x{height}, {os.cpu_count()} cores")
+
+    for mode in ('copy', 'encode'):
+        with tempfile.TemporaryDirectory() as directory:
+            # Writing Trials Like VideoWidget
+            for trial in range(numTrials):
+                filePath = os.path.join(directory, f"Trial {trial + 1}")
+                videoWriter = cv2.VideoWriter(f"{filePath}.avi", cv2.VideoWriter_fourcc(*'XVID'), fps, (width, height))
+                for frame in range(duration * fps):
+                    videoWriter.write(camera.frames[frame % len(camera.frames)])
+                videoWriter.release()
+
+                audioWriter = wave.open(f"{filePath}.wav", 'wb')
+                audioWriter.setnchannels(2)
+                audioWriter.setsampwidth(2)
+                audioWriter.setframerate(44100)
+                audioWriter.writeframes(np.random.default_rng(trial).normal(0, 1000, (duration * 44100, 2)).astype(np.int16).tobytes())
+                audioWriter.close()
+
+            startTime = time.perf_counter()
+            muxResults = combineAudioVideo(directory, fps, mode = mode)
+            results[mode] = time.perf_counter() - startTime
+
+            print(f"{mode:<7} {results[mode]:.2f} s, {sum(result['verified'] for result in muxResults)}/{numTrials} verified, "
+                  f"inputs left {len([path for path in os.listdir(directory) if not path.endswith('.mp4')])}")
+
+    return results
+
+#-----------------------------------------------------------------------------------
+# ---- Main Function
+
+benchmarks = {
+    'storage' : benchmarkStorageProfiles,
+    'saver' : benchmarkDataSaver,
+    'insole' : benchmarkInsoleDisplay,
+    'emgGrid' : benchmarkEMGGrid,
+    'terrain' : benchmarkTerrainPlot,
+    'mvc' : benchmarkMVC,
+    'features' : benchmarkFeatures,
+    'video' : benchmarkVideoCapture,
+    'mux' : benchmarkMuxing,
+}
+
+if __name__ == '__main__':
+    # Running Selected or All Benchmarks
+    for name in (sys.argv[1:] or benchmarks.keys()):
+        benchmarks[name]()
+        print()
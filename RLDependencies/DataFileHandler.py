@@ -1,616 +1,1041 @@
-import numpy as np
-import h5py
-import os
-from datetime import datetime, date
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from IPython.display import display, clear_output
-import tkinter as tk
-import json
-import threading
-import queue
-from pylsl import StreamInlet, resolve_stream, LostError
-
-class DataFileHandler():
-    """
-    This is a Data File Handler Class that is used to save data live to files during experiments. Utilizes
-    numpy and h5py files formats to saving.
-
-    Author: Sonny Jones & Grange Simpson
-    Version: 2024.06.10
-    """
-
-    def __init__(self, filePath = None):
-        # Initialiting filePath
-        self.filePath = filePath
-
-        # Initiating num channels
-        self.numChannels = 0
-
-        # Initializing File Saving Structures
-        self.DelsysFileStructure = None
-        self.XSensorFileStructure = None        
-
-    #-----------------------------------------------------------------------------------
-    # ---- File Handler Functions
-
-    def setFilePath(self, filePath):
-        # Setting File Path
-        self.filePath = filePath
-
-    def createFile(self, fileName):
-        if self.filePath is not None:
-            # Checking filePath 
-            if not os.path.exists(self.filePath):
-                # Creating folder if doesn't exists
-                os.makedirs(self.filePath)
-
-            # Formatting FileName
-            self.trialName = fileName
-            self.fileName = f"{fileName}.h5"
-
-            # Complete path
-            completePath = os.path.join(self.filePath, self.fileName)
-
-            # Creating h5py file with fileName
-            self.hdf5File = h5py.File(completePath, 'a')
-
-            # Adding some metadata variables
-            self.hdf5File.attrs['Created Date'] = str(date.today())
-            self.hdf5File.attrs['Created Time'] = str(datetime.now().strftime("%H:%M:%S"))
-        else:
-            # Formatting FileName
-            self.fileName = f"{fileName}.h5"
-
-            # Creating h5py file with fileName
-            self.hdf5File = h5py.File(self.fileName, 'a')
-
-            # Adding some metadata variables
-            self.hdf5File.attrs['Created Date'] = str(date.today())
-            self.hdf5File.attrs['Created Time'] = str(datetime.now().strftime("%H:%M:%S"))
-
-    # Incoming Sensor File Format
-    # Key : 'Sensor Name' -> Values: 'Channel Names' : List of Names ; 'Sample Rates' : List of Sample Rates 
-    def formatFile(self, sensorDictDelsys: dict = None, sensorDictXSensor: dict = None) -> None:
-        # Adding additional metadata
-        if sensorDictDelsys and sensorDictXSensor:
-            self.hdf5File.attrs['Sensors'] = list(sensorDictDelsys.keys()) + list(sensorDictXSensor.keys())
-
-            # Formatting File for Delsys and XSensor Data
-            self.formatDelsysInfo(sensorDictDelsys)
-            self.formatXsensorInfo(sensorDictXSensor)
-
-        elif sensorDictDelsys:
-            self.hdf5File.attrs['Sensors'] = list(sensorDictDelsys.keys())
-
-            # Formatting File for Delsys
-            self.formatDelsysInfo(sensorDictDelsys)
-
-        elif sensorDictXSensor:
-            self.hdf5File.attrs['Sensors'] = list(sensorDictXSensor.keys())
-
-            # Formatting File for XSensor Data
-            self.formatXsensorInfo(sensorDictXSensor)
-
-        else:
-            print("No Formatting Data Provided")
-
-    # Formatting File for Delsys
-    def formatDelsysInfo(self, sensorDictDelsys: dict) -> None:
-        # Formatting file for the Delsys data structure
-        for group, datasets in sensorDictDelsys.items():
-            # Setting internal attributes
-            self.DelsysFileStructure = sensorDictDelsys
-
-            # Creating groups then datasets for each connected sensor
-            try:
-                self.createGroup(group, metaData = {'Attachment' : datasets['Attachment']})
-                
-                # Checking channel and samplerate attributes are of the same length
-                if len(datasets['Channels']) != len(datasets['SampleRates']):
-                    print('Channels and SampleRates are not the same length')
-                    pass
-
-                # Creating Element if Needing to Add Additional Channels
-                self.extra = 1
-
-                # Creating datasets for each channel, 
-                for i in range(len(datasets['Channels'])):
-                    print(datasets['Channels'][i])
-                    # Creating channels and adding sample rates for EMG GYROX, GYROY, GYROZ
-                    self.createChannel(group, datasets['Channels'][i], {'SampleRate' : datasets['SampleRates'][i]})
-
-            except Exception as e:
-                print("Error in making group or datasets for Delsys.")
-                print(e)
-
-    # Formatting File for XSensor
-    def formatXsensorInfo(self, sensorDictXSensor: dict) -> None:
-        # Formatting file for the XSensor data structure
-        for group, datasets in sensorDictXSensor.items():
-            # Setting internal attributes
-            self.XSensorFileStructure = sensorDictXSensor
-
-            # Creating groups then datasets for each connected sensor
-            try:
-                self.createGroup(group, metaData = {'Foot' : datasets['Foot'], 'SensorSize' : datasets['SensorSize']})
-
-                # Checking channel and samplerate attributes are of the same length
-                if len(datasets['Channels']) != len(datasets['SampleRates']):
-                    print('Channels and SampleRates are not the same length')
-                    pass
-
-                # Creating datasets for each channel
-                for i in range(len(datasets['Channels'])):
-                    print(datasets['Channels'][i])
-                    self.createXSensorChannel(group, datasets['Channels'][i], {'SampleRate' : datasets['SampleRates'][i]})
-
-            except Exception as e:
-                print("Error in making group or datasets for XSensor.")
-                print(e)
-    
-    """
-    First step when creating the hdf5 file is to create a group which will have datasets stored under them
-    """
-    def createGroup(self, groupName: str, metaData: dict = None) -> None:
-        try:
-            # Creating group in file
-            group = self.hdf5File.create_group(groupName)
-
-            # Adding metadata to group
-            if metaData is not None:
-                for key, value in metaData.items():
-                    group.attrs[key] = value
-
-        except Exception as e:
-            print(e)
-            print("Group already exists")
-
-    """
-    Second step is to create data sets and put them under the right group
-    """
-    def createChannel(self, groupName: str, channelName: str, metaData: dict = None) -> None:
-        # Locating Group in file
-        try:
-            # Accessing group in file
-            group = self.hdf5File[groupName]
-            # Adding dataset to group
-            maxDataSize = (None,)
-
-            group.create_dataset(channelName, shape = (0,), maxshape = maxDataSize)
-
-            # Adding metadata if available
-            if metaData is not None:
-                # Adding metadata
-                for key, value in metaData.items():
-                    group[channelName].attrs[key] = value
-
-            # Adding to channel number
-            self.numChannels += 1
-
-        except:
-            # Accessing group in file
-            group = self.hdf5File[groupName]
-            # Adding dataset to group
-            maxDataSize = (None,)
-
-            # Creating Temp Channel Name
-            tempChanName = f"{channelName}_{self.extra}"
-            group.create_dataset(tempChanName, shape = (0,), maxshape = maxDataSize)
-
-            # Incrementing Extra Index
-            self.extra += 1
-
-            # Adding metadata if available
-            if metaData is not None:
-                # Adding metadata
-                for key, value in metaData.items():
-                    group[channelName].attrs[key] = value
-
-            # Adding to channel number
-            self.numChannels += 1
-
-    """
-    Creating XSensor Channel
-    """
-    def createXSensorChannel(self, groupName: str, channelName: str, metaData: dict = None) -> None:
-        # Locating Group in file
-        try:
-            # Accessing group in file
-            group = self.hdf5File[groupName]
-            # Adding dataset to group
-            maxDataSize = (None, 341)
-
-            group.create_dataset(channelName, shape = (0, 341), maxshape = maxDataSize)
-
-            # Adding metadata if available
-            if metaData is not None:
-                # Adding metadata
-                for key, value in metaData.items():
-                    group[channelName].attrs[key] = value
-
-            # Adding to channel number
-            self.numChannels += 1
-
-        except Exception as e:
-            print(e)
-            print("Unable to format XSensor Channel")
-
-    def openFile(self, fileName):
-        # Opens file if not already open
-        print("Opening hdf5 file.")
-        if self.hdf5File == None:
-            self.createFile(fileName)
-
-    def addStartTime(self, startTime):
-        # Adding start time as an attribute
-        self.hdf5File.attrs['startTime'] = startTime
-
-    def addStopTime(self, stopTime):
-        # Adding stop time as an attribute
-        self.hdf5File.attrs['stopTime'] = stopTime
-
-    def addTransitionTime(self, terrain, transitionTime):
-        # Adding Transition Time to List in h5pyFile
-        if 'terrainTransition' in self.hdf5File.attrs.keys():
-            # Loading Current List
-            currentTerrainList = self.hdf5File.attrs['terrainTransition']
-            currentTransitionList = self.hdf5File.attrs['terrainTransitionTime']
-
-            # Appending Transition to List
-            currentTerrainList = np.append(currentTerrainList, terrain)
-            currentTransitionList = np.append(currentTransitionList, transitionTime)
-
-            # Saving Attribute
-            self.hdf5File.attrs['terrainTransition'] = currentTerrainList
-            self.hdf5File.attrs['terrainTransitionTime'] = currentTransitionList
-
-        else:
-            # Creating Attribute
-            self.hdf5File.attrs['terrainTransition'] = [terrain]
-            self.hdf5File.attrs['terrainTransitionTime'] = [transitionTime]
-
-    def closeFile(self):
-        # Checking to see if file exists
-        print("Closing hdf5 file.")
-        if self.hdf5File is not None:
-            # Closing file
-            self.hdf5File.close()
-            self.hdf5File = None
-
-    def saveDelsysData(self, data):
-        # Checking data length
-        if (len(data) != 0):
-            # Indexing param
-            index = 0
-            
-            # Looping through sensors
-            for sensor in list(self.DelsysFileStructure.keys()):
-                if ("Sensor" in sensor):
-                    for channel in self.DelsysFileStructure[sensor]['Channels']:
-                        try:                  
-                            # Adding data to sensor channel
-                            dataset = self.hdf5File[f'{sensor}/{channel}']
-                            
-                            # Getting current size and reindexing
-                            currentLength = dataset.shape[0]
-                            dataset.resize(currentLength + len(data[0][index]), axis = 0)
-                            #dataset.resize(currentLength + len(data[index]), axis = 0)
-                            
-                            # Setting new data
-                            dataset[currentLength:currentLength + len(data[0][index])] = list(data[0][index])
-                            #dataset[currentLength:currentLength + len(data[index])] = list(data[index])
-
-                        except Exception as e:
-                            print(e)
-                            print(f"Unable to add data to {sensor} : {channel}")
-                    
-                        # Incrementing index
-                        index += 1
-
-    def saveXSensorData(self, data):
-        # Saving XSensor Data, since data structure is similar, but different
-        # Checking data length
-        if len(data) == 0:
-            pass
-        else:
-            # Looping through sensors
-            for sensorIndex, sensor in enumerate(list(self.XSensorFileStructure.keys())):
-                # Looping through Sensor Channels
-                for channel in self.XSensorFileStructure[sensor]['Channels']:
-                    try:
-                        dataset = self.hdf5File[f'{sensor}/{channel}']
-                        # Getting current data from xsensor, saving full array for now
-                        currentLength = dataset.shape[0]
-                        dataset.resize(currentLength + len(data[sensorIndex]), axis = 0)
-
-                        # Setting new data
-                        dataset[currentLength:currentLength + len(data[sensorIndex])] = data[sensorIndex]
-
-                    except Exception as e:
-                        print(e)
-                        print(f"Unable to add data to {sensor} : {channel}")
-
-    def update(self, delsysData = None, XSensorData = None):
-        # Updating information in file
-        if delsysData:
-            self.saveDelsysData(delsysData)
-        if XSensorData:
-            self.saveXSensorData(XSensorData)
-
-    def plotTrialDataThread(self):
-        plotThread = threading.Thread(target = self.plotTrialData)
-        plotThread.start()
-
-        self.plotTrialData()
-
-    def plotDelsysTrialData(self):
-        # Visualization for Trial Data
-        # Looping Through Delsys Sensors
-        for sensor in list(self.DelsysFileStructure.keys()):
-            # Checking if Sensor in Name
-            if ("Sensor" in sensor):
-                # Creating Subplot for Data
-                channelLength = len(self.DelsysFileStructure[sensor]['Channels'])
-                fig, ax = plt.subplots(channelLength, figsize=(channelLength * 2.5, 10))
-
-                # Iterating Through All Channels
-                for index, channel in enumerate(self.DelsysFileStructure[sensor]['Channels']):
-                    try:                  
-                        # Getting Data From Sensor/Channel
-                        dataset = self.hdf5File[f'{sensor}/{channel}'][()]
-
-                        # Plotting on Axes With Appropriate Labelings
-                        ax[index].plot(dataset, label = channel)
-                        ax[index].legend(loc = 'upper right')
-                        plt.suptitle(f"{sensor} - {self.trialName}")
-                        plt.show(block = False)
-                    except:
-                        pass
-
-    def plotXSensorTrialData(self):
-        # Dynamically Creating Subplots for XSensor Data
-        fig, ax = plt.subplots(1, len(self.XSensorFileStructure.keys()), figsize = (4 * len(self.XSensorFileStructure.keys()), 7))
-
-        # Iterating Through Sensors
-        for foot in list(self.XSensorFileStructure.keys()):
-            # Creating List to Hold Samples
-            datasetList = []
-
-            # Iterating Through Channels
-            for index, channel in enumerate(self.XSensorFileStructure[foot]['Channels']):
-                try:
-                    # Getting Data From Sensor/Channel
-                    dataset = self.hdf5File[f'{foot}/{channel}'][()]
-
-                    # Appending to Dataset List
-                    datasetList.append(dataset)
-
-                    # Adding Title to Subplot
-                    ax[index].title.set_text(f"{self.hdf5File[f'{foot}/Foot']}")
-
-                except:
-                    pass
-
-        # Iterating Through Data
-        for sampleIndex in enumerate(datasetList[0]):
-            # Iterating Through Axes
-            for index, ax in enumerate(ax):
-                # Reshapping Data
-                reshapedData = datasetList[index][sampleIndex].reshape(31, 11)
-            
-                # Updating Plot
-                ax.clear()
-                ax.imshow(reshapedData, cmap = 'hot', interpolation = 'nearest')
-            
-            # Displaying Figure
-            display(fig)
-            clear_output(wait = True)
-            plt.pause(0.001)
-
-        # Showing Plot
-        plt.show()
-
-    def saveDelsysMVC(self, MVCData):
-        # Saving Data As NP File
-        if not os.path.exists(f"{self.filePath}/MVC.npy"):
-            np.save(f"{self.filePath}/MVC.npy", MVCData, allow_pickle = True)
-
-    def saveParticipantWeight(self, participantWeight):
-        # Saving Into File
-        self.hdf5File.attrs['participantWeight'] = participantWeight
-
-    #-----------------------------------------------------------------------------------
-    # ---- Archived
-
-    def addMetaData(self, dictMetaData: dict) -> None:
-        """
-        This function adds metadata to the overall h5py data file. Useful if you want to add general information
-        regarding general data for the file eg: experiment information, etc.
-        Input:
-            dictMetaData: metaData in dictionary formay.
-
-        Example:
-            dictMetaData =  {
-                                'Sampling_rate': '100 Hz',
-                                'Description': 'Electromyography data'
-                            }
-        """
-        # Checking if hdf5 file exists
-        if self.hdf5File is not None:
-            # Appending metaData
-            for key, value in dictMetaData.items():
-                self.hdf5File.attrs[key] = value
-
-    def addChannelMetaData(self, channelName: list, dictMetaData: dict) -> None:
-        """
-        This function adds metadata to the channels in h5py data file. Useful if you want to add information
-        for a specific channel, eg: which sensor, etc
-        Input:
-            dictMetaData: metaData in dictionary formay.
-
-        Example:
-            dictMetaData =  {
-                                'Sampling_rate': '100 Hz',
-                                'Description': 'Electromyography data'
-                            }
-        """
-        if channelName in self.hdf5File:
-            # Grabbing dataset
-            dataset = self.hdf5File[channelName]
-            
-            # Adding metadata
-            for key, value in dictMetaData.items():
-                dataset.attrs[key] = value
-
-'''
-#-----------------------------------------------------------------------------------
-# ---- Queue Class
-
-def clearQueue(queue):
-        """
-        Clears all items from the queue.
-        """
-        while not queue.empty():
-            try:
-                queue.get()
-            except queue.Empty:
-                break
-
-#-----------------------------------------------------------------------------------
-# ---- Threading Module For Commands and Saving
-
-# Setting Up DataFileHandler
-dataHandler = DataFileHandler()
-
-# Setting up Command Queue
-commandQueue = queue.Queue()
-
-# Stopping Event
-stopEvent = threading.Event()
- 
-# Command Mapp
-commandMap = {
-    'setFilePath' : dataHandler.setFilePath,
-    'createFile' : dataHandler.createFile,
-    'formatFile' : dataHandler.formatFile,
-    'addStartTime' : dataHandler.addStartTime,
-    'addStopTime' : dataHandler.addStopTime,
-    'saveDelsysData' : dataHandler.saveDelsysData,
-    'saveXSensorData' : dataHandler.saveXSensorData,
-    'saveDelsysMVC' : dataHandler.saveDelsysMVC,
-    'addTransitionTime' : dataHandler.addTransitionTime,
-    'plotTrialData' : dataHandler.plotTrialDataThread,
-    'closeFile' : dataHandler.closeFile,
-    'cleanUp' : dataHandler.closeFile,
-    #'stop' : stopEvent.set
-}
-
-# Resolving Command Stream
-print("Looking for RLCommandStream...")
-
-try:
-    # Creating a New Inlet to Read from the Stream
-    streams = resolve_stream('type', 'command')
-
-    # If No Stream
-    if len(streams) == 0:
-        print("Stream not found")
-
-    # If Stream Found
-    else:
-        # Creating Inlet
-        inlet = StreamInlet(streams[0])
-
-except Exception as e:
-    print(f"Error resolving command stream: {e}")
-
-# Listener Function for Commands
-def listener():
-    # Infinite Loop for Listening
-    while True:
-        try:
-            # Getting New Command From Command Stream
-            command, timestamps = inlet.pull_sample()
-
-            # If Command is Available
-            if command:
-                # Adding Command to Queue
-                print(json.loads(command[0]))
-                print("\n")
-                commandQueue.put(json.loads(command[0]))
-
-        # Decoding Error
-        except json.JSONDecodeError as e:
-            print(f"Error decoding sample: {e}")
-
-# Queue Processor Function
-def processQueue():
-    # Infinite Loop for Processing
-    while True:
-        # Getting Command from Command Queue
-        command = commandQueue.get()
-
-        # Setting Default Function Name
-        functionName = 'Start Command Processing'
-
-        # If There Are Commands in Queue
-        if command is not None:
-            try:
-                # Getting Command, Params
-                functionName = command['function']
-                params = command.get('params', {})
-
-                if functionName == 'stop':
-                    stopEvent.set()
-                    inlet.close_stream()
-
-                # Executing Commands
-                commandMap[functionName](**params)
-
-                # Clearing Queue If Command is Close File
-                if functionName == 'closeFile':
-                    clearQueue(commandQueue)
-
-            except:
-                print(f"Error executing command: {functionName}")         
-
-#----------- Main Function --------------------------
-
-if __name__ == '__main__':
-    pass
-    # Creating and Running Listener Thread
-    listenerThread = threading.Thread(target = listener, daemon = True)
-    listenerThread.start()
-
-    # Creating and Running Processor Thread
-    processerThread = threading.Thread(target = processQueue, daemon = True)
-    processerThread.start()
-
-    # Keeping Main Thread Alive
-    while True:
-        try:
-            pass
-
-        except LostError:
-            # Closing Inlet
-            inlet.close_stream()
-
-            # Joining Listener Threads
-            listenerThread.join()
-            processerThread.join()
-
-            break
-
-        except KeyboardInterrupt:
-            # Closing Inlet
-            inlet.close_stream()
-
-            # Joining Listener Threads
-            listenerThread.join()
-            processerThread.join()
-
-            break
-
-    print("Exiting DataFileHandler...")
+import numpy as np
+import h5py
+import os
+from datetime import datetime, date
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from IPython.display import display, clear_output
+import tkinter as tk
+import json
+import threading
+import queue
+import time
+from pylsl import StreamInlet, resolve_stream, LostError
+
+# HDF5 Storage Profiles, Applied Per Sensor Group
+# compression : None, 'lzf' or 'gzip' ; compressionLevel : gzip level 0 - 9 ; shuffle : byte shuffle filter
+# dtype : stored sample type ; chunkSeconds (Delsys) / chunkFrames (XSensor) : chunk length
+storageProfiles = {
+    'raw' : {'Delsys' : {'compression' : None, 'compressionLevel' : None, 'shuffle' : False, 'dtype' : 'float32', 'chunkSeconds' : 2.0},
+             'XSensor' : {'compression' : None, 'compressionLevel' : None, 'shuffle' : False, 'dtype' : 'float32', 'chunkFrames' : 128}},
+    'lzf' : {'Delsys' : {'compression' : 'lzf', 'compressionLevel' : None, 'shuffle' : True, 'dtype' : 'float32', 'chunkSeconds' : 2.0},
+             'XSensor' : {'compression' : 'lzf', 'compressionLevel' : None, 'shuffle' : True, 'dtype' : 'float32', 'chunkFrames' : 128}},
+    'gzip' : {'Delsys' : {'compression' : 'gzip', 'compressionLevel' : 4, 'shuffle' : True, 'dtype' : 'float32', 'chunkSeconds' : 2.0},
+              'XSensor' : {'compression' : 'gzip', 'compressionLevel' : 4, 'shuffle' : True, 'dtype' : 'float32', 'chunkFrames' : 128}},
+    'compact' : {'Delsys' : {'compression' : 'gzip', 'compressionLevel' : 4, 'shuffle' : True, 'dtype' : 'float32', 'chunkSeconds' : 4.0},
+                 'XSensor' : {'compression' : 'gzip', 'compressionLevel' : 4, 'shuffle' : True, 'dtype' : 'float16', 'chunkFrames' : 256}},
+}
+
+class DataFileHandler():
+    """
+    This is a Data File Handler Class that is used to save data live to files during experiments. Utilizes
+    numpy and h5py files formats to saving.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2024.06.10
+    """
+
+    def __init__(self, filePath = None):
+        # Initialiting filePath
+        self.filePath = filePath
+
+        # Initiating num channels
+        self.numChannels = 0
+
+        # Initializing File Saving Structures
+        self.DelsysFileStructure = None
+        self.XSensorFileStructure = None        
+        self.NormalizedFileStructure = None
+        self.normalizedGroup = 'Normalized EMG'
+
+        # Write-Combining Buffers, Keyed by Dataset Path
+        self.writeBuffers = {}
+        self.minChunkSize = 1024
+
+        # Storage Profile Used When Creating Datasets
+        self.storageProfile = self.resolveStorageProfile('raw')
+
+        # Single-Writer Multi-Reader Recording, Readers Can Open the File While Recording
+        self.hdf5File = None
+        self.swmrMode = False
+        self.swmrFlushInterval = 1.0 # Seconds Between Flushes Visible to Readers
+        self.swmrFlushPartial = False # Writing Partial Chunks on Each Flush, Lower Reader Latency but Chunks Rewritten
+        self.swmrChunkSeconds = 0.25 # Shorter Chunks While SWMR is Enabled, So Full Chunks Reach Readers Quickly
+        self.swmrChunkFrames = 32
+        self.lastFlushTime = 0
+
+        # Attributes Written While SWMR is Active, Applied on Close
+        self.deferredAttributes = {}
+        self.deferredAttributeTimeout = 10.0 # Seconds to Wait for Live Readers to Close
+
+    #-----------------------------------------------------------------------------------
+    # ---- File Handler Functions
+
+    def setFilePath(self, filePath):
+        # Setting File Path
+        self.filePath = filePath
+
+    def createFile(self, fileName):
+        if self.filePath is not None:
+            # Checking filePath 
+            if not os.path.exists(self.filePath):
+                # Creating folder if doesn't exists
+                os.makedirs(self.filePath)
+
+            # Formatting FileName
+            self.trialName = fileName
+            self.fileName = f"{fileName}.h5"
+
+            # Complete path
+            completePath = os.path.join(self.filePath, self.fileName)
+
+            # Creating h5py file with fileName
+            self.hdf5File = self.openHDF5File(completePath)
+
+            # Adding some metadata variables
+            self.hdf5File.attrs['Created Date'] = str(date.today())
+            self.hdf5File.attrs['Created Time'] = str(datetime.now().strftime("%H:%M:%S"))
+        else:
+            # Formatting FileName
+            self.fileName = f"{fileName}.h5"
+
+            # Creating h5py file with fileName
+            self.hdf5File = self.openHDF5File(self.fileName)
+
+            # Adding some metadata variables
+            self.hdf5File.attrs['Created Date'] = str(date.today())
+            self.hdf5File.attrs['Created Time'] = str(datetime.now().strftime("%H:%M:%S"))
+
+    def openHDF5File(self, completePath):
+        # SWMR Needs the Latest File Format
+        if self.swmrMode:
+            return h5py.File(completePath, 'a', libver = 'latest')
+
+        return h5py.File(completePath, 'a')
+
+    # Incoming Sensor File Format
+    # Key : 'Sensor Name' -> Values: 'Channel Names' : List of Names ; 'Sample Rates' : List of Sample Rates 
+    # storageProfile : name in storageProfiles, or dict with 'Delsys' and/or 'XSensor' settings
+    # sensorDictNormalized : Key : 'Sensor Name' -> Values: 'SampleRate' ; 'MVC', from DelsysEMG.normalizedSavingDict
+    def formatFile(self, sensorDictDelsys: dict = None, sensorDictXSensor: dict = None, storageProfile = 'raw', sensorDictNormalized: dict = None) -> None:
+        # Setting Storage Profile for New Datasets
+        self.storageProfile = self.resolveStorageProfile(storageProfile)
+        self.hdf5File.attrs['StorageProfile'] = json.dumps(self.storageProfile)
+
+        # Marking Short SWMR Chunks, compactFile Rewrites Them Even With the Same Profile
+        if self.swmrMode:
+            self.hdf5File.attrs['SWMRChunkSeconds'] = self.swmrChunkSeconds
+
+        # Adding additional metadata
+        if sensorDictDelsys and sensorDictXSensor:
+            self.hdf5File.attrs['Sensors'] = list(sensorDictDelsys.keys()) + list(sensorDictXSensor.keys())
+
+            # Formatting File for Delsys and XSensor Data
+            self.formatDelsysInfo(sensorDictDelsys)
+            self.formatXsensorInfo(sensorDictXSensor)
+
+        elif sensorDictDelsys:
+            self.hdf5File.attrs['Sensors'] = list(sensorDictDelsys.keys())
+
+            # Formatting File for Delsys
+            self.formatDelsysInfo(sensorDictDelsys)
+
+        elif sensorDictXSensor:
+            self.hdf5File.attrs['Sensors'] = list(sensorDictXSensor.keys())
+
+            # Formatting File for XSensor Data
+            self.formatXsensorInfo(sensorDictXSensor)
+
+        else:
+            print("No Formatting Data Provided")
+
+        # Formatting MVC Normalized EMG
+        if sensorDictNormalized:
+            self.formatNormalizedInfo(sensorDictNormalized)
+
+    def resolveStorageProfile(self, storageProfile = 'raw') -> dict:
+        """
+        Returns complete per sensor group storage settings. Named profiles are looked up in storageProfiles,
+        and dict profiles only need the settings that differ from 'raw'.
+        """
+        # Starting From Uncompressed Defaults
+        resolvedProfile = {group: dict(settings) for group, settings in storageProfiles['raw'].items()}
+
+        # Looking Up Named Profile
+        if isinstance(storageProfile, str):
+            storageProfile = storageProfiles[storageProfile]
+
+        # Overriding Group Settings
+        for group, settings in storageProfile.items():
+            resolvedProfile[group].update(settings)
+
+        return resolvedProfile
+
+    def datasetOptions(self, sensorGroup: str, chunkShape: tuple) -> dict:
+        """
+        Returns h5py create_dataset keyword arguments for sensorGroup ('Delsys' or 'XSensor').
+        """
+        settings = self.storageProfile[sensorGroup]
+
+        options = {'dtype' : settings['dtype'], 'chunks' : chunkShape}
+
+        # Adding Filter Pipeline
+        if settings['compression'] is not None:
+            options['compression'] = settings['compression']
+            if settings['compressionLevel'] is not None:
+                options['compression_opts'] = settings['compressionLevel']
+        if settings['shuffle']:
+            options['shuffle'] = True
+
+        return options
+
+    # Formatting File for Delsys
+    def formatDelsysInfo(self, sensorDictDelsys: dict) -> None:
+        # Formatting file for the Delsys data structure
+        for group, datasets in sensorDictDelsys.items():
+            # Setting internal attributes
+            self.DelsysFileStructure = sensorDictDelsys
+
+            # Creating groups then datasets for each connected sensor
+            try:
+                self.createGroup(group, metaData = {'Attachment' : datasets['Attachment']})
+                
+                # Checking channel and samplerate attributes are of the same length
+                if len(datasets['Channels']) != len(datasets['SampleRates']):
+                    print('Channels and SampleRates are not the same length')
+                    pass
+
+                # Creating Element if Needing to Add Additional Channels
+                self.extra = 1
+
+                # Creating datasets for each channel, 
+                for i in range(len(datasets['Channels'])):
+                    print(datasets['Channels'][i])
+                    # Creating channels and adding sample rates for EMG GYROX, GYROY, GYROZ
+                    self.createChannel(group, datasets['Channels'][i], {'SampleRate' : datasets['SampleRates'][i]})
+
+            except Exception as e:
+                print("Error in making group or datasets for Delsys.")
+                print(e)
+
+    # Formatting File for MVC Normalized EMG
+    def formatNormalizedInfo(self, sensorDictNormalized: dict) -> None:
+        # One dataset per sensor under the normalized group, in normalized stream column order
+        self.NormalizedFileStructure = sensorDictNormalized
+
+        try:
+            self.createGroup(self.normalizedGroup, metaData = {'Units' : 'fraction of MVC'})
+
+            for sensor, datasets in sensorDictNormalized.items():
+                self.createChannel(self.normalizedGroup, sensor, {'SampleRate' : datasets['SampleRate'], 'MVC' : datasets['MVC']})
+
+        except Exception as e:
+            print("Error in making group or datasets for normalized EMG.")
+            print(e)
+
+    # Formatting File for XSensor
+    def formatXsensorInfo(self, sensorDictXSensor: dict) -> None:
+        # Formatting file for the XSensor data structure
+        for group, datasets in sensorDictXSensor.items():
+            # Setting internal attributes
+            self.XSensorFileStructure = sensorDictXSensor
+
+            # Creating groups then datasets for each connected sensor
+            try:
+                self.createGroup(group, metaData = {'Foot' : datasets['Foot'], 'SensorSize' : datasets['SensorSize']})
+
+                # Checking channel and samplerate attributes are of the same length
+                if len(datasets['Channels']) != len(datasets['SampleRates']):
+                    print('Channels and SampleRates are not the same length')
+                    pass
+
+                # Creating datasets for each channel
+                for i in range(len(datasets['Channels'])):
+                    print(datasets['Channels'][i])
+                    self.createXSensorChannel(group, datasets['Channels'][i], {'SampleRate' : datasets['SampleRates'][i]})
+
+                # Creating per frame timestamps parallel to the channels
+                self.createXSensorTimestamps(group)
+
+            except Exception as e:
+                print("Error in making group or datasets for XSensor.")
+                print(e)
+    
+    """
+    First step when creating the hdf5 file is to create a group which will have datasets stored under them
+    """
+    def createGroup(self, groupName: str, metaData: dict = None) -> None:
+        try:
+            # Creating group in file
+            group = self.hdf5File.create_group(groupName)
+
+            # Adding metadata to group
+            if metaData is not None:
+                for key, value in metaData.items():
+                    group.attrs[key] = value
+
+        except Exception as e:
+            print(e)
+            print("Group already exists")
+
+    """
+    Second step is to create data sets and put them under the right group
+    """
+    def createChannel(self, groupName: str, channelName: str, metaData: dict = None) -> None:
+        # Locating Group in file
+        try:
+            # Accessing group in file
+            group = self.hdf5File[groupName]
+            # Adding dataset to group
+            maxDataSize = (None,)
+            chunkShape = (self.chunkSize(metaData),)
+
+            group.create_dataset(channelName, shape = (0,), maxshape = maxDataSize, **self.datasetOptions('Delsys', chunkShape))
+
+            # Adding metadata if available
+            if metaData is not None:
+                # Adding metadata
+                for key, value in metaData.items():
+                    group[channelName].attrs[key] = value
+
+            # Adding to channel number
+            self.numChannels += 1
+
+        except:
+            # Accessing group in file
+            group = self.hdf5File[groupName]
+            # Adding dataset to group
+            maxDataSize = (None,)
+            chunkShape = (self.chunkSize(metaData),)
+
+            # Creating Temp Channel Name
+            tempChanName = f"{channelName}_{self.extra}"
+            group.create_dataset(tempChanName, shape = (0,), maxshape = maxDataSize, **self.datasetOptions('Delsys', chunkShape))
+
+            # Incrementing Extra Index
+            self.extra += 1
+
+            # Adding metadata if available
+            if metaData is not None:
+                # Adding metadata
+                for key, value in metaData.items():
+                    group[channelName].attrs[key] = value
+
+            # Adding to channel number
+            self.numChannels += 1
+
+    def chunkSize(self, metaData: dict = None) -> int:
+        """
+        Chooses the chunk length for a channel from its SampleRate attribute, about chunkSeconds of the
+        Delsys storage profile rounded up to a power of two. With swmrMode, about swmrChunkSeconds instead,
+        so live readers see samples sooner at some cost in compression.
+        """
+        # Default Chunk Without Sample Rate
+        if metaData is None or 'SampleRate' not in metaData:
+            return self.minChunkSize
+
+        # Samples in Chunk Window, Rounded Up to Power of Two
+        if self.swmrMode:
+            numSamples = max(float(metaData['SampleRate']) * self.swmrChunkSeconds, 64)
+        else:
+            numSamples = max(float(metaData['SampleRate']) * self.storageProfile['Delsys']['chunkSeconds'], self.minChunkSize)
+
+        return int(2 ** np.ceil(np.log2(numSamples)))
+
+    def xSensorChunkFrames(self) -> int:
+        # XSensor Chunk Length, Capped at swmrChunkFrames While SWMR is Enabled
+        chunkFrames = self.storageProfile['XSensor']['chunkFrames']
+
+        return min(chunkFrames, self.swmrChunkFrames) if self.swmrMode else chunkFrames
+
+    """
+    Creating XSensor Channel
+    """
+    def createXSensorChannel(self, groupName: str, channelName: str, metaData: dict = None) -> None:
+        # Locating Group in file
+        try:
+            # Accessing group in file
+            group = self.hdf5File[groupName]
+            # Adding dataset to group
+            maxDataSize = (None, 341)
+            chunkShape = (self.xSensorChunkFrames(), 341)
+
+            group.create_dataset(channelName, shape = (0, 341), maxshape = maxDataSize, **self.datasetOptions('XSensor', chunkShape))
+
+            # Adding metadata if available
+            if metaData is not None:
+                # Adding metadata
+                for key, value in metaData.items():
+                    group[channelName].attrs[key] = value
+
+            # Adding to channel number
+            self.numChannels += 1
+
+        except Exception as e:
+            print(e)
+            print("Unable to format XSensor Channel")
+
+    def createXSensorTimestamps(self, groupName: str) -> None:
+        """
+        Creates the int64 'Timestamps' dataset of an XSensor group, one UTC microsecond timestamp per frame
+        parallel to the pressure frames. Uses the XSensor compression settings but always stores int64.
+        """
+        try:
+            # Accessing group in file
+            group = self.hdf5File[groupName]
+            chunkShape = (self.xSensorChunkFrames(),)
+
+            # Keeping Timestamps Exact Regardless of Profile dtype
+            options = self.datasetOptions('XSensor', chunkShape)
+            options['dtype'] = np.int64
+
+            group.create_dataset('Timestamps', shape = (0,), maxshape = (None,), **options)
+            group['Timestamps'].attrs['Units'] = 'UTC microseconds since Unix epoch'
+            group['Timestamps'].attrs['Missing'] = -1 # Frames Without a Valid Sample Time
+
+        except Exception as e:
+            print(e)
+            print("Unable to format XSensor Timestamps")
+
+    def openFile(self, fileName):
+        # Opens file if not already open
+        print("Opening hdf5 file.")
+        if self.hdf5File == None:
+            self.createFile(fileName)
+
+    def addStartTime(self, startTime):
+        # Adding start time as an attribute
+        self.setAttribute('startTime', startTime)
+
+        # Opening File to Live Readers Once Structure is Written
+        if self.swmrMode:
+            self.startSWMR()
+
+    def addStopTime(self, stopTime):
+        # Adding stop time as an attribute
+        self.setAttribute('stopTime', stopTime)
+
+    def addTransitionTime(self, terrain, transitionTime):
+        # Adding Transition Time to List in h5pyFile
+        currentTerrainList = self.getAttribute('terrainTransition')
+        currentTransitionList = self.getAttribute('terrainTransitionTime')
+
+        if currentTerrainList is not None:
+            # Appending Transition to List
+            currentTerrainList = np.append(currentTerrainList, terrain)
+            currentTransitionList = np.append(currentTransitionList, transitionTime)
+
+            # Saving Attribute
+            self.setAttribute('terrainTransition', currentTerrainList)
+            self.setAttribute('terrainTransitionTime', currentTransitionList)
+
+        else:
+            # Creating Attribute
+            self.setAttribute('terrainTransition', [terrain])
+            self.setAttribute('terrainTransitionTime', [transitionTime])
+
+    def setAttribute(self, key, value):
+        # File Attributes Can't Change While SWMR is Active, Keeping Until Close
+        if self.hdf5File.swmr_mode:
+            self.deferredAttributes[key] = value
+
+        else:
+            self.hdf5File.attrs[key] = value
+
+    def getAttribute(self, key):
+        # Checking Deferred Attributes First
+        if key in self.deferredAttributes:
+            return self.deferredAttributes[key]
+
+        if key in self.hdf5File.attrs.keys():
+            return self.hdf5File.attrs[key]
+
+        return None
+
+    def startSWMR(self):
+        """
+        Switches the open file to single-writer multi-reader mode. No groups, datasets or attributes can be
+        added afterwards, so this is called once the file is formatted and the start time is written.
+        """
+        try:
+            if not self.hdf5File.swmr_mode:
+                self.hdf5File.swmr_mode = True
+                self.lastFlushTime = time.perf_counter()
+
+        except Exception as e:
+            print(e)
+            print("Unable to start SWMR mode, file must be created with swmrMode enabled")
+
+    def periodicFlush(self):
+        """
+        While SWMR is active, flushes the file every swmrFlushInterval seconds. By default only full chunks
+        have been written, so every chunk is written and compressed once. SWMR files use short chunks
+        (swmrChunkSeconds, swmrChunkFrames), so readers lag by at most one chunk (about 0.5 s for EMG,
+        0.3 s for XSensor at 100 Hz) plus swmrFlushInterval. With swmrFlushPartial, pending samples are
+        written too, so readers lag by at most swmrFlushInterval, but the last chunk of every dataset is
+        rewritten and recompressed on each flush. compactFile rewrites the file with full-length chunks.
+        """
+        if self.hdf5File.swmr_mode and time.perf_counter() - self.lastFlushTime >= self.swmrFlushInterval:
+            # Partial Chunks Only When Reader Latency Matters More Than Write Cost
+            if self.swmrFlushPartial:
+                self.flushBuffers()
+
+            self.hdf5File.flush()
+            self.lastFlushTime = time.perf_counter()
+
+    def closeFile(self):
+        # Checking to see if file exists
+        print("Closing hdf5 file.")
+        if self.hdf5File is not None:
+            # Writing Pending Samples
+            self.flushBuffers()
+            self.writeBuffers = {}
+
+            # Closing file
+            completePath = self.hdf5File.filename
+            self.hdf5File.close()
+            self.hdf5File = None
+
+            # Writing Attributes Deferred During SWMR
+            if self.deferredAttributes:
+                self.writeDeferredAttributes(completePath)
+
+    def writeDeferredAttributes(self, completePath):
+        """
+        Reopens the closed file and writes attributes set while SWMR was active. The file is locked while
+        live readers have it open, so this retries for up to deferredAttributeTimeout seconds.
+        """
+        startTime = time.perf_counter()
+
+        while True:
+            try:
+                with h5py.File(completePath, 'a') as hdf5File:
+                    for key, value in self.deferredAttributes.items():
+                        # Storing Unicode Arrays as Variable Length Strings
+                        if isinstance(value, np.ndarray) and value.dtype.kind == 'U':
+                            value = value.astype(object)
+
+                        hdf5File.attrs[key] = value
+
+                break
+
+            except Exception as e:
+                # Giving Up After Timeout
+                if time.perf_counter() - startTime >= self.deferredAttributeTimeout:
+                    print(e)
+                    print(f"Unable to write deferred attributes, close live readers of the file: {list(self.deferredAttributes.keys())}")
+                    break
+
+                time.sleep(0.5)
+
+        self.deferredAttributes = {}
+
+    def getWriteBuffer(self, datasetPath):
+        # Creating Write-Combining Buffer on First Use
+        if datasetPath not in self.writeBuffers:
+            self.writeBuffers[datasetPath] = ChannelWriteBuffer(self.hdf5File[datasetPath])
+
+        return self.writeBuffers[datasetPath]
+
+    def flushBuffers(self):
+        """
+        Writes all samples still pending in the write-combining buffers to the file.
+        """
+        for datasetPath, writeBuffer in self.writeBuffers.items():
+            try:
+                writeBuffer.flush()
+
+            except Exception as e:
+                print(e)
+                print(f"Unable to flush data to {datasetPath}")
+
+    def saveDelsysData(self, data):
+        # Data is a channels-first list of arrays in collection output order
+        # Checking data length
+        if (len(data) != 0):
+            # Indexing param
+            index = 0
+            
+            # Looping through sensors
+            for sensor in list(self.DelsysFileStructure.keys()):
+                if ("Sensor" in sensor):
+                    for channel in self.DelsysFileStructure[sensor]['Channels']:
+                        try:                  
+                            # Accumulating data for sensor channel, written in whole chunks
+                            self.getWriteBuffer(f'{sensor}/{channel}').append(data[index])
+
+                        except Exception as e:
+                            print(e)
+                            print(f"Unable to add data to {sensor} : {channel}")
+                    
+                        # Incrementing index
+                        index += 1
+
+            # Making New Samples Visible to Live Readers
+            self.periodicFlush()
+
+    def saveNormalizedEMG(self, data):
+        # Data is a channels-first list of MVC normalized EMG arrays in normalized stream column order
+        if len(data) != 0:
+            for index, sensor in enumerate(self.NormalizedFileStructure.keys()):
+                try:
+                    # Accumulating data for sensor, written in whole chunks
+                    self.getWriteBuffer(f'{self.normalizedGroup}/{sensor}').append(data[index])
+
+                except Exception as e:
+                    print(e)
+                    print(f"Unable to add normalized data to {sensor}")
+
+            # Making New Samples Visible to Live Readers
+            self.periodicFlush()
+
+    def saveXSensorData(self, data, timestamps = None):
+        # Saving XSensor Data, since data structure is similar, but different
+        # Data is a per sensor list of (numFrames, 341) frames, timestamps is (numFrames,) UTC microseconds
+        # Checking data length
+        if len(data) == 0:
+            pass
+        else:
+            # Looping through sensors
+            for sensorIndex, sensor in enumerate(list(self.XSensorFileStructure.keys())):
+                # Looping through Sensor Channels
+                for channel in self.XSensorFileStructure[sensor]['Channels']:
+                    try:
+                        # Accumulating frames for sensor, written in whole chunks
+                        if len(data[sensorIndex]) != 0:
+                            self.getWriteBuffer(f'{sensor}/{channel}').append(data[sensorIndex])
+
+                    except Exception as e:
+                        print(e)
+                        print(f"Unable to add data to {sensor} : {channel}")
+
+                try:
+                    # Accumulating timestamps through the same write path as the frames
+                    if timestamps is not None and len(timestamps) != 0:
+                        self.getWriteBuffer(f'{sensor}/Timestamps').append(timestamps)
+
+                except Exception as e:
+                    print(e)
+                    print(f"Unable to add timestamps to {sensor}")
+
+            # Making New Samples Visible to Live Readers
+            self.periodicFlush()
+
+    def update(self, delsysData = None, XSensorData = None):
+        # Updating information in file
+        if delsysData:
+            self.saveDelsysData(delsysData)
+        if XSensorData:
+            self.saveXSensorData(XSensorData)
+
+    def plotTrialDataThread(self):
+        plotThread = threading.Thread(target = self.plotTrialData)
+        plotThread.start()
+
+        self.plotTrialData()
+
+    def plotDelsysTrialData(self):
+        # Visualization for Trial Data
+        # Pending samples must be flushed first (flushBuffers or closeFile)
+        # Looping Through Delsys Sensors
+        for sensor in list(self.DelsysFileStructure.keys()):
+            # Checking if Sensor in Name
+            if ("Sensor" in sensor):
+                # Creating Subplot for Data
+                channelLength = len(self.DelsysFileStructure[sensor]['Channels'])
+                fig, ax = plt.subplots(channelLength, figsize=(channelLength * 2.5, 10))
+
+                # Iterating Through All Channels
+                for index, channel in enumerate(self.DelsysFileStructure[sensor]['Channels']):
+                    try:                  
+                        # Getting Data From Sensor/Channel
+                        dataset = self.hdf5File[f'{sensor}/{channel}'][()]
+
+                        # Plotting on Axes With Appropriate Labelings
+                        ax[index].plot(dataset, label = channel)
+                        ax[index].legend(loc = 'upper right')
+                        plt.suptitle(f"{sensor} - {self.trialName}")
+                        plt.show(block = False)
+                    except:
+                        pass
+
+    def plotXSensorTrialData(self):
+        # Dynamically Creating Subplots for XSensor Data
+        fig, ax = plt.subplots(1, len(self.XSensorFileStructure.keys()), figsize = (4 * len(self.XSensorFileStructure.keys()), 7))
+
+        # Iterating Through Sensors
+        for foot in list(self.XSensorFileStructure.keys()):
+            # Creating List to Hold Samples
+            datasetList = []
+
+            # Iterating Through Channels
+            for index, channel in enumerate(self.XSensorFileStructure[foot]['Channels']):
+                try:
+                    # Getting Data From Sensor/Channel
+                    dataset = self.hdf5File[f'{foot}/{channel}'][()]
+
+                    # Appending to Dataset List
+                    datasetList.append(dataset)
+
+                    # Adding Title to Subplot
+                    ax[index].title.set_text(f"{self.hdf5File[f'{foot}/Foot']}")
+
+                except:
+                    pass
+
+        # Iterating Through Data
+        for sampleIndex in enumerate(datasetList[0]):
+            # Iterating Through Axes
+            for index, ax in enumerate(ax):
+                # Reshapping Data
+                reshapedData = datasetList[index][sampleIndex].reshape(31, 11)
+            
+                # Updating Plot
+                ax.clear()
+                ax.imshow(reshapedData, cmap = 'hot', interpolation = 'nearest')
+            
+            # Displaying Figure
+            display(fig)
+            clear_output(wait = True)
+            plt.pause(0.001)
+
+        # Showing Plot
+        plt.show()
+
+    def saveDelsysMVC(self, MVCData):
+        # Saving Data As NP File
+        if not os.path.exists(f"{self.filePath}/MVC.npy"):
+            np.save(f"{self.filePath}/MVC.npy", MVCData, allow_pickle = True)
+
+    def saveParticipantWeight(self, participantWeight):
+        # Saving Into File
+        self.setAttribute('participantWeight', participantWeight)
+
+    def compactFile(self, completePath, storageProfile = 'compact'):
+        """
+        Rewrites a closed trial file with another storage profile (e.g. a 'raw' recording as 'compact'),
+        keeping every group, dataset and attribute. The copy is written next to the file and replaces it only
+        once complete, so an interrupted compaction leaves the original untouched. Files already stored with
+        the profile are left as they are, unless they were recorded with short SWMR chunks. Returns the file
+        size before and after.
+        """
+        tempPath = f"{completePath}.compacting"
+        sizeBefore = os.path.getsize(completePath)
+        previousProfile = self.storageProfile
+        self.storageProfile = self.resolveStorageProfile(storageProfile)
+
+        try:
+            # Skipping File Already Stored With Profile
+            with h5py.File(completePath, 'r') as sourceFile:
+                if 'StorageProfile' in sourceFile.attrs and json.loads(sourceFile.attrs['StorageProfile']) == self.storageProfile \
+                   and 'SWMRChunkSeconds' not in sourceFile.attrs:
+                    return sizeBefore, sizeBefore
+
+            with h5py.File(completePath, 'r') as sourceFile, h5py.File(tempPath, 'w') as targetFile:
+                # File Attributes, Recording New Storage Profile With Full-Length Chunks
+                for key, value in sourceFile.attrs.items():
+                    if key != 'SWMRChunkSeconds':
+                        targetFile.attrs[key] = value
+                targetFile.attrs['StorageProfile'] = json.dumps(self.storageProfile)
+
+                # Groups and Datasets, Parents Visited Before Members
+                sourceFile.visititems(lambda name, item: self.copyCompacted(name, item, targetFile))
+
+            # Replacing Original Only With Complete Copy
+            os.replace(tempPath, completePath)
+
+        finally:
+            self.storageProfile = previousProfile
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+
+        return sizeBefore, os.path.getsize(completePath)
+
+    def copyCompacted(self, name, item, targetFile, blockChunks = 64):
+        """
+        Copies one group or dataset into targetFile. Pressure frames and timestamps use the XSensor settings,
+        other sample datasets the Delsys settings, and anything else is copied as is.
+        """
+        # Groups With Their Attributes
+        if isinstance(item, h5py.Group):
+            group = targetFile.require_group(name)
+            for key, value in item.attrs.items():
+                group.attrs[key] = value
+            return
+
+        # Choosing Settings Like createChannel, createXSensorChannel and createXSensorTimestamps
+        if item.ndim == 2:
+            options = self.datasetOptions('XSensor', (self.storageProfile['XSensor']['chunkFrames'], item.shape[1]))
+        elif item.ndim == 1 and item.dtype.kind in 'iu':
+            options = self.datasetOptions('XSensor', (self.storageProfile['XSensor']['chunkFrames'],))
+            options['dtype'] = item.dtype
+        elif item.ndim == 1 and item.dtype.kind == 'f':
+            options = self.datasetOptions('Delsys', (self.chunkSize(dict(item.attrs)),))
+        else:
+            item.file.copy(item, targetFile, name = name)
+            return
+
+        # Copying Samples in Blocks of Whole Chunks
+        dataset = targetFile.create_dataset(name, shape = item.shape, maxshape = (None,) + item.shape[1:], **options)
+        blockSize = options['chunks'][0] * blockChunks
+        for start in range(0, item.shape[0], blockSize):
+            dataset[start:start + blockSize] = item[start:start + blockSize]
+
+        for key, value in item.attrs.items():
+            dataset.attrs[key] = value
+
+    #-----------------------------------------------------------------------------------
+    # ---- Archived
+
+    def addMetaData(self, dictMetaData: dict) -> None:
+        """
+        This function adds metadata to the overall h5py data file. Useful if you want to add general information
+        regarding general data for the file eg: experiment information, etc.
+        Input:
+            dictMetaData: metaData in dictionary formay.
+
+        Example:
+            dictMetaData =  {
+                                'Sampling_rate': '100 Hz',
+                                'Description': 'Electromyography data'
+                            }
+        """
+        # Checking if hdf5 file exists
+        if self.hdf5File is not None:
+            # Appending metaData
+            for key, value in dictMetaData.items():
+                self.hdf5File.attrs[key] = value
+
+    def addChannelMetaData(self, channelName: list, dictMetaData: dict) -> None:
+        """
+        This function adds metadata to the channels in h5py data file. Useful if you want to add information
+        for a specific channel, eg: which sensor, etc
+        Input:
+            dictMetaData: metaData in dictionary formay.
+
+        Example:
+            dictMetaData =  {
+                                'Sampling_rate': '100 Hz',
+                                'Description': 'Electromyography data'
+                            }
+        """
+        if channelName in self.hdf5File:
+            # Grabbing dataset
+            dataset = self.hdf5File[channelName]
+            
+            # Adding metadata
+            for key, value in dictMetaData.items():
+                dataset.attrs[key] = value
+
+class ChannelWriteBuffer():
+    """
+    This is a write-combining buffer for one extendable HDF5 dataset. Incoming blocks are copied into a
+    preallocated NumPy block the size of one dataset chunk, and each full chunk is written with a single
+    resize and slice assignment. Writes stay aligned to the dataset chunks until the final partial flush.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+    """
+    def __init__(self, dataset, chunkSize = None):
+        self.dataset = dataset
+
+        # Using Dataset Chunk Length If Available
+        if chunkSize is None:
+            chunkSize = dataset.chunks[0] if dataset.chunks is not None else 1024
+
+        # Preallocated Pending Block
+        self.chunkSize = int(chunkSize)
+        self.pending = np.empty((self.chunkSize,) + dataset.shape[1:], dtype = dataset.dtype)
+        self.fill = 0
+
+    def append(self, block):
+        """
+        Adds samples along axis 0, writing to the dataset whenever a full chunk is collected.
+        """
+        block = np.asarray(block)
+        numSamples = len(block)
+        offset = 0
+
+        while offset < numSamples:
+            # Writing Whole Chunks Directly When Nothing Is Pending
+            if self.fill == 0 and numSamples - offset >= self.chunkSize:
+                numChunkSamples = ((numSamples - offset) // self.chunkSize) * self.chunkSize
+                self.write(block[offset:offset + numChunkSamples])
+                offset += numChunkSamples
+                continue
+
+            # Copying Into Pending Block
+            numCopy = min(self.chunkSize - self.fill, numSamples - offset)
+            self.pending[self.fill:self.fill + numCopy] = block[offset:offset + numCopy]
+            self.fill += numCopy
+            offset += numCopy
+
+            # Writing Full Chunk
+            if self.fill == self.chunkSize:
+                self.flush()
+
+    def flush(self):
+        """
+        Writes pending samples, even if they do not fill a whole chunk.
+        """
+        if self.fill > 0:
+            self.write(self.pending[:self.fill])
+            self.fill = 0
+
+    def write(self, block):
+        # Single Resize and Slice Assignment
+        currentLength = self.dataset.shape[0]
+        self.dataset.resize(currentLength + len(block), axis = 0)
+        self.dataset[currentLength:currentLength + len(block)] = block
+
+'''
+#-----------------------------------------------------------------------------------
+# ---- Queue Class
+
+def clearQueue(queue):
+        """
+        Clears all items from the queue.
+        """
+        while not queue.empty():
+            try:
+                queue.get()
+            except queue.Empty:
+                break
+
+#-----------------------------------------------------------------------------------
+# ---- Threading Module For Commands and Saving
+
+# Setting Up DataFileHandler
+dataHandler = DataFileHandler()
+
+# Setting up Command Queue
+commandQueue = queue.Queue()
+
+# Stopping Event
+stopEvent = threading.Event()
+ 
+# Command Mapp
+commandMap = {
+    'setFilePath' : dataHandler.setFilePath,
+    'createFile' : dataHandler.createFile,
+    'formatFile' : dataHandler.formatFile,
+    'addStartTime' : dataHandler.addStartTime,
+    'addStopTime' : dataHandler.addStopTime,
+    'saveDelsysData' : dataHandler.saveDelsysData,
+    'saveXSensorData' : dataHandler.saveXSensorData,
+    'saveDelsysMVC' : dataHandler.saveDelsysMVC,
+    'addTransitionTime' : dataHandler.addTransitionTime,
+    'plotTrialData' : dataHandler.plotTrialDataThread,
+    'closeFile' : dataHandler.closeFile,
+    'cleanUp' : dataHandler.closeFile,
+    #'stop' : stopEvent.set
+}
+
+# Resolving Command Stream
+print("Looking for RLCommandStream...")
+
+try:
+    # Creating a New Inlet to Read from the Stream
+    streams = resolve_stream('type', 'command')
+
+    # If No Stream
+    if len(streams) == 0:
+        print("Stream not found")
+
+    # If Stream Found
+    else:
+        # Creating Inlet
+        inlet = StreamInlet(streams[0])
+
+except Exception as e:
+    print(f"Error resolving command stream: {e}")
+
+# Listener Function for Commands
+def listener():
+    # Infinite Loop for Listening
+    while True:
+        try:
+            # Getting New Command From Command Stream
+            command, timestamps = inlet.pull_sample()
+
+            # If Command is Available
+            if command:
+                # Adding Command to Queue
+                print(json.loads(command[0]))
+                print("\n")
+                commandQueue.put(json.loads(command[0]))
+
+        # Decoding Error
+        except json.JSONDecodeError as e:
+            print(f"Error decoding sample: {e}")
+
+# Queue Processor Function
+def processQueue():
+    # Infinite Loop for Processing
+    while True:
+        # Getting Command from Command Queue
+        command = commandQueue.get()
+
+        # Setting Default Function Name
+        functionName = 'Start Command Processing'
+
+        # If There Are Commands in Queue
+        if command is not None:
+            try:
+                # Getting Command, Params
+                functionName = command['function']
+                params = command.get('params', {})
+
+                if functionName == 'stop':
+                    stopEvent.set()
+                    inlet.close_stream()
+
+                # Executing Commands
+                commandMap[functionName](**params)
+
+                # Clearing Queue If Command is Close File
+                if functionName == 'closeFile':
+                    clearQueue(commandQueue)
+
+            except:
+                print(f"Error executing command: {functionName}")         
+
+#----------- Main Function --------------------------
+
+if __name__ == '__main__':
+    pass
+    # Creating and Running Listener Thread
+    listenerThread = threading.Thread(target = listener, daemon = True)
+    listenerThread.start()
+
+    # Creating and Running Processor Thread
+    processerThread = threading.Thread(target = processQueue, daemon = True)
+    processerThread.start()
+
+    # Keeping Main Thread Alive
+    while True:
+        try:
+            pass
+
+        except LostError:
+            # Closing Inlet
+            inlet.close_stream()
+
+            # Joining Listener Threads
+            listenerThread.join()
+            processerThread.join()
+
+            break
+
+        except KeyboardInterrupt:
+            # Closing Inlet
+            inlet.close_stream()
+
+            # Joining Listener Threads
+            listenerThread.join()
+            processerThread.join()
+
+            break
+
+    print("Exiting DataFileHandler...")
 '''
\ No newline at end of file
@@ -0,0 +1,150 @@
+import numpy as np
+import h5py
+import time
+
+class DataFileReader():
+    """
+    This is a live reader for trial files written by DataFileHandler with swmrMode enabled. It opens the file
+    in single-writer multi-reader mode from another process and tails the Delsys and XSensor datasets
+    while the trial is still being recorded, without blocking the writer. New samples become visible each
+    time the writer flushes (DataFileHandler.swmrFlushInterval, 1 s), up to the last full chunk of each
+    dataset. SWMR files use short chunks, so the lag is at most about 1.5 s for EMG (0.25 s of samples
+    rounded up to a power of two, e.g. 1024 samples at 2148 Hz) and 1.3 s for XSensor (32 frames at 100 Hz).
+    With swmrFlushPartial on the writer, the lag drops to the flush interval. Close the reader once recording
+    stops so the writer can add its stop time and transition attributes to the file.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        reader = DataFileReader('Data/Experiment/Trial 1.h5')
+        while reader.isRecording(idleTimeout = 3.0):
+            newData = reader.readNew()   # {'Sensor 1/EMG 1' : array, 'Foot 1/Pressure' : array, ...}
+            time.sleep(0.5)
+        reader.close()
+
+    """
+    def __init__(self, completePath, timeout = 10.0):
+        # File Parameters
+        self.completePath = completePath
+        self.hdf5File = None
+
+        # Read Cursors, Keyed by Dataset Path
+        self.cursors = {}
+
+        # Time New Samples Were Last Seen
+        self.lastGrowthTime = time.perf_counter()
+
+        # Opening File
+        self.openFile(timeout)
+
+    #-----------------------------------------------------------------------------------
+    # ---- File Functions
+
+    def openFile(self, timeout = 10.0):
+        """
+        Opens the file for SWMR reading, retrying until the writer has switched SWMR on or timeout passes.
+        """
+        startTime = time.perf_counter()
+
+        while self.hdf5File is None:
+            try:
+                self.hdf5File = h5py.File(self.completePath, 'r', libver = 'latest', swmr = True)
+
+            except Exception as e:
+                # Giving Up After Timeout
+                if time.perf_counter() - startTime >= timeout:
+                    print(e)
+                    print(f"Unable to open {self.completePath} for live reading")
+                    return
+
+                time.sleep(0.2)
+
+        # Registering Sensor Datasets
+        for path in self.datasetPaths():
+            self.cursors[path] = 0
+
+    def datasetPaths(self):
+        """
+        Returns the 'Sensor/Channel' paths of all Delsys and XSensor datasets in the file.
+        """
+        paths = []
+
+        for group in self.hdf5File.keys():
+            if isinstance(self.hdf5File[group], h5py.Group):
+                for channel in self.hdf5File[group].keys():
+                    paths.append(f'{group}/{channel}')
+
+        return paths
+
+    def sampleRate(self, datasetPath):
+        # Sample Rate Saved With Each Channel
+        return self.hdf5File[datasetPath].attrs.get('SampleRate', None)
+
+    def isRecording(self, idleTimeout = 3.0):
+        # Writer Flushes Regularly While Recording, So Treating a Long Pause as Stopped
+        return self.hdf5File is not None and time.perf_counter() - self.lastGrowthTime < idleTimeout
+
+    def close(self):
+        if self.hdf5File is not None:
+            self.hdf5File.close()
+            self.hdf5File = None
+
+    #-----------------------------------------------------------------------------------
+    # ---- Reading Functions
+
+    def length(self, datasetPath):
+        """
+        Returns the number of samples the writer has flushed to datasetPath so far.
+        """
+        dataset = self.hdf5File[datasetPath]
+        dataset.refresh()
+
+        return dataset.shape[0]
+
+    def read(self, datasetPath):
+        """
+        Returns the samples of datasetPath not read yet and advances its cursor.
+        """
+        dataset = self.hdf5File[datasetPath]
+        dataset.refresh()
+
+        # Reading Only New Samples
+        start = self.cursors.get(datasetPath, 0)
+        end = dataset.shape[0]
+        self.cursors[datasetPath] = end
+
+        # Tracking Writer Activity
+        if end > start:
+            self.lastGrowthTime = time.perf_counter()
+
+        return dataset[start:end]
+
+    def readNew(self, datasetPaths = None):
+        """
+        Returns a dict of new samples for each dataset path (all sensor datasets by default).
+        """
+        if datasetPaths is None:
+            datasetPaths = list(self.cursors.keys())
+
+        newData = {}
+
+        for datasetPath in datasetPaths:
+            try:
+                newData[datasetPath] = self.read(datasetPath)
+
+            except Exception as e:
+                print(e)
+                print(f"Unable to read {datasetPath}")
+
+        return newData
+
+    def latest(self, datasetPath, numSamples):
+        """
+        Returns the newest numSamples flushed samples of datasetPath without moving its cursor.
+        """
+        dataset = self.hdf5File[datasetPath]
+        dataset.refresh()
+
+        return dataset[max(dataset.shape[0] - numSamples, 0):]
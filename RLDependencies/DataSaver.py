@@ -0,0 +1,318 @@
+import numpy as np
+import threading
+import queue
+import time
+from collections import deque
+
+#-----------------------------------------------------------------------------------
+# ---- Saver Messages
+
+class SaverMessage():
+    """
+    Base class for messages sent to the DataSaver thread. Records when the message was queued so write
+    latency can be measured.
+    """
+    def __init__(self, function):
+        self.function = function
+        self.enqueueTime = time.perf_counter()
+
+class DataMessage(SaverMessage):
+    """
+    Sensor data for a DataFileHandler save function ('saveDelsysData' or 'saveXSensorData'). Data is a list
+    with one block per channel or sensor, samples along axis 0, and timestamps an optional array with one
+    entry per sample. Blocks are copied so producers can reuse their buffers (ring buffer views, XSensor
+    frame blocks) as soon as the message is queued.
+    """
+    def __init__(self, function, data, timestamps = None):
+        super().__init__(function)
+
+        # Copying Blocks Out of Producer Buffers
+        self.data = [np.array(block) for block in data]
+        self.timestamps = np.array(timestamps) if timestamps is not None else None
+        self.nbytes = sum(block.nbytes for block in self.data) + (self.timestamps.nbytes if self.timestamps is not None else 0)
+        self.enqueueTimes = [self.enqueueTime]
+
+    def coalesce(self, others):
+        """
+        Appends the blocks of later messages for the same function, so all of them are saved with one write.
+        Each channel is concatenated once.
+        """
+        for index in range(len(self.data)):
+            # Skipping Empty Blocks
+            blocks = [message.data[index] for message in [self] + others if len(message.data[index]) != 0]
+
+            if len(blocks) > 1:
+                self.data[index] = np.concatenate(blocks)
+            elif len(blocks) == 1:
+                self.data[index] = blocks[0]
+
+        # Timestamps Follow the Same Samples
+        timestamps = [message.timestamps for message in [self] + others if message.timestamps is not None]
+        if len(timestamps) > 0:
+            self.timestamps = np.concatenate(timestamps)
+
+        for message in others:
+            self.nbytes += message.nbytes
+            self.enqueueTimes += message.enqueueTimes
+
+class CommandMessage(SaverMessage):
+    """
+    Any other DataFileHandler call (createFile, addStartTime, closeFile, etc.) with keyword parameters.
+    Commands are never dropped and are executed in order with the data around them.
+    """
+    def __init__(self, function, params = None):
+        super().__init__(function)
+        self.params = params if params is not None else {}
+
+class StopMessage(SaverMessage):
+    """
+    Stops the DataSaver thread once all earlier messages are handled.
+    """
+    def __init__(self):
+        super().__init__('stop')
+
+#-----------------------------------------------------------------------------------
+# ---- Saver Metrics
+
+class SaverMetrics():
+    """
+    Collects DataSaver metrics: queue depth, latency from queueing to written for each data message, time
+    spent in each write, bytes per second and dropped messages. Latency and write time keep the last
+    historyLength values for percentiles.
+    """
+    def __init__(self, historyLength = 10000):
+        self.historyLength = historyLength
+        self.reset()
+
+    def reset(self):
+        # Timing
+        self.startTime = time.perf_counter()
+
+        # Queue Depth
+        self.queueDepth = 0
+        self.maxQueueDepth = 0
+
+        # Latency and Write Time History in Seconds
+        self.latencies = deque(maxlen = self.historyLength)
+        self.writeTimes = deque(maxlen = self.historyLength)
+
+        # Counters
+        self.messagesWritten = 0
+        self.writesPerformed = 0
+        self.bytesWritten = 0
+        self.messagesDropped = 0
+        self.bytesDropped = 0
+
+    def recordQueueDepth(self, queueDepth):
+        self.queueDepth = queueDepth
+        self.maxQueueDepth = max(self.maxQueueDepth, queueDepth)
+
+    def recordWrite(self, message, writeTime):
+        # Latency for Every Message Merged Into the Write
+        finishTime = time.perf_counter()
+        self.latencies.extend(finishTime - enqueueTime for enqueueTime in message.enqueueTimes)
+        self.writeTimes.append(writeTime)
+
+        self.messagesWritten += len(message.enqueueTimes)
+        self.writesPerformed += 1
+        self.bytesWritten += message.nbytes
+
+    def recordDrop(self, message):
+        self.messagesDropped += 1
+        self.bytesDropped += message.nbytes
+
+    def summary(self):
+        """
+        Returns a dict of current metrics. Latency and write time percentiles are in milliseconds.
+        """
+        elapsed = time.perf_counter() - self.startTime
+        latencies = np.array(self.latencies) * 1000
+        writeTimes = np.array(self.writeTimes) * 1000
+
+        summary = {
+            'queueDepth' : self.queueDepth,
+            'maxQueueDepth' : self.maxQueueDepth,
+            'messagesWritten' : self.messagesWritten,
+            'writesPerformed' : self.writesPerformed,
+            'messagesDropped' : self.messagesDropped,
+            'bytesDropped' : self.bytesDropped,
+            'bytesPerSecond' : self.bytesWritten / elapsed if elapsed > 0 else 0.0,
+        }
+
+        # Percentiles
+        for name, values in (('latency', latencies), ('writeTime', writeTimes)):
+            for percentile in (50, 95, 99):
+                summary[f'{name}P{percentile}'] = float(np.percentile(values, percentile)) if len(values) else 0.0
+            summary[f'{name}Max'] = float(values.max()) if len(values) else 0.0
+
+        return summary
+
+    def report(self):
+        # Formatted Summary for Printing
+        summary = self.summary()
+
+        return (f"Saver: {summary['messagesWritten']} messages in {summary['writesPerformed']} writes, "
+                f"{summary['bytesPerSecond'] / 1e3:.1f} kB/s, queue depth {summary['queueDepth']} (max {summary['maxQueueDepth']}), "
+                f"latency p50/p95/p99 {summary['latencyP50']:.1f}/{summary['latencyP95']:.1f}/{summary['latencyP99']:.1f} ms, "
+                f"write p50/p95/p99 {summary['writeTimeP50']:.2f}/{summary['writeTimeP95']:.2f}/{summary['writeTimeP99']:.2f} ms, "
+                f"dropped {summary['messagesDropped']}")
+
+#-----------------------------------------------------------------------------------
+# ---- Saver Thread
+
+class DataSaver(threading.Thread):
+    """
+    This is the background file saver for DataFileHandler. Typed messages go through a bounded queue. When
+    the queue is full, data messages either block the producer ('block', optionally giving up after
+    blockTimeout seconds) or are dropped right away ('drop'). Commands always block. Consecutive data
+    messages for the same save function are coalesced into a single write, and commands act as barriers so
+    the file sees everything in order.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        dataSaver = DataSaver(dataFileHandler, maxQueueSize = 256, policy = 'block')
+        dataSaver.start()
+        dataSaver.submitCommand('createFile', fileName = 'Trial 1')
+        dataSaver.submitData('saveDelsysData', delsysData)
+        dataSaver.waitUntilEmpty()
+        print(dataSaver.metrics.report())
+        dataSaver.stop()
+
+    """
+    def __init__(self, handler, maxQueueSize = 256, policy = 'block', blockTimeout = None, maxCoalesce = 64):
+        super().__init__(daemon = True)
+
+        # File Handler That Performs the Writes
+        self.dataHandler = handler
+
+        # Queue and Full Queue Policy
+        self.queue = queue.Queue(maxsize = maxQueueSize)
+        self.policy = policy
+        self.blockTimeout = blockTimeout
+
+        # Maximum Messages Taken From Queue Per Batch
+        self.maxCoalesce = maxCoalesce
+
+        # Metrics
+        self.metrics = SaverMetrics()
+
+        self.running = True
+
+    #-----------------------------------------------------------------------------------
+    # ---- Producer Functions
+
+    def submitData(self, function, data, timestamps = None):
+        """
+        Queues sensor data (and optional per sample timestamps) for saving. Returns False if the message was
+        dropped.
+        """
+        message = DataMessage(function, data, timestamps)
+
+        try:
+            if self.policy == 'drop':
+                self.queue.put_nowait(message)
+            else:
+                self.queue.put(message, timeout = self.blockTimeout)
+
+        except queue.Full:
+            # Counting Dropped Data
+            self.metrics.recordDrop(message)
+            return False
+
+        return True
+
+    def submitCommand(self, function, **params):
+        # Commands Are Never Dropped
+        self.queue.put(CommandMessage(function, params))
+
+    def waitUntilEmpty(self):
+        """
+        Blocks until every queued message has been handled.
+        """
+        self.queue.join()
+
+    def stop(self):
+        # Adding Stop To Queue
+        self.queue.put(StopMessage())
+
+    #-----------------------------------------------------------------------------------
+    # ---- Saver Thread Functions
+
+    def run(self):
+        # Loop for Running
+        while self.running:
+            # Waiting for First Message
+            batch = [self.queue.get()]
+
+            # Taking Messages Already Waiting, Up to Next Command
+            while len(batch) < self.maxCoalesce and isinstance(batch[-1], DataMessage):
+                try:
+                    batch.append(self.queue.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            self.metrics.recordQueueDepth(self.queue.qsize() + len(batch))
+
+            try:
+                self.processBatch(batch)
+
+            finally:
+                # Task Done Signals
+                for _ in batch:
+                    self.queue.task_done()
+
+    def processBatch(self, batch):
+        """
+        Coalesces the data messages of a batch per save function, then writes them before any command.
+        """
+        pending = {}
+
+        for message in batch:
+            if isinstance(message, DataMessage):
+                # Grouping With Earlier Data for the Same Function
+                pending.setdefault(message.function, []).append(message)
+
+            else:
+                # Writing Data Queued Before the Command
+                self.writePending(pending)
+                pending = {}
+
+                if isinstance(message, StopMessage):
+                    self.running = False
+                else:
+                    self.executeCommand(message)
+
+        self.writePending(pending)
+
+    def writePending(self, pending):
+        for function, messages in pending.items():
+            # Merging Messages Into One Write
+            message = messages[0]
+            message.coalesce(messages[1:])
+
+            try:
+                # Calling Save Function From DataFileHandler
+                startTime = time.perf_counter()
+                if message.timestamps is None:
+                    getattr(self.dataHandler, function)(message.data)
+                else:
+                    getattr(self.dataHandler, function)(message.data, message.timestamps)
+
+                self.metrics.recordWrite(message, time.perf_counter() - startTime)
+
+            except Exception as e:
+                print(e)
+                print(f"Error processing : {function}")
+
+    def executeCommand(self, message):
+        try:
+            # Calling Function from DataFileHandler
+            getattr(self.dataHandler, message.function)(**message.params)
+
+        except Exception as e:
+            print(e)
+            print(f"Error processing : {message.function, message.params}")
@@ -0,0 +1,224 @@
+import numpy as np
+import time
+from collections import deque
+
+from RLDependencies.RingBuffer import *
+
+class EMGFeatureExtractor():
+    """
+    This is the sliding window feature extractor that turns the Delsys streams into RLWidget inputs. Every
+    hopSeconds it produces one float32 feature vector over the last windowSeconds:
+
+        EMG, per channel:         mean absolute value, RMS, waveform length, zero crossings, slope sign changes
+        Goniometer, per channel:  angle (window mean), angular velocity (change over the window per second)
+
+    EMG features are kept as running window sums. Each new sample adds its contribution and the sample
+    leaving the window subtracts its own, so the cost per hop depends on the hop length, not the window
+    length, and all channels are processed together. The sums are recomputed from the window every
+    resyncHops hops to remove floating point drift. Processing time of every update is recorded against
+    latencyBudget.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        featureExtractor = EMGFeatureExtractor(numEMGChannels = 8, numGoniometerChannels = 2)
+        features = featureExtractor.update(emgBlock, goniometerBlock)   # (numSamples, numChannels) blocks
+        if features is not None:
+            RLWidget.updateFeatures(features)
+        print(featureExtractor.latencyReport())
+
+    """
+    # EMG Contributions Per Sample, in Feature Vector Order
+    emgFeatureNames = ['MAV', 'RMS', 'WL', 'ZC', 'SSC']
+    goniometerFeatureNames = ['Angle', 'Velocity']
+
+    def __init__(self, numEMGChannels, numGoniometerChannels = 0, sampleRate = 2148.1481, goniometerRate = 518.5185, windowSeconds = 0.2,
+                 hopSeconds = 0.05, zeroCrossingThreshold = 0.0, slopeThreshold = 0.0, latencyBudget = 0.002, resyncHops = 200):
+        # Channels
+        self.numEMGChannels = numEMGChannels
+        self.numGoniometerChannels = numGoniometerChannels
+
+        # Window and Hop in EMG Samples
+        self.sampleRate = sampleRate
+        self.windowSeconds = windowSeconds
+        self.windowSize = max(int(round(windowSeconds * sampleRate)), 2)
+        self.hopSize = max(int(round(hopSeconds * sampleRate)), 1)
+
+        # Goniometer Window in Goniometer Samples
+        self.goniometerRate = goniometerRate
+        self.goniometerWindowSize = max(int(round(windowSeconds * goniometerRate)), 2)
+
+        # Thresholds Against Noise
+        self.zeroCrossingThreshold = zeroCrossingThreshold
+        self.slopeThreshold = slopeThreshold
+
+        # Feature Vector Layout
+        self.numEMGFeatures = len(self.emgFeatureNames) * numEMGChannels
+        self.numFeatures = self.numEMGFeatures + len(self.goniometerFeatureNames) * numGoniometerChannels
+
+        # Latency Tracking in Seconds
+        self.latencyBudget = latencyBudget
+        self.resyncHops = resyncHops
+
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all windows, running sums and latency history, e.g. at the start of a trial.
+        """
+        # Per Sample EMG Contributions, (numSamples, numFeatureTypes, numEMGChannels)
+        self.contributionBuffer = RingBuffer(self.windowSize + self.hopSize, frameShape = (len(self.emgFeatureNames), self.numEMGChannels))
+        self.runningSums = np.zeros((len(self.emgFeatureNames), self.numEMGChannels))
+
+        # Last Two EMG Samples for Differences Across Block Boundaries
+        self.previousSamples = np.zeros((2, self.numEMGChannels))
+
+        # Goniometer Samples
+        self.goniometerBuffer = RingBuffer(self.goniometerWindowSize, frameShape = (self.numGoniometerChannels,))
+
+        # Hop Tracking
+        self.samplesToHop = self.hopSize
+        self.hopCount = 0
+
+        # Output Vector, Reused Every Hop
+        self.features = np.zeros(self.numFeatures, dtype = np.float32)
+
+        # Latency History
+        self.latencies = deque(maxlen = 10000)
+        self.overBudget = 0
+
+    #-----------------------------------------------------------------------------------
+    # ---- Streaming Functions
+
+    def update(self, emgBlock, goniometerBlock = None):
+        """
+        Adds new samples, (numSamples, numChannels) arrays or channels-first lists of equal length blocks.
+        Returns the feature vector if at least one hop completed, otherwise None. The returned array is
+        reused, so copy it to keep it past the next update.
+        """
+        startTime = time.perf_counter()
+        emgBlock = self.asFrames(emgBlock, self.numEMGChannels)
+
+        # Goniometer Samples Only Need the Newest Window
+        if goniometerBlock is not None and self.numGoniometerChannels > 0:
+            self.goniometerBuffer.append(self.asFrames(goniometerBlock, self.numGoniometerChannels))
+
+        # Splitting Block at Hop Boundaries
+        hopCompleted = False
+        position = 0
+        while position < len(emgBlock):
+            numSamples = min(len(emgBlock) - position, self.samplesToHop)
+            self.addSamples(emgBlock[position:position + numSamples])
+            position += numSamples
+            self.samplesToHop -= numSamples
+
+            if self.samplesToHop == 0:
+                self.computeFeatures()
+                self.samplesToHop = self.hopSize
+                hopCompleted = True
+
+        # Recording Latency
+        latency = time.perf_counter() - startTime
+        self.latencies.append(latency)
+        if latency > self.latencyBudget:
+            self.overBudget += 1
+
+        return self.features if hopCompleted else None
+
+    def asFrames(self, block, numChannels):
+        # Channels-First Lists Are Stacked Into (numSamples, numChannels)
+        if isinstance(block, np.ndarray) and block.ndim == 2:
+            return block
+
+        if len(block) == 0:
+            return np.zeros((0, numChannels))
+
+        # Channels at Different Rates Give Blocks of Different Lengths
+        lengths = set(len(channelBlock) for channelBlock in block)
+        if len(lengths) > 1:
+            raise ValueError(f"Feature blocks need equal lengths, got {sorted(lengths)}")
+
+        return np.stack(block, axis = 1)
+
+    def addSamples(self, samples):
+        """
+        Computes the per sample contributions of samples (at most one hop) for all channels at once and
+        updates the running window sums.
+        """
+        numSamples = len(samples)
+
+        # Samples With the Two Before Them, So Differences Span Block Boundaries
+        extended = np.concatenate((self.previousSamples, samples))
+        differences = np.diff(extended, axis = 0)
+
+        # Contributions: |x|, x^2, |dx|, Zero Crossing and Slope Sign Change Indicators
+        contributions = np.empty((numSamples, len(self.emgFeatureNames), self.numEMGChannels))
+        np.abs(samples, out = contributions[:, 0])
+        np.square(samples, out = contributions[:, 1])
+        np.abs(differences[1:], out = contributions[:, 2])
+        contributions[:, 3] = (extended[1:-1] * extended[2:] < 0) & (contributions[:, 2] >= self.zeroCrossingThreshold)
+        contributions[:, 4] = differences[:-1] * -differences[1:] > self.slopeThreshold
+
+        # Contributions Leaving the Window
+        windowCount = min(self.contributionBuffer.writeCount, self.windowSize)
+        numLeaving = max(windowCount + numSamples - self.windowSize, 0)
+        if numLeaving > 0:
+            leaving = self.contributionBuffer.window(self.contributionBuffer.writeCount - windowCount + numLeaving, numLeaving)
+            self.runningSums -= leaving.sum(axis = 0)
+
+        # Contributions Entering the Window
+        self.runningSums += contributions.sum(axis = 0)
+        self.contributionBuffer.append(contributions)
+
+        self.previousSamples = extended[-2:].copy()
+
+    def computeFeatures(self):
+        """
+        Writes the feature vector for the window ending at the current hop.
+        """
+        self.hopCount += 1
+
+        # Removing Floating Point Drift From Running Sums
+        if self.hopCount % self.resyncHops == 0:
+            self.runningSums = self.contributionBuffer.latest(self.windowSize).sum(axis = 0)
+
+        numSamples = max(min(self.contributionBuffer.writeCount, self.windowSize), 1)
+        emgFeatures = self.features[:self.numEMGFeatures].reshape(len(self.emgFeatureNames), self.numEMGChannels)
+
+        # MAV and RMS Are Window Means, Waveform Length and Counts Are Window Totals
+        np.divide(self.runningSums[0], numSamples, out = emgFeatures[0], casting = 'unsafe')
+        np.sqrt(np.maximum(self.runningSums[1], 0) / numSamples, out = emgFeatures[1], casting = 'unsafe')
+        emgFeatures[2:] = self.runningSums[2:]
+
+        # Goniometer Angle and Angular Velocity
+        if self.numGoniometerChannels > 0 and self.goniometerBuffer.writeCount > 0:
+            goniometerWindow = self.goniometerBuffer.latest(self.goniometerWindowSize)
+            goniometerFeatures = self.features[self.numEMGFeatures:].reshape(len(self.goniometerFeatureNames), self.numGoniometerChannels)
+            goniometerFeatures[0] = goniometerWindow.mean(axis = 0)
+            goniometerFeatures[1] = (goniometerWindow[-1] - goniometerWindow[0]) * self.goniometerRate / max(len(goniometerWindow) - 1, 1)
+
+    #-----------------------------------------------------------------------------------
+    # ---- Reporting Functions
+
+    def featureNames(self, emgNames = None, goniometerNames = None):
+        """
+        Returns a label for every entry of the feature vector.
+        """
+        emgNames = emgNames if emgNames is not None else [f"EMG {i + 1}" for i in range(self.numEMGChannels)]
+        goniometerNames = goniometerNames if goniometerNames is not None else [f"Goniometer {i + 1}" for i in range(self.numGoniometerChannels)]
+
+        return ([f"{channel} {feature}" for feature in self.emgFeatureNames for channel in emgNames] +
+                [f"{channel} {feature}" for feature in self.goniometerFeatureNames for channel in goniometerNames])
+
+    def latencyReport(self):
+        # Formatted Latency Summary for Printing
+        if len(self.latencies) == 0:
+            return "Features: no updates"
+
+        latencies = np.array(self.latencies) * 1000
+
+        return (f"Features: {self.numFeatures} features, {self.hopCount} hops, update p50/p95/max "
+                f"{np.percentile(latencies, 50):.3f}/{np.percentile(latencies, 95):.3f}/{latencies.max():.3f} ms, "
+                f"over {self.latencyBudget * 1000:.1f} ms budget {self.overBudget}")
@@ -1,127 +1,342 @@
-import pyqtgraph as pg
-import numpy as np
-import sys
-import time
-from PySide6.QtCore import *
-from PySide6.QtGui import *
-from PySide6.QtWidgets import *
-
-class EMGPlot(QWidget):
-    """
-    This is a live plot widget created to support the DelsysEMG class to visualize incoming EMG
-    signals in real time. This class dynamically allocates plots based on the information from 
-    DelsysEMG.configure(). 
-
-    Author: Sonny Jones & Grange Simpson
-    Version: 2023.11.10
-
-    Usage: Check RL Front End, configureCallback Function
-
-    """
-    def __init__(self, numGraphs=1, sensorDict=None, sensorNames=None, EMGSensors=None, recordingRate=None):
-        super().__init__()
-        self.numGraphs = numGraphs
-        self.sensorDict = sensorDict
-        self.sensorNames = sensorNames
-        self.EMGSensors = EMGSensors
-        self.bufferSize = 600
-        self.samples = np.arange(-(self.bufferSize - 1), 1)
-        self.sampleCount = 0
-        self.plottingBuffer = np.zeros((self.numGraphs, self.bufferSize))
-        self.plottingPanel = self.PlottingPanel()
-        self.updateTimer = recordingRate * 2
-        self.frameDelay = recordingRate * 2
-        self.recordingRate = recordingRate
-        
-    # Initializing Plotting Widget Panel
-    def PlottingPanel(self):
-        plottingPanel = QWidget()
-        plottingLayout = QVBoxLayout()
-        plottingPanel.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-
-        # Creating List of Items for Display
-        self.sensorDisplayList = []
-
-        # Iterative Through
-        for i in range(self.numGraphs):
-            # Grabbing Information from sensorDict
-            sensorNumber = self.sensorNames.index(self.EMGSensors[i]) + 1
-            sensorMuscle = self.sensorDict[self.EMGSensors[i]][1]
-
-            self.sensorDisplayList.append(f"Sensor {sensorNumber} : {sensorMuscle}")
-
-        # Sensor Selection
-        self.sensorDisplaySelection = QComboBox(self)
-        self.sensorDisplaySelection.addItems(self.sensorDisplayList)
-        self.sensorDisplaySelection.currentIndexChanged.connect(self.updateEMGPlot)
-
-        # Creating Plotting Widget
-        self.plotWidget = pg.GraphicsLayoutWidget()
-        self.plot = self.plotWidget.addPlot()
-        # If only goniometers are being used
-        if (len(self.sensorDisplayList) > 0):
-            self.plot.setTitle(self.sensorDisplayList[0])
-            self.plotItem = self.plot.plot(self.samples, self.plottingBuffer[0])
-
-        # Current Plot
-        self.currentPlot = 0
-
-        # Setting Size Constraints
-        self.plotWidget.setMaximumSize(800, 500)
-        self.plotWidget.setMinimumSize(600, 500)
-        plottingLayout.addWidget(self.plotWidget)
-        plottingLayout.addWidget(self.sensorDisplaySelection)
-
-        # Adding Layout
-        plottingLayout.setContentsMargins(0, 0, 0, 0)
-        plottingLayout.setSpacing(0)
-        plottingPanel.setLayout(plottingLayout)
-
-        return plottingPanel
-    
-    #-----------------------------------------------------------------------------------
-    # ---- Plotting Functions
-
-    # Plot Updater
-    def plotEMG(self, data):
-        """
-        Updating graph widget window and data. Takea a new data data sample to the data buffer by circulating the buffer and adding the new
-        data to the end of the buffer. Updates each plot with the new data.
-        """
-
-        self.plottingBuffer[:, -1] = data
-        self.sampleCount += 1
-        self.samples = np.roll(self.samples, -1)
-        self.samples[-1] = self.sampleCount
-        
-        # Performing Graph Update on Timer Setting
-        if self.updateTimer >= self.frameDelay:
-            self.plotItem.setData(self.samples, self.plottingBuffer[self.currentPlot])
-            self.updateTimer = 0
-        
-        # Upadting Plotting Timer
-        self.updateTimer += self.recordingRate
-
-        self.plottingBuffer = np.roll(self.plottingBuffer, -1, axis = 1)
-
-    # Updating Current Plot
-    def updateEMGPlot(self):
-        # Updating Current Plot Index and Title
-        self.currentPlot = self.sensorDisplayList.index(self.sensorDisplaySelection.currentText())
-        self.plot.setTitle(self.sensorDisplaySelection.currentText())
-
-    # Resetting Plot
-    def resetPlot(self):
-        # Resetting Tracking Variables
-        self.samples = np.arange(-(self.bufferSize - 1), 1)
-        self.sampleCount = 0
-        self.plottingBuffer = np.zeros((self.numGraphs, self.bufferSize))
-
-        # Clearing Plot
-        self.plotItem.clear()
-        
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    widget = EMGPlot()
-    widget.show()
-    sys.exit(app.exec())
+import pyqtgraph as pg
+import numpy as np
+import sys
+import time
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+from PySide6.QtWidgets import *
+
+from RLDependencies.RingBuffer import *
+
+class EMGPlot(QWidget):
+    """
+    This is a live plot widget created to support the DelsysEMG class to visualize incoming EMG
+    signals in real time. This class dynamically allocates plots based on the information from 
+    DelsysEMG.configure(). 
+
+    Without a sampleRate, plotEMG takes one value per channel per tick (e.g. DelsysEMG.plotEMGGUI averages).
+    With a sampleRate, plotEMG takes the raw per-channel sample blocks (DelsysEMG.readEMGBlocks) and keeps
+    windowSeconds of raw EMG, drawn as a min/max envelope decimated to the plot width in pixels. sampleRate
+    may also be a list with one rate per channel.
+
+    layout = 'single' shows the channel selected in the combo box. layout = 'grid' shows every channel at
+    once (e.g. DelsysEMG.plotChannelIndices with goniometers, labelled by channelLabels). All curves are
+    redrawn together on one render clock capped at maxRefreshRate.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2023.11.10
+
+    Usage: Check RL Front End, configureCallback Function
+
+    """
+    def __init__(self, numGraphs=1, sensorDict=None, sensorNames=None, EMGSensors=None, recordingRate=None, bufferSize=600, sampleRate=None, windowSeconds=5,
+                 layout='single', channelLabels=None, maxRefreshRate=30, gridColumns=4):
+        super().__init__()
+        self.numGraphs = numGraphs
+        self.sensorDict = sensorDict
+        self.sensorNames = sensorNames
+        self.EMGSensors = EMGSensors
+        self.bufferSize = bufferSize
+
+        # Raw Waveform Mode
+        self.sampleRate = sampleRate
+        self.windowSeconds = windowSeconds
+        self.rawMode = sampleRate is not None
+
+        # Display Layout
+        self.plotLayout = layout
+        self.channelLabels = channelLabels
+        self.gridColumns = gridColumns
+
+        self.createBuffers()
+        self.plottingPanel = self.PlottingPanel()
+
+        # Shared Render Clock, Redrawing Every Other Tick (recordingRate in ms) at Most maxRefreshRate Times a Second
+        self.recordingRate = recordingRate
+        self.renderInterval = max(recordingRate * 2 / 1000, 1 / maxRefreshRate)
+        self.lastRenderTime = 0.0
+        
+    # Initializing Plotting Widget Panel
+    def PlottingPanel(self):
+        plottingPanel = QWidget()
+        plottingLayout = QVBoxLayout()
+        plottingPanel.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+
+        # Creating List of Items for Display
+        if self.channelLabels is not None:
+            self.sensorDisplayList = list(self.channelLabels)
+
+        else:
+            self.sensorDisplayList = []
+
+            # Iterative Through
+            for i in range(self.numGraphs):
+                # Grabbing Information from sensorDict
+                sensorNumber = self.sensorNames.index(self.EMGSensors[i]) + 1
+                sensorMuscle = self.sensorDict[self.EMGSensors[i]][1]
+
+                self.sensorDisplayList.append(f"Sensor {sensorNumber} : {sensorMuscle}")
+
+        # Sensor Selection
+        self.sensorDisplaySelection = QComboBox(self)
+        self.sensorDisplaySelection.addItems(self.sensorDisplayList)
+        self.sensorDisplaySelection.currentIndexChanged.connect(self.updateEMGPlot)
+
+        # Creating Plotting Widget
+        self.plotWidget = pg.GraphicsLayoutWidget()
+        self.plots = []
+        self.plotItems = []
+        self.yRanges = []
+
+        # Current Plot
+        self.currentPlot = 0
+
+        if self.plotLayout == 'grid':
+            # One Small Plot Per Channel
+            for i in range(len(self.sensorDisplayList)):
+                if i > 0 and i % self.gridColumns == 0:
+                    self.plotWidget.nextRow()
+
+                self.createPlot(self.sensorDisplayList[i], i)
+
+            # Every Channel Shown, Selection Not Needed
+            self.sensorDisplaySelection.hide()
+            self.plotWidget.setMinimumSize(600, 500)
+
+        else:
+            self.plot = self.plotWidget.addPlot()
+            self.plots.append(self.plot)
+
+            # If only goniometers are being used
+            if (len(self.sensorDisplayList) > 0):
+                self.plot.setTitle(self.sensorDisplayList[0])
+                self.plotItem = self.createCurve(self.plot, 0)
+                self.plotItems.append(self.plotItem)
+
+            # Setting Size Constraints
+            self.plotWidget.setMaximumSize(800, 500)
+            self.plotWidget.setMinimumSize(600, 500)
+
+        plottingLayout.addWidget(self.plotWidget)
+        plottingLayout.addWidget(self.sensorDisplaySelection)
+
+        # Adding Layout
+        plottingLayout.setContentsMargins(0, 0, 0, 0)
+        plottingLayout.setSpacing(0)
+        plottingPanel.setLayout(plottingLayout)
+
+        return plottingPanel
+
+    # Creating Grid Plot
+    def createPlot(self, title, channel):
+        plot = self.plotWidget.addPlot(title = title)
+        plot.setMenuEnabled(False)
+        plot.hideButtons()
+        self.plots.append(plot)
+        self.plotItems.append(self.createCurve(plot, channel))
+
+    # Creating Curve
+    def createCurve(self, plot, channel):
+        """
+        Creates the curve for channel. Data is always finite, so the finite check is skipped, and pyqtgraph
+        peak downsampling and view clipping cover windows that are not decimated already (low rate channels).
+        """
+        plot.setDownsampling(auto = True, mode = 'peak')
+        plot.setClipToView(True)
+
+        # Fixed Time Axis in Raw Mode, So Axis Ticks Are Not Regenerated Every Frame
+        if self.rawMode:
+            plot.setXRange(-self.windowSeconds, 0, padding = 0)
+            plot.setLabel('bottom', 'Time', units = 's')
+
+        # Y Range Managed by updateYRange Instead of Auto Range
+        plot.enableAutoRange(y = False)
+        self.yRanges.append(None)
+
+        return plot.plot(*self.plotView(channel), skipFiniteCheck = True)
+
+    # Rescaling Y Axis
+    def updateYRange(self, plotIndex, values):
+        """
+        Rescales the y axis only when the data leaves the current range or fills less than a quarter of it.
+        Auto range rescales, and regenerates the axis, on every frame, which dominates the grid redraw time.
+        """
+        low, high = float(values.min()), float(values.max())
+        yRange = self.yRanges[plotIndex]
+
+        # Minimum Span, So Flat Channels (Disconnected or All Zeros) Settle Instead of Rescaling Every Frame
+        span = max(high - low, 1e-6)
+
+        if yRange is None or low < yRange[0] or high > yRange[1] or span < (yRange[1] - yRange[0]) / 4:
+            # New Range With Margin for Growth
+            margin = span * 0.25
+            self.yRanges[plotIndex] = (low - margin, high + margin)
+            self.plots[plotIndex].setYRange(*self.yRanges[plotIndex], padding = 0)
+    
+    #-----------------------------------------------------------------------------------
+    # ---- Buffer Functions
+
+    # Creating Circular Plot Buffers
+    def createBuffers(self):
+        """
+        Creates the circular sample index and plotting buffers, pre-filled with bufferSize zeros so the plot
+        starts at full width. Each tick writes one row, and plotView returns contiguous views for rendering.
+        In raw mode, each channel gets a buffer holding windowSeconds of samples instead.
+        """
+        self.sampleCount = 0
+
+        if self.rawMode:
+            # Sample Rate Per Channel
+            self.channelRates = list(self.sampleRate) if np.ndim(self.sampleRate) else [self.sampleRate] * self.numGraphs
+            self.windowSizes = [int(sampleRate * self.windowSeconds) for sampleRate in self.channelRates]
+
+            # Raw Sample Buffers, One Per Channel
+            self.rawBuffers = [RingBuffer(windowSize) for windowSize in self.windowSizes]
+            for rawBuffer, windowSize in zip(self.rawBuffers, self.windowSizes):
+                rawBuffer.append(np.zeros(windowSize))
+
+            # Envelope Output Buffers Per Channel, Sized on First Draw (Curves Keep References to Their Data)
+            self.envelopeX = [np.zeros(0) for _ in range(self.numGraphs)]
+            self.envelopeY = [np.zeros(0) for _ in range(self.numGraphs)]
+            self.binIndex = [np.zeros(0) for _ in range(self.numGraphs)]
+            return
+
+        self.sampleBuffer = RingBuffer(self.bufferSize, dtype = np.int64)
+        self.plottingBuffer = RingBuffer(self.bufferSize, frameShape = (self.numGraphs,))
+
+        # Pre-Filling History
+        self.sampleBuffer.append(np.arange(-(self.bufferSize - 1), 1))
+        self.plottingBuffer.append(np.zeros((self.bufferSize, self.numGraphs)))
+
+    # Getting Plot Data
+    def plotView(self, channel):
+        """
+        Returns views of the sample indices and the channel history, oldest first. In raw mode returns the
+        min/max envelope of the channel window in seconds.
+        """
+        if self.rawMode:
+            return self.decimatedView(channel, self.plotWidth(channel))
+
+        return self.sampleBuffer.latest(self.bufferSize), self.plottingBuffer.latest(self.bufferSize)[:, channel]
+
+    # Getting Plot Width in Pixels
+    def plotWidth(self, channel = 0):
+        try:
+            plot = self.plots[channel] if self.plotLayout == 'grid' else self.plot
+            return max(int(plot.getViewBox().width()), 100)
+
+        except (AttributeError, IndexError):
+            return 800
+
+    # Decimating Raw Window
+    def decimatedView(self, channel, numPixels):
+        """
+        Returns (time, value) arrays for the raw window of channel, with time in seconds relative to the newest
+        sample. With more than two samples per pixel, samples are grouped into one bin per pixel and each bin
+        is drawn as a vertical min to max line, like an oscilloscope, so the cost stays bounded by the plot
+        width. Bins are aligned to the absolute sample index so the envelope does not shimmer as the window
+        scrolls.
+        """
+        rawBuffer = self.rawBuffers[channel]
+        sampleRate = self.channelRates[channel]
+        samples = rawBuffer.latest(self.windowSizes[channel])
+        firstSample = rawBuffer.writeCount - len(samples)
+        binSize = len(samples) // numPixels
+
+        # Few Samples Per Pixel, Drawing Raw Samples
+        if binSize <= 2:
+            return np.arange(-len(samples), 0) / sampleRate, samples
+
+        # Aligning First Bin to Absolute Sample Index
+        start = -firstSample % binSize
+        numBins = (len(samples) - start) // binSize
+        bins = samples[start:start + numBins * binSize].reshape(numBins, binSize)
+
+        # Resizing Output Buffers If Plot Width Changed
+        if len(self.envelopeY[channel]) != 2 * numBins:
+            self.envelopeX[channel] = np.zeros(2 * numBins)
+            self.envelopeY[channel] = np.zeros(2 * numBins)
+            self.binIndex[channel] = np.arange(numBins, dtype = np.float64)
+
+        envelopeX = self.envelopeX[channel]
+        envelopeY = self.envelopeY[channel]
+
+        # Min and Max Per Bin, Interleaved
+        np.min(bins, axis = 1, out = envelopeY[0::2])
+        np.max(bins, axis = 1, out = envelopeY[1::2])
+
+        # Bin Start Times in Seconds
+        binTimes = envelopeX[0::2]
+        np.multiply(self.binIndex[channel], binSize / sampleRate, out = binTimes)
+        np.add(binTimes, (start - len(samples)) / sampleRate, out = binTimes)
+        envelopeX[1::2] = binTimes
+
+        return envelopeX, envelopeY
+
+    #-----------------------------------------------------------------------------------
+    # ---- Plotting Functions
+
+    # Plot Updater
+    def plotEMG(self, data):
+        """
+        Updating graph widget window and data. Writes the new data sample for every channel into the circular
+        buffer, overwriting the oldest one, and updates the plot on the frame timer. In raw mode data is a
+        list with the new sample block of every channel.
+        """
+        if self.rawMode:
+            # Appending Raw Blocks
+            for rawBuffer, block in zip(self.rawBuffers, data):
+                rawBuffer.append(block)
+
+        else:
+            self.sampleCount += 1
+            self.sampleBuffer.append((self.sampleCount,))
+            self.plottingBuffer.append((data,))
+        
+        # Performing Graph Update on Shared Render Clock
+        currentTime = time.perf_counter()
+        if currentTime - self.lastRenderTime >= self.renderInterval:
+            self.renderFrame()
+            self.lastRenderTime = currentTime
+
+    # Redrawing Curves
+    def renderFrame(self):
+        """
+        Redraws every visible curve in one pass, one setData call per curve.
+        """
+        if self.plotLayout == 'grid':
+            for channel, plotItem in enumerate(self.plotItems):
+                x, y = self.plotView(channel)
+                plotItem.setData(x, y)
+                self.updateYRange(channel, y)
+
+        elif len(self.plotItems) > 0:
+            x, y = self.plotView(self.currentPlot)
+            self.plotItem.setData(x, y)
+            self.updateYRange(0, y)
+
+    # Updating Current Plot
+    def updateEMGPlot(self):
+        # Updating Current Plot Index and Title
+        self.currentPlot = self.sensorDisplayList.index(self.sensorDisplaySelection.currentText())
+        self.plot.setTitle(self.sensorDisplaySelection.currentText())
+
+        # Rescaling for New Channel
+        self.yRanges[0] = None
+
+    # Resetting Plot
+    def resetPlot(self):
+        # Resetting Tracking Variables
+        self.createBuffers()
+
+        # Clearing Plots
+        for plotItem in self.plotItems:
+            plotItem.clear()
+
+        self.yRanges = [None] * len(self.yRanges)
+        
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    widget = EMGPlot()
+    widget.show()
+    sys.exit(app.exec())
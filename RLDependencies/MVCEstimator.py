@@ -0,0 +1,257 @@
+import numpy as np
+
+class MVCEstimator():
+    """
+    This is the maximum voluntary contraction (MVC) estimator used by DelsysEMG.createMVCNorm. It works on
+    every trial and every EMG channel at once, in time linear in the trial length.
+
+    'topk' is the lab's original definition: the trial is rectified around its mean, the skipTop largest
+    samples are dropped as artifacts and the next numSamples largest are averaged. The samples are selected
+    with an in-place np.partition instead of a full sort, and only the selected few are sorted.
+
+    'rms' is the peak of the moving RMS envelope over windowSeconds, which is less sensitive to single spikes.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        estimator = MVCEstimator(method = 'topk')
+        trialValues = estimator.trialMVC(trials)    # trials: (numTrials, numChannels, numSamples) or nested lists
+        mvc = estimator.computeMVC(trials)          # (numChannels,), best trial per channel
+
+    """
+    def __init__(self, method = 'topk', skipTop = 6, numSamples = 100, windowSeconds = 0.5, sampleRate = 2148.1481):
+        # Estimator Definition
+        self.method = method
+
+        # Top-K Parameters, Defaults Match sortedMVCList[-106:-6]
+        self.skipTop = skipTop
+        self.numSamples = numSamples
+
+        # Moving RMS Parameters
+        self.windowSeconds = windowSeconds
+        self.sampleRate = sampleRate
+
+    #-----------------------------------------------------------------------------------
+    # ---- Estimation Functions
+
+    def computeMVC(self, trials):
+        """
+        Returns the MVC of each channel, the largest value over all trials.
+        """
+        return np.max(self.trialMVC(trials), axis = 0)
+
+    def trialMVC(self, trials):
+        """
+        Returns a (numTrials, numChannels) array with the MVC value of every trial and channel.
+        """
+        rectified = self.rectify(trials)
+
+        if self.method == 'rms':
+            return self.movingRMSPeak(rectified)
+
+        return self.topKAverage(rectified)
+
+    def rectify(self, trials):
+        """
+        Returns the trials rectified around their own mean as a new (numTrials, numChannels, numSamples) array,
+        keeping floating point input precision. Trials of different lengths are zero padded after
+        rectification, so padding never ranks above real samples.
+        """
+        # Equal Length Trials, Fully Vectorized
+        if isinstance(trials, np.ndarray):
+            if not np.issubdtype(trials.dtype, np.floating):
+                trials = trials.astype(np.float64)
+
+            rectified = np.subtract(trials, trials.mean(axis = -1, keepdims = True))
+            return np.abs(rectified, out = rectified)
+
+        # Ragged Trials, Filling a Padded Block
+        numSamples = max(len(channel) for trial in trials for channel in trial)
+        rectified = np.zeros((len(trials), len(trials[0]), numSamples))
+
+        for trialIndex, trial in enumerate(trials):
+            for channelIndex, channel in enumerate(trial):
+                if len(channel) > 0:
+                    np.abs(channel - np.mean(channel), out = rectified[trialIndex, channelIndex, :len(channel)])
+
+        return rectified
+
+    def topKAverage(self, rectified):
+        """
+        Averages the samples ranked skipTop + 1 to skipTop + numSamples from the top along the last axis. One
+        partition moves the skipTop + numSamples largest samples to the end in linear time, then only those
+        are sorted. Partitions rectified in place.
+        """
+        length = rectified.shape[-1]
+        low = max(length - self.skipTop - self.numSamples, 0)
+        high = max(length - self.skipTop, 0)
+
+        # Too Few Samples
+        if high <= low:
+            return np.full(rectified.shape[:-1], np.nan)
+
+        # Largest Samples to the End, Unordered
+        if low > 0:
+            rectified.partition(low, axis = -1)
+
+        # Ordering Only the Selected Samples and Dropping the skipTop Largest
+        topSamples = np.sort(rectified[..., low:], axis = -1)
+
+        return topSamples[..., :high - low].mean(axis = -1)
+
+    def movingRMSPeak(self, rectified):
+        """
+        Returns the peak of the windowSeconds moving RMS along the last axis, using a cumulative sum of
+        squares so the cost does not depend on the window length.
+        """
+        length = rectified.shape[-1]
+        windowSize = min(max(int(self.windowSeconds * self.sampleRate), 1), length)
+
+        # Cumulative Sum of Squares With Leading Zero
+        cumulative = np.zeros(rectified.shape[:-1] + (length + 1,))
+        np.cumsum(np.square(rectified), axis = -1, dtype = np.float64, out = cumulative[..., 1:])
+
+        # Mean Square of Every Window, Then Peak
+        meanSquare = (cumulative[..., windowSize:] - cumulative[..., :-windowSize]) / windowSize
+
+        return np.sqrt(np.maximum(meanSquare.max(axis = -1), 0))
+
+class OnlineMVCTracker():
+    """
+    This is the streaming version of MVCEstimator. It is fed each block of the MVC channels as it is acquired
+    (DelsysEMG.processData) and keeps, per channel, only the skipTop + numSamples largest rectified samples
+    ('topk') or the last window of squared samples and the envelope peak ('rms'). Memory does not grow with
+    the trial length, and the MVC of a trial is ready as soon as its last block arrives.
+
+    Blocks are rectified around the running mean of the trial so far, not the final trial mean. Trigno EMG
+    is high-pass filtered on the sensor, so the two agree closely after the first block.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        tracker = OnlineMVCTracker(numChannels = 1, estimator = MVCEstimator(method = 'topk'))
+        tracker.update([channelBlock])    # For every acquired block during the trial
+        trialValues = tracker.finishTrial()
+        mvc = tracker.computeMVC()        # Best finished trial per channel
+
+    """
+    def __init__(self, numChannels, estimator = None):
+        # Channels and Estimator Definition
+        self.numChannels = numChannels
+        self.estimator = estimator if estimator is not None else MVCEstimator()
+
+        # Samples Kept Per Channel
+        self.numTop = self.estimator.skipTop + self.estimator.numSamples
+        self.windowSize = max(int(self.estimator.windowSeconds * self.estimator.sampleRate), 1)
+
+        # Finished Trial Values, One (numChannels,) Array Per Trial
+        self.trialValues = []
+
+        self.reset()
+
+    def reset(self):
+        """
+        Starts a new trial. Values of finished trials are kept.
+        """
+        # Running Mean
+        self.trialSamples = 0
+        self.runningSum = np.zeros(self.numChannels)
+
+        # Top-K State
+        self.topSamples = np.zeros((self.numChannels, 0))
+
+        # Moving RMS State
+        self.squareTail = np.zeros((self.numChannels, 0))
+        self.rmsPeak = np.zeros(self.numChannels)
+
+    #-----------------------------------------------------------------------------------
+    # ---- Streaming Functions
+
+    def update(self, blocks):
+        """
+        Adds one block per channel. Blocks of one update must have the same length (channels at one sample rate).
+        """
+        block = np.asarray(blocks, dtype = np.float64)
+
+        # Skipping Empty Polls
+        if block.ndim != 2 or block.shape[1] == 0:
+            return
+
+        # Updating Running Mean and Rectifying
+        self.trialSamples += block.shape[1]
+        self.runningSum += block.sum(axis = 1)
+        rectified = np.abs(block - (self.runningSum / self.trialSamples)[:, None])
+
+        if self.estimator.method == 'rms':
+            self.updateRMS(rectified)
+        else:
+            self.updateTopK(rectified)
+
+    def updateTopK(self, rectified):
+        # Merging Block With Kept Samples and Keeping the numTop Largest
+        candidates = np.concatenate((self.topSamples, rectified), axis = 1)
+
+        if candidates.shape[1] > self.numTop:
+            candidates.partition(candidates.shape[1] - self.numTop, axis = 1)
+            candidates = candidates[:, -self.numTop:].copy()
+
+        self.topSamples = candidates
+
+    def updateRMS(self, rectified):
+        # Squared Samples With the Previous Window Tail, So Windows Span Block Boundaries
+        squares = np.concatenate((self.squareTail, np.square(rectified)), axis = 1)
+
+        # Peak of Every Complete Window Ending in This Block
+        if squares.shape[1] >= self.windowSize:
+            cumulative = np.zeros((self.numChannels, squares.shape[1] + 1))
+            np.cumsum(squares, axis = 1, out = cumulative[:, 1:])
+            meanSquare = (cumulative[:, self.windowSize:] - cumulative[:, :-self.windowSize]) / self.windowSize
+            np.maximum(self.rmsPeak, np.sqrt(np.maximum(meanSquare.max(axis = 1), 0)), out = self.rmsPeak)
+
+        # Keeping Last windowSize - 1 Squared Samples
+        self.squareTail = squares[:, max(squares.shape[1] - self.windowSize + 1, 0):].copy()
+
+    #-----------------------------------------------------------------------------------
+    # ---- Result Functions
+
+    def trialMVC(self):
+        """
+        Returns the (numChannels,) MVC of the current trial so far.
+        """
+        if self.estimator.method == 'rms':
+            # Trial Shorter Than One Window, Using All Samples Like MVCEstimator
+            if 0 < self.trialSamples < self.windowSize:
+                return np.sqrt(self.squareTail.mean(axis = 1))
+
+            return self.rmsPeak.copy()
+
+        # Dropping the skipTop Largest of the Kept Samples
+        numAveraged = self.topSamples.shape[1] - self.estimator.skipTop
+        if numAveraged <= 0:
+            return np.full(self.numChannels, np.nan)
+
+        return np.sort(self.topSamples, axis = 1)[:, :numAveraged].mean(axis = 1)
+
+    def finishTrial(self):
+        """
+        Stores the values of the current trial and starts a new one. Returns the trial values, or None if no
+        samples were recorded.
+        """
+        values = self.trialMVC() if self.trialSamples > 0 else None
+
+        if values is not None:
+            self.trialValues.append(values)
+
+        self.reset()
+
+        return values
+
+    def computeMVC(self):
+        """
+        Returns the MVC of each channel, the largest value over the finished trials.
+        """
+        return np.max(self.trialValues, axis = 0)
@@ -0,0 +1,181 @@
+import numpy as np
+
+class RingBuffer():
+    """
+    This is a preallocated ring buffer for streaming sensor samples. The storage is mirrored (two copies of
+    each sample, capacity apart), so any window of up to capacity samples is available as a contiguous
+    NumPy view without copying. Each consumer (saver, plotter, MVC, etc.) registers its own read cursor and
+    reads only the samples it has not seen yet, without clearing data for the other consumers.
+
+    Views returned by read() and latest() point into the buffer and stay valid until the writer has
+    appended another capacity worth of samples.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        ringBuffer = RingBuffer(capacity = 4096)
+        ringBuffer.addReader('plotter')
+        ringBuffer.append(samples)
+        newSamples = ringBuffer.read('plotter')
+
+    """
+    def __init__(self, capacity, frameShape = (), dtype = np.float64):
+        # Buffer Parameters
+        self.capacity = int(capacity)
+        self.frameShape = tuple(frameShape)
+        self.dtype = dtype
+
+        # Mirrored Storage, Sample i Lives at i and i + capacity
+        self.buffer = np.zeros((2 * self.capacity,) + self.frameShape, dtype = self.dtype)
+
+        # Total Number of Samples Ever Written
+        self.writeCount = 0
+
+        # Reader Cursors and Overrun Counters
+        self.readers = {}
+        self.overruns = {}
+
+    #-----------------------------------------------------------------------------------
+    # ---- Writing Functions
+
+    def append(self, block):
+        """
+        Appends a block of samples (samples along axis 0) to the buffer. Cost is proportional to the block
+        size only, not to the buffer capacity.
+        """
+        block = np.asarray(block)
+        numSamples = block.shape[0]
+
+        # Nothing to Append
+        if numSamples == 0:
+            return
+
+        # Keeping Only the Newest Capacity Samples
+        if numSamples > self.capacity:
+            self.writeCount += numSamples - self.capacity
+            block = block[-self.capacity:]
+            numSamples = self.capacity
+
+        # Writing Block Starting at Current Write Index
+        start = self.writeCount % self.capacity
+        end = start + numSamples
+        self.buffer[start:end] = block
+        self.mirror(start, end)
+
+        # Publishing New Samples
+        self.writeCount += numSamples
+
+    def appendColumns(self, columns, scales = None):
+        """
+        Appends one 1D block per frame column (e.g. one per channel, all the same length) to a buffer with
+        frameShape = (len(columns),), optionally multiplying each column by its scale. Columns are written
+        straight into the buffer through the ufunc out argument, so no stacked or scaled copy is made.
+        """
+        numSamples = len(columns[0]) if len(columns) > 0 else 0
+
+        # Nothing to Append
+        if numSamples == 0:
+            return
+
+        # Keeping Only the Newest Capacity Samples
+        skipped = max(numSamples - self.capacity, 0)
+        self.writeCount += skipped
+        numSamples -= skipped
+
+        # Writing Each Column Starting at Current Write Index
+        start = self.writeCount % self.capacity
+        end = start + numSamples
+        target = self.buffer[start:end]
+
+        for index, column in enumerate(columns):
+            if scales is None:
+                target[:, index] = column[skipped:]
+            else:
+                np.multiply(column[skipped:], scales[index], out = target[:, index])
+
+        self.mirror(start, end)
+
+        # Publishing New Samples
+        self.writeCount += numSamples
+
+    def mirror(self, start, end):
+        """
+        Copies samples just written to storage indices start to end into their mirrored position.
+        """
+        # Mirroring Samples That Landed in the First Half
+        firstHalfEnd = min(end, self.capacity)
+        self.buffer[start + self.capacity:firstHalfEnd + self.capacity] = self.buffer[start:firstHalfEnd]
+
+        # Mirroring Samples That Landed in the Second Half
+        if end > self.capacity:
+            self.buffer[:end - self.capacity] = self.buffer[self.capacity:end]
+
+    def reset(self):
+        """
+        Empties the buffer and moves all reader cursors back to the start.
+        """
+        self.writeCount = 0
+
+        for reader in self.readers.keys():
+            self.readers[reader] = 0
+            self.overruns[reader] = 0
+
+    #-----------------------------------------------------------------------------------
+    # ---- Reading Functions
+
+    def addReader(self, reader):
+        """
+        Registers a read cursor. New readers only see samples appended after registration.
+        """
+        self.readers[reader] = self.writeCount
+        self.overruns[reader] = 0
+
+    def available(self, reader):
+        """
+        Returns the number of unread samples for reader.
+        """
+        return min(self.writeCount - self.readers[reader], self.capacity)
+
+    def read(self, reader, maxSamples = None):
+        """
+        Returns a zero-copy view of the samples reader has not seen yet and advances its cursor. If the
+        reader fell more than capacity samples behind, the lost samples are added to its overrun counter.
+        """
+        cursor = self.readers[reader]
+        numSamples = self.writeCount - cursor
+
+        # Reader Was Lapped by the Writer
+        if numSamples > self.capacity:
+            self.overruns[reader] += numSamples - self.capacity
+            cursor = self.writeCount - self.capacity
+            numSamples = self.capacity
+
+        # Limiting Read Size
+        if maxSamples is not None:
+            numSamples = min(numSamples, maxSamples)
+
+        # Advancing Cursor
+        self.readers[reader] = cursor + numSamples
+
+        return self.window(cursor + numSamples, numSamples)
+
+    def latest(self, numSamples):
+        """
+        Returns a zero-copy view of the newest numSamples samples.
+        """
+        numSamples = min(numSamples, self.capacity, self.writeCount)
+
+        return self.window(self.writeCount, numSamples)
+
+    def window(self, endCount, numSamples):
+        """
+        Returns a contiguous view of numSamples samples ending at absolute sample count endCount.
+        """
+        # Finding End Index That Keeps the Window Contiguous
+        end = endCount % self.capacity
+        if end < numSamples:
+            end += self.capacity
+
+        return self.buffer[end - numSamples:end]
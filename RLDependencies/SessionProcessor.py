@@ -0,0 +1,255 @@
+import os
+import sys
+import json
+import time
+import hashlib
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from RLDependencies.AudioVideoMuxing import muxPair
+from RLDependencies.DataFileHandler import DataFileHandler
+
+class SessionProcessor():
+    """
+    This is the batch post-processor for a session or whole study directory. It finds every trial below
+    dirPath and runs two kinds of jobs over a process pool with one worker per core:
+
+        mux:      Trial.avi + Trial.wav -> Trial.mp4 (AudioVideoMuxing.muxPair, inputs removed once verified)
+        compact:  Trial.h5 rewritten with storageProfile (DataFileHandler.compactFile)
+
+    A manifest (manifestName, in dirPath) records every finished job with the size, modification time and
+    SHA-256 of its inputs and outputs. It is saved after every job, so an interrupted run loses at most the
+    jobs in progress, and the next run skips everything already finished. A finished job runs again only if
+    its files changed since: size and mtime are compared first, and the hash only when they differ.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        sessionProcessor = SessionProcessor('D:/Study', fps = 30)
+        summary = sessionProcessor.run()
+
+        python -m RLDependencies.SessionProcessor D:/Study 30
+
+    """
+    def __init__(self, dirPath, fps = 30, jobTypes = ('mux', 'compact'), storageProfile = 'compact', muxMode = 'copy', numWorkers = None,
+                 deleteInputs = True, manifestName = 'processingManifest.json'):
+        # Directory and Job Settings
+        self.dirPath = dirPath
+        self.fps = fps
+        self.jobTypes = jobTypes
+        self.storageProfile = storageProfile
+        self.muxMode = muxMode
+        self.deleteInputs = deleteInputs
+
+        # Workers, Cores Split Between Them for Re-Encoding
+        self.numWorkers = numWorkers or os.cpu_count() or 1
+        self.threads = max((os.cpu_count() or 1) // self.numWorkers, 1)
+
+        # Manifest of Finished Jobs
+        self.manifestPath = os.path.join(dirPath, manifestName)
+        self.manifest = self.loadManifest()
+
+    #-----------------------------------------------------------------------------------
+    # ---- Manifest Functions
+
+    def loadManifest(self):
+        # Starting Empty Without Readable Manifest
+        try:
+            with open(self.manifestPath, 'r') as manifestFile:
+                return json.load(manifestFile)
+
+        except FileNotFoundError:
+            return {'jobs' : {}}
+
+        except Exception as e:
+            print(e)
+            print(f"Unable to read {self.manifestPath}, starting new manifest")
+            return {'jobs' : {}}
+
+    def saveManifest(self):
+        # Writing Next to Manifest, Then Replacing, So It Is Never Half Written
+        tempPath = f"{self.manifestPath}.tmp"
+        with open(tempPath, 'w') as manifestFile:
+            json.dump(self.manifest, manifestFile, indent = 1)
+
+        os.replace(tempPath, self.manifestPath)
+
+    def isFinished(self, job):
+        """
+        Returns True if the manifest has job as done and its files still match: every output, and every input
+        that is still there and not rewritten in place. Removed mux inputs are expected.
+        """
+        entry = self.manifest['jobs'].get(job['key'])
+        if entry is None or entry['status'] != 'done':
+            return False
+
+        # Outputs Must Be Unchanged
+        for relativePath, fingerprint in entry['outputs'].items():
+            path = os.path.join(self.dirPath, relativePath)
+            if not os.path.exists(path) or not matchesFingerprint(path, fingerprint):
+                return False
+
+        # Inputs Still Present Must Be the Ones Processed
+        for relativePath, fingerprint in entry['inputs'].items():
+            path = os.path.join(self.dirPath, relativePath)
+            if relativePath not in entry['outputs'] and os.path.exists(path) and not matchesFingerprint(path, fingerprint):
+                return False
+
+        return True
+
+    #-----------------------------------------------------------------------------------
+    # ---- Job Functions
+
+    def findJobs(self):
+        """
+        Returns every job for the trials below dirPath, largest first so long jobs start early.
+        """
+        jobs = []
+
+        for directory, _, fileNames in os.walk(self.dirPath):
+            for fileName in sorted(fileNames):
+                trialName, fileExtension = os.path.splitext(fileName)
+                fileLocation = os.path.join(directory, trialName)
+                relativeLocation = os.path.relpath(fileLocation, self.dirPath)
+
+                # Video With Optional Audio
+                if fileExtension == '.avi' and 'mux' in self.jobTypes:
+                    jobs.append({'key' : f"{relativeLocation}.mux", 'type' : 'mux', 'fileLocation' : fileLocation,
+                                 'size' : os.path.getsize(f"{fileLocation}.avi")})
+
+                # Trial Data File
+                elif fileExtension == '.h5' and 'compact' in self.jobTypes:
+                    jobs.append({'key' : f"{relativeLocation}.compact", 'type' : 'compact', 'fileLocation' : fileLocation,
+                                 'size' : os.path.getsize(f"{fileLocation}.h5")})
+
+        # Settings Every Worker Needs
+        for job in jobs:
+            job.update({'dirPath' : self.dirPath, 'fps' : self.fps, 'muxMode' : self.muxMode, 'deleteInputs' : self.deleteInputs,
+                        'storageProfile' : self.storageProfile, 'threads' : self.threads})
+
+        return sorted(jobs, key = lambda job: job['size'], reverse = True)
+
+    def run(self):
+        """
+        Runs every unfinished job and saves the manifest after each one. Returns counts of finished, skipped
+        and failed jobs. Stopping with Ctrl+C keeps the jobs finished so far.
+        """
+        startTime = time.perf_counter()
+        allJobs = self.findJobs()
+        jobs = [job for job in allJobs if not self.isFinished(job)]
+        summary = {'finished' : 0, 'skipped' : len(allJobs) - len(jobs), 'failed' : 0}
+
+        print(f"Session processing: {len(jobs)} jobs to run, {summary['skipped']} already finished, {self.numWorkers} workers")
+        if len(jobs) == 0:
+            return summary
+
+        executor = ProcessPoolExecutor(max_workers = min(self.numWorkers, len(jobs)))
+        futures = {executor.submit(runJob, job) : job for job in jobs}
+
+        try:
+            for future in as_completed(futures):
+                job = futures[future]
+
+                try:
+                    entry = future.result()
+
+                except Exception as e:
+                    entry = {'status' : 'failed', 'error' : str(e), 'inputs' : {}, 'outputs' : {}}
+
+                # Recording Job as Soon as It Ends
+                entry['type'] = job['type']
+                entry['time'] = datetime.now().isoformat(timespec = 'seconds')
+                self.manifest['jobs'][job['key']] = entry
+                self.saveManifest()
+
+                if entry['status'] == 'done':
+                    summary['finished'] += 1
+                else:
+                    summary['failed'] += 1
+                    print(f"Failed {job['key']}: {entry['error']}")
+
+                print(f"{summary['finished'] + summary['failed']}/{len(jobs)} {job['key']} {entry['status']}")
+
+        except KeyboardInterrupt:
+            # Dropping Jobs Not Started, Finished Jobs Are in Manifest
+            print("Session processing interrupted, run again to resume")
+            for future in futures:
+                future.cancel()
+
+        finally:
+            executor.shutdown(wait = True)
+
+        print(f"Session processing: {summary['finished']} finished, {summary['skipped']} skipped, {summary['failed']} failed "
+              f"in {time.perf_counter() - startTime:.1f} s")
+
+        return summary
+
+#-----------------------------------------------------------------------------------
+# ---- Worker Functions
+
+def fileFingerprint(path):
+    """
+    Returns {'size', 'mtime', 'sha256'} of a file, hashing it in 1 MB blocks.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as openFile:
+        for block in iter(lambda: openFile.read(1 << 20), b''):
+            sha256.update(block)
+
+    return {'size' : os.path.getsize(path), 'mtime' : os.path.getmtime(path), 'sha256' : sha256.hexdigest()}
+
+def matchesFingerprint(path, fingerprint):
+    # Size and Modification Time First, Hash Only When They Disagree
+    if os.path.getsize(path) != fingerprint['size']:
+        return False
+
+    if os.path.getmtime(path) == fingerprint['mtime']:
+        return True
+
+    return fileFingerprint(path)['sha256'] == fingerprint['sha256']
+
+def runJob(job):
+    """
+    Runs one mux or compact job in a worker process. Returns its manifest entry: status, error, and the
+    fingerprints of inputs (before the job) and outputs (after), keyed by path relative to dirPath.
+    """
+    fileLocation = job['fileLocation']
+    relativePath = lambda path: os.path.relpath(path, job['dirPath'])
+    entry = {'status' : 'failed', 'error' : None, 'inputs' : {}, 'outputs' : {}}
+
+    if job['type'] == 'mux':
+        # Fingerprinting Inputs Before They Are Removed
+        for path in (f"{fileLocation}.avi", f"{fileLocation}.wav"):
+            if os.path.exists(path):
+                entry['inputs'][relativePath(path)] = fileFingerprint(path)
+
+        result = muxPair(fileLocation, job['fps'], job['muxMode'], job['deleteInputs'], 0.5, job['threads'])
+        entry['method'] = result['method']
+
+        if result['verified']:
+            entry['status'] = 'done'
+            entry['outputs'][relativePath(result['outputPath'])] = fileFingerprint(result['outputPath'])
+        else:
+            entry['error'] = result['error']
+
+    elif job['type'] == 'compact':
+        completePath = f"{fileLocation}.h5"
+        entry['inputs'][relativePath(completePath)] = fileFingerprint(completePath)
+
+        try:
+            sizeBefore, sizeAfter = DataFileHandler().compactFile(completePath, job['storageProfile'])
+            entry['status'] = 'done'
+            entry['sizeBefore'] = sizeBefore
+            entry['sizeAfter'] = sizeAfter
+            entry['outputs'][relativePath(completePath)] = fileFingerprint(completePath)
+
+        except Exception as e:
+            entry['error'] = str(e)
+
+    return entry
+
+if __name__ == '__main__':
+    # Study Directory and Optional Frame Rate
+    SessionProcessor(sys.argv[1], fps = int(sys.argv[2]) if len(sys.argv) > 2 else 30).run()
@@ -0,0 +1,824 @@
+import os
+import numpy as np
+import cv2
+import threading
+import queue
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+from collections import deque
+
+from RLDependencies.RingBuffer import *
+
+class VideoCaptureThread(threading.Thread):
+    """
+    This is the background camera reader for VideoWidget. It reads frames from an OpenCV capture object at
+    the camera's own pace into a small pool of preallocated frame buffers, so 1080p capture no longer runs
+    on the GUI timer. Every frame goes to two places:
+
+        Latest-value slot:  the newest frame only, for display. Older frames are replaced, never queued.
+        Writer queue:       every frame while recording, bounded. When the writer falls behind, the oldest
+                            queued frame is dropped and counted as an overrun. stopRecording() queues a
+                            sentinel after the last recorded frame, which ends the VideoWriterThread.
+
+    Buffers are reference counted, so a buffer is only reused once the display and the writer are done with
+    it. The pool is allocated from the shape of the first frame read.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        captureThread = VideoCaptureThread(cv2.VideoCapture(0))
+        captureThread.start()
+        latest = captureThread.acquireLatest()
+        if latest is not None:
+            index, frame, timestamp, frameNumber = latest
+            ...
+            captureThread.releaseFrame(index)
+
+    """
+    def __init__(self, cap, maxQueuedFrames = 8, readRetryInterval = 0.005):
+        super().__init__(daemon = True)
+        self.cap = cap
+        self.readRetryInterval = readRetryInterval
+
+        # Frame Pool: Writer Queue, Latest Slot, Display Reader and Frame Being Read
+        self.poolSize = maxQueuedFrames + 3
+        self.framePool = []
+        self.referenceCounts = np.zeros(self.poolSize, dtype = int)
+        self.freeBuffers = deque(range(self.poolSize))
+        self.poolLock = threading.Lock()
+
+        # Latest-Value Slot
+        self.latestIndex = None
+        self.latestTimestamp = None
+        self.latestFrameNumber = 0
+        self.frameNumber = 0
+
+        # Bounded Writer Queue of (index, timestamp, frameNumber), None Ends the Recording
+        self.writerQueue = queue.Queue(maxsize = maxQueuedFrames)
+        self.recording = False
+        self.recordingLock = threading.Lock()
+        self.stopEvent = threading.Event()
+
+        # Capture Counters
+        self.framesCaptured = 0
+        self.framesQueued = 0
+        self.overrunCount = 0
+        self.maxQueueDepth = 0
+        self.readErrors = 0
+
+    #-----------------------------------------------------------------------------------
+    # ---- Capture Thread Functions
+
+    def run(self):
+        # Loop for Reading
+        while not self.stopEvent.is_set():
+            index = self.acquireBuffer()
+
+            # Every Buffer Held by Display
+            if index is None:
+                self.stopEvent.wait(self.readRetryInterval)
+                continue
+
+            try:
+                ret, frame = self.readFrame(index)
+
+            except Exception as e:
+                print(f"Video capture read error: {e}")
+                ret = False
+
+            timestamp = time.time()
+
+            if ret:
+                self.publish(index, timestamp)
+
+            else:
+                # Returning Buffer and Waiting for Camera
+                self.readErrors += 1
+                self.releaseFrame(index)
+                self.stopEvent.wait(self.readRetryInterval)
+
+    def readFrame(self, index):
+        """
+        Reads the next frame into buffer index, allocating the pool on the first frame.
+        """
+        # Allocating Pool From First Frame
+        if len(self.framePool) == 0:
+            ret, frame = self.cap.read()
+            if ret:
+                self.framePool = [np.empty_like(frame) for _ in range(self.poolSize)]
+                np.copyto(self.framePool[index], frame)
+
+            return ret, frame
+
+        # Reading Straight Into Pool Buffer
+        buffer = self.framePool[index]
+        ret, frame = self.cap.read(buffer)
+
+        # Capture Backend Allocated Its Own Array
+        if ret and frame is not buffer:
+            if frame.shape != buffer.shape:
+                print(f"Video capture frame shape changed to {frame.shape}")
+                return False, None
+
+            np.copyto(buffer, frame)
+
+        return ret, buffer
+
+    def acquireBuffer(self):
+        """
+        Returns a free buffer index. If none is free, drops the oldest frame waiting for the writer.
+        """
+        with self.poolLock:
+            if len(self.freeBuffers) > 0:
+                index = self.freeBuffers.popleft()
+                self.referenceCounts[index] = 1
+                return index
+
+        # Writer Is Behind, Dropping Oldest Queued Frame
+        self.dropOldest()
+
+        with self.poolLock:
+            if len(self.freeBuffers) > 0:
+                index = self.freeBuffers.popleft()
+                self.referenceCounts[index] = 1
+                return index
+
+        return None
+
+    def publish(self, index, timestamp):
+        """
+        Moves a freshly read frame into the latest-value slot and, while recording, the writer queue.
+        """
+        self.framesCaptured += 1
+        self.frameNumber += 1
+
+        # Holding Recording State Until Frame Is Queued, So No Frame Follows the Stop Sentinel
+        with self.recordingLock:
+            recording = self.recording
+
+            with self.poolLock:
+                # Reference for Latest Slot Replaces Reference for Reading, Plus One for Writer
+                self.referenceCounts[index] += 1 if recording else 0
+                previousIndex = self.latestIndex
+                self.latestIndex = index
+                self.latestTimestamp = timestamp
+                self.latestFrameNumber = frameNumber = self.frameNumber
+
+            # Releasing Previous Latest Frame
+            if previousIndex is not None:
+                self.releaseFrame(previousIndex)
+
+            if recording:
+                self.queueFrame((index, timestamp, frameNumber))
+
+    def queueFrame(self, item):
+        """
+        Queues one frame for the writer. When the queue is full, the oldest frame is dropped to make room.
+        """
+        while True:
+            try:
+                self.writerQueue.put_nowait(item)
+                break
+
+            except queue.Full:
+                self.dropOldest()
+
+        self.framesQueued += 1
+
+        # Tracking Queue Depth
+        self.maxQueueDepth = max(self.maxQueueDepth, self.writerQueue.qsize())
+
+    def dropOldest(self):
+        try:
+            item = self.writerQueue.get_nowait()
+
+        except queue.Empty:
+            return
+
+        # Keeping Stop Sentinel, Nothing Is Queued Behind It
+        if item is None:
+            self.writerQueue.task_done()
+            self.writerQueue.put_nowait(None)
+            return
+
+        index, _, _ = item
+
+        # Consumer Is Behind, Dropping Oldest Frame
+        self.overrunCount += 1
+        self.releaseFrame(index)
+        self.writerQueue.task_done()
+
+    #-----------------------------------------------------------------------------------
+    # ---- Recording Functions
+
+    def startRecording(self):
+        # Queuing Every Frame From the Next One Read
+        with self.recordingLock:
+            self.recording = True
+
+    def stopRecording(self):
+        """
+        Stops queuing frames and queues the sentinel after the last recorded frame. The writer thread writes
+        every frame before it and exits, so join it to wait for the recording to be written.
+        """
+        with self.recordingLock:
+            if self.recording:
+                self.recording = False
+                self.writerQueue.put(None)
+
+    #-----------------------------------------------------------------------------------
+    # ---- Consumer Functions
+
+    def acquireLatest(self):
+        """
+        Returns (index, frame, timestamp, frameNumber) for the newest frame, or None before the first frame.
+        The buffer stays valid until releaseFrame(index).
+        """
+        with self.poolLock:
+            if self.latestIndex is None:
+                return None
+
+            index = self.latestIndex
+            self.referenceCounts[index] += 1
+
+            return index, self.framePool[index], self.latestTimestamp, self.latestFrameNumber
+
+    def nextQueuedFrame(self, timeout = 0.1):
+        """
+        Returns (index, frame, timestamp, frameNumber) for the oldest frame waiting for the writer, None
+        after timeout seconds, or False for the stop sentinel. Call releaseFrame(index) and
+        writerQueue.task_done() once a frame is written.
+        """
+        try:
+            item = self.writerQueue.get(timeout = timeout)
+
+        except queue.Empty:
+            return None
+
+        # Recording Stopped, Every Frame Before Sentinel Was Handed Out
+        if item is None:
+            self.writerQueue.task_done()
+            return False
+
+        index, timestamp, frameNumber = item
+
+        return index, self.framePool[index], timestamp, frameNumber
+
+    def releaseFrame(self, index):
+        # Returning Buffer to Pool on Last Reference
+        with self.poolLock:
+            self.referenceCounts[index] -= 1
+
+            if self.referenceCounts[index] == 0:
+                self.freeBuffers.append(index)
+
+    def flush(self):
+        """
+        Blocks until every queued frame has been written or dropped.
+        """
+        self.writerQueue.join()
+
+    def stop(self):
+        # Signalling Loop to Exit
+        self.stopEvent.set()
+
+    def stats(self):
+        return {'framesCaptured' : self.framesCaptured,
+                'framesQueued' : self.framesQueued,
+                'queueDepth' : self.writerQueue.qsize(),
+                'maxQueueDepth' : self.maxQueueDepth,
+                'overrunCount' : self.overrunCount,
+                'readErrors' : self.readErrors}
+
+class VideoWriterThread(threading.Thread):
+    """
+    This is the consumer of the VideoCaptureThread writer queue. It writes every queued frame to the current
+    output (a VideoEncoder, a cv2.VideoWriter or any object with a write(frame) function) and returns the
+    buffer to the pool. Frames that arrive while no output is set are discarded. With an AudioRecorder, the
+    audio sample index at each frame's capture time goes to the sidecar CSV: the VideoEncoder writes its
+    own, and for other outputs this thread writes the same (videoFrame, frameNumber, captureTime,
+    audioSample) rows to the sidecarPath given to setOutput. One writer serves one recording: it exits at
+    the sentinel queued by captureThread.stopRecording() and closes its sidecar.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        writerThread = VideoWriterThread(captureThread, audioRecorder)
+        writerThread.start()
+        writerThread.setOutput(cv2.VideoWriter(...), 'Trial 1_frames.csv')
+        captureThread.startRecording()
+        ...
+        captureThread.stopRecording()
+        writerThread.join()
+
+    """
+    def __init__(self, captureThread, audioRecorder = None):
+        super().__init__(daemon = True)
+        self.captureThread = captureThread
+        self.audioRecorder = audioRecorder
+        self.output = None
+        self.sidecar = None
+        self.outputLock = threading.Lock()
+        self.stopEvent = threading.Event()
+
+        # Writer Counters
+        self.framesWritten = 0
+        self.framesDiscarded = 0
+        self.writeErrors = 0
+
+    def setOutput(self, output, sidecarPath = None):
+        """
+        Sets the output for frames not yet written, normally before the writer starts. sidecarPath is only
+        used for outputs other than a VideoEncoder, which writes its own sidecar.
+        """
+        with self.outputLock:
+            self.closeSidecar()
+            self.output = output
+
+            # Frame Times and Audio Position for Outputs Without Their Own Sidecar
+            if sidecarPath is not None and output is not None and not isinstance(output, VideoEncoder):
+                self.sidecar = open(sidecarPath, 'w')
+                self.sidecar.write('videoFrame,frameNumber,captureTime,audioSample\n')
+                self.sidecarFrames = 0
+
+    def closeSidecar(self):
+        if self.sidecar is not None:
+            self.sidecar.close()
+            self.sidecar = None
+
+    def run(self):
+        # Loop for Writing
+        while not self.stopEvent.is_set():
+            queuedFrame = self.captureThread.nextQueuedFrame()
+            if queuedFrame is None:
+                continue
+
+            # Stop Sentinel, Every Recorded Frame Is Written
+            if queuedFrame is False:
+                break
+
+            index, frame, timestamp, frameNumber = queuedFrame
+
+            try:
+                with self.outputLock:
+                    output = self.output
+                    audioSample = self.audioRecorder.sampleIndexAt(timestamp) if self.audioRecorder is not None and output is not None else None
+
+                    if isinstance(output, VideoEncoder):
+                        # Encoder Process Also Records Capture Timestamps and Audio Position
+                        output.write(frame, timestamp, frameNumber, audioSample)
+                        self.framesWritten += 1
+                    elif output is not None:
+                        output.write(frame)
+                        self.framesWritten += 1
+
+                        # Same Sidecar Row the Encoder Writes
+                        if self.sidecar is not None:
+                            self.sidecar.write(f"{self.sidecarFrames},{frameNumber},{timestamp:.6f},{audioSample if audioSample is not None else ''}\n")
+                            self.sidecarFrames += 1
+                    else:
+                        self.framesDiscarded += 1
+
+            except Exception as e:
+                print(f"Video writer error: {e}")
+                self.writeErrors += 1
+
+            finally:
+                # Returning Buffer
+                self.captureThread.releaseFrame(index)
+                self.captureThread.writerQueue.task_done()
+
+        # Recording Finished
+        with self.outputLock:
+            self.closeSidecar()
+
+    def stop(self):
+        # Signalling Loop to Exit
+        self.stopEvent.set()
+
+    def stats(self):
+        return {'framesWritten' : self.framesWritten,
+                'framesDiscarded' : self.framesDiscarded,
+                'writeErrors' : self.writeErrors}
+
+class AudioRecorder(threading.Thread):
+    """
+    This is the audio side of VideoWidget. The PyAudio stream runs in callback mode and hands every block
+    to addBlock, which only appends it to a RingBuffer and notes when it arrived, so audio capture never
+    waits on the GUI timer. This thread drains the ring buffer to the open WAV file every drainInterval
+    seconds while recording.
+
+    The arrival time of recent blocks is kept so sampleIndexAt can map any capture timestamp (e.g. a video
+    frame) to the WAV sample recorded at that moment, by interpolating between block ends.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        audioRecorder = AudioRecorder(channels = 2, rate = 44100)
+        audioRecorder.start()
+        stream = audio.open(..., stream_callback = callback)    # callback calls audioRecorder.addBlock(inData, status)
+        audioRecorder.openFile(wave.open('Trial 1.wav', 'wb'))
+        audioRecorder.setRecording(True)
+        sampleIndex = audioRecorder.sampleIndexAt(frameTimestamp)
+        audioRecorder.release()
+
+    """
+    def __init__(self, channels = 2, rate = 44100, bufferSeconds = 10, drainInterval = 0.05, historyLength = 256):
+        super().__init__(daemon = True)
+        self.channels = channels
+        self.rate = rate
+        self.drainInterval = drainInterval
+
+        # Int16 Samples From Callback, Read by This Thread
+        self.ringBuffer = RingBuffer(int(bufferSeconds * rate), frameShape = (channels,), dtype = np.int16)
+        self.ringBuffer.addReader('writer')
+
+        # Sample Count and Arrival Time at End of Recent Blocks
+        self.blockEnds = deque(maxlen = historyLength)
+        self.blockTimes = deque(maxlen = historyLength)
+        self.timingLock = threading.Lock()
+
+        # WAV File and First Sample Written to It
+        self.audioWriter = None
+        self.fileStartSample = None
+        self.recording = False
+        self.fileLock = threading.Lock()
+        self.stopEvent = threading.Event()
+
+        # Audio Counters
+        self.blocksCaptured = 0
+        self.statusFlags = 0
+        self.samplesWritten = 0
+
+    #-----------------------------------------------------------------------------------
+    # ---- Capture Functions
+
+    def addBlock(self, inData, status = 0):
+        """
+        Stores one block of interleaved int16 samples. Called from the PortAudio callback thread, so it
+        only copies the block into the ring buffer.
+        """
+        self.ringBuffer.append(np.frombuffer(inData, dtype = np.int16).reshape(-1, self.channels))
+        arrivalTime = time.time()
+
+        with self.timingLock:
+            self.blockEnds.append(self.ringBuffer.writeCount)
+            self.blockTimes.append(arrivalTime)
+
+        # Input Overflow or Underflow Reported by PortAudio
+        self.blocksCaptured += 1
+        if status:
+            self.statusFlags += 1
+
+    def absoluteSampleAt(self, timestamp):
+        """
+        Returns the sample count since the stream opened at timestamp, or None before the first block.
+        """
+        with self.timingLock:
+            blockEnds = np.array(self.blockEnds)
+            blockTimes = np.array(self.blockTimes)
+
+        if len(blockEnds) == 0:
+            return None
+
+        # Between Known Blocks, Interpolating, Otherwise Extrapolating at Nominal Rate
+        if len(blockEnds) > 1 and blockTimes[0] <= timestamp <= blockTimes[-1]:
+            return int(round(np.interp(timestamp, blockTimes, blockEnds)))
+
+        reference = 0 if timestamp < blockTimes[0] else -1
+
+        return int(round(blockEnds[reference] + (timestamp - blockTimes[reference]) * self.rate))
+
+    def sampleIndexAt(self, timestamp):
+        """
+        Returns the index in the current WAV file of the sample captured at timestamp (time.time()), or None
+        if the file has not started.
+        """
+        absoluteSample = self.absoluteSampleAt(timestamp)
+        fileStartSample = self.fileStartSample
+
+        if absoluteSample is None or fileStartSample is None:
+            return None
+
+        return absoluteSample - fileStartSample
+
+    #-----------------------------------------------------------------------------------
+    # ---- File Functions
+
+    def openFile(self, audioWriter):
+        """
+        Starts writing to a wave file opened for writing with its channels, sample width and rate set.
+        """
+        with self.fileLock:
+            self.audioWriter = audioWriter
+            self.samplesWritten = 0
+            self.fileStartSample = None
+
+            # File Starts Now if Already Recording
+            if self.recording:
+                self.fileStartSample = self.startSample()
+
+    def setRecording(self, recording):
+        """
+        Starts or stops writing samples. The file starts with the sample captured when recording started.
+        """
+        if recording and not self.recording:
+            with self.fileLock:
+                if self.audioWriter is not None and self.fileStartSample is None:
+                    self.fileStartSample = self.startSample()
+                self.recording = True
+
+        elif not recording and self.recording:
+            # Writing Samples Captured Before Stop
+            self.drain()
+            self.recording = False
+
+    def startSample(self):
+        # Sample Captured Now, or Next Sample Before the First Block
+        absoluteSample = self.absoluteSampleAt(time.time())
+
+        return absoluteSample if absoluteSample is not None else self.ringBuffer.writeCount
+
+    def release(self):
+        """
+        Writes remaining samples and detaches the file. The caller closes it. Returns the number of samples
+        written.
+        """
+        self.drain()
+
+        with self.fileLock:
+            self.audioWriter = None
+            self.fileStartSample = None
+
+        return self.samplesWritten
+
+    #-----------------------------------------------------------------------------------
+    # ---- Writer Thread Functions
+
+    def run(self):
+        # Loop for Draining
+        while not self.stopEvent.wait(self.drainInterval):
+            self.drain()
+
+    def drain(self):
+        """
+        Writes every sample captured since the last drain, from the file start on, to the WAV file.
+        Samples captured while not recording are discarded.
+        """
+        with self.fileLock:
+            samples = self.ringBuffer.read('writer')
+            if self.audioWriter is None or not self.recording or self.fileStartSample is None:
+                return
+
+            # Skipping Samples Captured Before File Start
+            startCount = self.ringBuffer.readers['writer'] - len(samples)
+            samples = samples[min(max(self.fileStartSample - startCount, 0), len(samples)):]
+
+            try:
+                self.audioWriter.writeframes(samples.tobytes())
+                self.samplesWritten += len(samples)
+
+            except Exception as e:
+                print(f"Audio writer error: {e}")
+
+    def stop(self):
+        # Signalling Loop to Exit
+        self.stopEvent.set()
+
+    def stats(self):
+        return {'blocksCaptured' : self.blocksCaptured,
+                'statusFlags' : self.statusFlags,
+                'samplesWritten' : self.samplesWritten,
+                'overrunSamples' : self.ringBuffer.overruns['writer']}
+
+class VideoEncoder():
+    """
+    This is the recording side of VideoWidget moved to its own process, so XVID encoding runs on another core
+    instead of the thread that feeds it. Frames are copied into a ring of numSlots frames in shared memory
+    (multiprocessing.shared_memory) and only the slot number, capture timestamp and frame number go through
+    the command queue, so frames are never pickled. A semaphore counts free slots. When the encoder is
+    behind and the ring is full, the frame is dropped and counted instead of blocking the caller.
+
+    Each file gets a sidecar CSV (videoFrame, frameNumber, captureTime, audioSample) with the capture time of
+    every encoded frame and, when known, the index of the WAV sample recorded at that time. Gaps in
+    frameNumber mark frames dropped before encoding. Results count ring drops (ringFullDrops) and frames lost
+    before reaching the encoder (framesMissing) separately.
+
+    The process is started once and reused for every file. The encoder also behaves like a cv2.VideoWriter
+    (write and release), so it can be handed to VideoWriterThread.setOutput.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        videoEncoder = VideoEncoder(frameShape = (1080, 1920, 3))
+        videoEncoder.openFile('Trial 1.avi', fps = 30)
+        videoEncoder.write(frame, timestamp, frameNumber, audioSample)
+        print(videoEncoder.release())      # Encoder results for Trial 1.avi
+        videoEncoder.stop()
+
+    """
+    def __init__(self, frameShape = (1080, 1920, 3), numSlots = 16, closeTimeout = 30):
+        # Frame Ring in Shared Memory
+        self.frameShape = tuple(frameShape)
+        self.numSlots = numSlots
+        self.sharedMemory = shared_memory.SharedMemory(create = True, size = numSlots * int(np.prod(self.frameShape)))
+        self.frameRing = np.ndarray((numSlots,) + self.frameShape, dtype = np.uint8, buffer = self.sharedMemory.buf)
+        self.writeIndex = 0
+
+        # Commands to Encoder, Free Slot Count and Results Back
+        self.commandQueue = multiprocessing.Queue()
+        self.freeSlots = multiprocessing.Semaphore(numSlots)
+        self.resultQueue = multiprocessing.Queue()
+        self.closeTimeout = closeTimeout
+
+        # Encoder Process
+        self.process = multiprocessing.Process(target = runEncoder, args = (self.sharedMemory.name, self.frameRing.shape, self.commandQueue,
+                                                                            self.freeSlots, self.resultQueue), daemon = True)
+        self.process.start()
+
+        # File State and Counters
+        self.isOpen = False
+        self.videoPath = None
+        self.fileResults = []
+        self.resetCounters()
+
+    def resetCounters(self):
+        self.framesSubmitted = 0
+        self.ringFullDrops = 0
+        self.dropsSinceSubmit = 0
+        self.maxSlotsInUse = 0
+
+    #-----------------------------------------------------------------------------------
+    # ---- File Functions
+
+    def openFile(self, videoPath, fourcc = 'XVID', fps = 30, sidecarPath = None):
+        """
+        Starts a new video file. The sidecar defaults to the video path with a _frames.csv ending.
+        """
+        if self.isOpen:
+            self.release()
+
+        if sidecarPath is None:
+            sidecarPath = os.path.splitext(videoPath)[0] + '_frames.csv'
+
+        self.resetCounters()
+        self.commandQueue.put(('open', videoPath, fourcc, fps, sidecarPath))
+        self.videoPath = videoPath
+        self.isOpen = True
+
+    def write(self, frame, timestamp = None, frameNumber = None, audioSample = None):
+        """
+        Copies a frame into the ring for encoding. Frames of another size are resized into the slot. Returns
+        False if no file is open or the ring is full.
+        """
+        if not self.isOpen:
+            return False
+
+        # Encoder Is Behind, Dropping Frame
+        if not self.freeSlots.acquire(block = False):
+            self.ringFullDrops += 1
+            self.dropsSinceSubmit += 1
+            return False
+
+        # Slots Are Freed in Order, So the Next One Is Always the Oldest
+        slot = self.writeIndex % self.numSlots
+        if frame.shape == self.frameShape:
+            np.copyto(self.frameRing[slot], frame)
+        else:
+            cv2.resize(frame, (self.frameShape[1], self.frameShape[0]), dst = self.frameRing[slot])
+
+        # Ring Drops Since Last Frame Go With It, So the Encoder Does Not Count Them as Missing
+        self.commandQueue.put(('frame', slot, timestamp if timestamp is not None else time.time(), frameNumber, audioSample, self.dropsSinceSubmit))
+        self.dropsSinceSubmit = 0
+        self.writeIndex += 1
+        self.framesSubmitted += 1
+
+        return True
+
+    def release(self):
+        """
+        Finishes the current file once every submitted frame is encoded. Returns the encoder results for the
+        file, or None if no file was open or the encoder did not finish in time. Late results of earlier
+        files are discarded by videoPath.
+        """
+        if not self.isOpen:
+            return None
+
+        self.isOpen = False
+        self.commandQueue.put(('close',))
+        deadline = time.perf_counter() + self.closeTimeout
+
+        while True:
+            try:
+                results = self.resultQueue.get(timeout = max(deadline - time.perf_counter(), 0))
+
+            except queue.Empty:
+                print(f"Video encoder did not finish {self.videoPath} in time")
+                return None
+
+            # Skipping Result of an Earlier File That Timed Out
+            if results.get('videoPath') == self.videoPath:
+                break
+
+        # Adding Drops Counted Before the Ring
+        results['framesSubmitted'] = self.framesSubmitted
+        results['ringFullDrops'] = self.ringFullDrops
+        self.fileResults.append(results)
+
+        return results
+
+    def stop(self):
+        # Finishing File, Stopping Process and Freeing Shared Memory
+        self.release()
+        self.commandQueue.put(('stop',))
+        self.process.join(self.closeTimeout)
+
+        del self.frameRing
+        self.sharedMemory.close()
+        self.sharedMemory.unlink()
+
+def runEncoder(ringName, ringShape, commandQueue, freeSlots, resultQueue):
+    """
+    Encoder process loop for VideoEncoder. Handles 'open', 'frame', 'close' and 'stop' commands in order.
+    """
+    # Attaching to Frame Ring
+    sharedMemory = shared_memory.SharedMemory(name = ringName)
+    frameRing = np.ndarray(ringShape, dtype = np.uint8, buffer = sharedMemory.buf)
+
+    videoWriter = None
+    sidecar = None
+
+    while True:
+        command = commandQueue.get()
+
+        if command[0] == 'frame':
+            _, slot, timestamp, frameNumber, audioSample, ringDrops = command
+
+            if videoWriter is not None:
+                try:
+                    # Encoding Frame
+                    startTime = time.perf_counter()
+                    videoWriter.write(frameRing[slot])
+                    encodeTimes.append(time.perf_counter() - startTime)
+
+                    # Frame Number Gaps Not Explained by Ring Drops Were Lost Before the Encoder
+                    if frameNumber is not None and previousFrameNumber is not None and frameNumber > previousFrameNumber + 1:
+                        results['framesMissing'] += max(frameNumber - previousFrameNumber - 1 - ringDrops, 0)
+                    previousFrameNumber = frameNumber
+
+                    sidecar.write(f"{results['framesEncoded']},{frameNumber if frameNumber is not None else ''},{timestamp:.6f},"
+                                  f"{audioSample if audioSample is not None else ''}\n")
+                    results['framesEncoded'] += 1
+
+                except Exception as e:
+                    print(f"Video encoder error: {e}")
+                    results['writeErrors'] += 1
+
+            # Returning Slot
+            freeSlots.release()
+
+        elif command[0] == 'open':
+            _, videoPath, fourcc, fps, sidecarPath = command
+
+            # Creating Outlet and Sidecar
+            videoWriter = cv2.VideoWriter(videoPath, cv2.VideoWriter_fourcc(*fourcc), fps, (ringShape[2], ringShape[1]))
+            if not videoWriter.isOpened():
+                print(f"Video encoder could not open {videoPath}")
+
+            sidecar = open(sidecarPath, 'w')
+            sidecar.write('videoFrame,frameNumber,captureTime,audioSample\n')
+
+            results = {'videoPath' : videoPath, 'sidecarPath' : sidecarPath, 'framesEncoded' : 0, 'framesMissing' : 0, 'writeErrors' : 0}
+            encodeTimes = []
+            previousFrameNumber = None
+
+        elif command[0] == 'close':
+            # Releasing Outlet and Reporting
+            if videoWriter is not None:
+                videoWriter.release()
+                sidecar.close()
+                videoWriter = None
+
+                encodeTimes = np.array(encodeTimes) * 1000
+                results['encodeP50'] = float(np.percentile(encodeTimes, 50)) if len(encodeTimes) else 0.0
+                results['encodeP95'] = float(np.percentile(encodeTimes, 95)) if len(encodeTimes) else 0.0
+                resultQueue.put(results)
+
+            else:
+                resultQueue.put({'videoPath' : None})
+
+        elif command[0] == 'stop':
+            break
+
+    # Detaching From Frame Ring
+    del frameRing
+    sharedMemory.close()
@@ -1,323 +1,469 @@
-import sys
-import numpy as np
-
-from PySide6.QtGui import *
-from PySide6.QtCore import *
-from PySide6.QtWidgets import *
-
-from RLDependencies.XSensorForce import *
-
-class XSensorWidget(QWidget):
-    """
-    This is a controller for the XSensorForce class to display the XSensor data on a PySide6 GUI.
-    This is used to display the data using a grid intensity graph and control the XSensor configuration
-    and data collection.
-
-    Author: Sonny Jones & Grange Simpson
-    Version: 2023.11.27
-
-    Usage:
-
-        app = QApplication(sys.argv)
-        window = XSensorWidget()
-        window.show()
-        sys.exit(app.exec())
-
-    """
-    def __init__(self, recordingRate):
-        super().__init__()
-        self.XSensorStatus = "Idle"
-        self.XSensorForce = XSensorForce(recordingRate = 1000//recordingRate)
-        # self.XSensorForce = XSensorForce()
-        self.sensorsConnected = 0
-        self.XSensorControlPanel = self.XSensorPanel()
-        self.sensorDisplayTrack = {}
-        self.splitter = QSplitter(self)
-        self.splitter.addWidget(self.XSensorControlPanel)
-        self.layout = QVBoxLayout(self)
-        self.layout.addWidget(self.splitter)
-        self.sensorData = []
-        self.frameDelay = recordingRate * 2
-        self.ready = False
-
-    #-----------------------------------------------------------------------------------
-    # ---- XSensor Control and Display Widget
-
-    def XSensorPanel(self):
-        # Panel Layout
-        XSensorPanel = QWidget()
-        XSensorPanelLayout = QVBoxLayout()
-        XSensorPanel.setFixedSize(400, 200)
-
-        # Panel Label
-        self.XSensorPanelLabel = QLabel("<b>XSensor Force Insoles</b>", alignment = Qt.AlignCenter)
-        self.XSensorPanelLabel.setStyleSheet('QLabel {color: black; font-size: 20px}')
-        XSensorPanelLayout.addWidget(self.XSensorPanelLabel)
-
-        # Status Panel
-        self.XSensorStatusLabel = QLabel("<b>XSensor Status: " + self.XSensorStatus, alignment = Qt.AlignCenter)
-        self.XSensorStatusLabel.setStyleSheet('QLabel {color: black;}')
-        XSensorPanelLayout.addWidget(self.XSensorStatusLabel)
-        
-        # Sensors Connected
-        self.sensorsConnected = QLabel("<b>Sensors Connected: " + str(self.sensorsConnected), alignment = Qt.AlignCenter)
-        self.sensorsConnected.setStyleSheet('QLabel {color: black;}')
-        XSensorPanelLayout.addWidget(self.sensorsConnected)
-
-        # Weight Entry Layout
-        weightEntryLayout = QHBoxLayout()
-
-        # Weight Entry QLabel
-        self.weightEntryLabel = QLabel("<u>Participant Weight:</u>", alignment = Qt.AlignCenter)
-        self.weightEntryLabel.setStyleSheet('QLabel {color: black;}')
-        weightEntryLayout.addWidget(self.weightEntryLabel)
-
-        # Weight Entry Box
-        self.weightEntryBox = QLineEdit(self)
-        self.weightEntryBox.setText("Enter Participant Weight")
-        self.weightEntryBox.setAlignment(Qt.AlignCenter)
-        self.weightEntryBox.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.weightEntryBox.setStyleSheet('QLineEdit {color: black;}')
-        self.weightEntryBox.setDisabled(True)
-        weightEntryLayout.addWidget(self.weightEntryBox)
-
-        # Adding To Main Layout
-        XSensorPanelLayout.addLayout(weightEntryLayout)
-
-        # Configure Button
-        self.configureButton = QPushButton("Configure", self)
-        self.configureButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.configureButton.objectName = 'Configure Button'
-        self.configureButton.clicked.connect(self.configureXSensorCallback)
-        self.configureButton.setEnabled(False)
-        XSensorPanelLayout.addWidget(self.configureButton)
-
-        # Connect Button
-        self.connectButton = QPushButton("Connect", self)
-        self.connectButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.connectButton.objectName = 'Start Button'
-        self.connectButton.clicked.connect(self.connectXSensorCallback)
-        self.connectButton.setStyleSheet("color: grey")
-        self.connectButton.setEnabled(False)
-        XSensorPanelLayout.addWidget(self.connectButton)
-
-        # Setting Panel Layout
-        XSensorPanel.setLayout(XSensorPanelLayout)
-
-        return XSensorPanel
-    
-    def XSensorDisplay(self, sensor):
-        SensorDisplayPanel = QWidget()
-        SensorDisplayLayout = QVBoxLayout()
-        SensorDisplayLayout.setAlignment(Qt.AlignTop)
-        SensorDisplayPanel.setFixedSize(220, 620)
-
-        # Sensor Display Label
-        self.sensorDisplayLabel = QLabel(f"<b>Insole {sensor + 1}</b>", alignment = Qt.AlignCenter)
-        self.sensorDisplayLabel.setStyleSheet('QLabel {color: black;}')
-        SensorDisplayLayout.addWidget(self.sensorDisplayLabel)
-
-        # Creating QLabel array
-        sensorLabel = QLabel()
-        sensorLabel.setAlignment(Qt.AlignCenter)
-        self.sensorDisplayTrack[sensor] = sensorLabel
-
-        # Adding to Sensor Display Panel
-        SensorDisplayLayout.addWidget(sensorLabel)
-
-        # Setting Layout as Panel
-        SensorDisplayPanel.setLayout(SensorDisplayLayout)
-
-        return SensorDisplayPanel
-
-    #-----------------------------------------------------------------------------------
-    # ---- XSensor Control Callbacks
-
-    # Configure Callback
-    def configureXSensorCallback(self):
-        try:
-            self.XSensorForce.configure()
-            self.XSensorStatus = "Configured"
-            self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
-            self.configureButton.setStyleSheet("color: black")
-
-            # Setting Metadata for Insoles
-            self.numRows = self.XSensorForce.senselRows.value
-            self.numCols = self.XSensorForce.senselColumns.value
-            self.minValue = self.XSensorForce.minPressureRange.value
-            # self.maxValue = self.XSensorForce.maxPressureRange.value
-            self.maxValue = 40
-
-            # Adding Display
-            for sensor in range(self.XSensorForce.numSensors):
-                # Checking if Panel already exists
-                sensorDisplay = self.XSensorDisplay(sensor)
-                self.splitter.addWidget(sensorDisplay)
-
-            # Adding Dummy Data
-            self.updateDisplayInit()
-
-        except Exception as e:
-            print(e)
-            self.XSensorStatus = "Configure Failed"
-            self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
-
-        # Updating Sensor Num
-        self.numSensors = self.XSensorForce.numSensors
-        self.sensorsConnected.setText("<b> Sensors Connected: " + str(self.numSensors))
-
-        # Updating Connect Button
-        self.connectButton.setEnabled(True)
-        self.connectButton.setStyleSheet("color: black")
-
-        """
-        self.stopButton.setEnabled(True)
-        self.stopButton.setStyleSheet("color: black")
-
-        self.quitButton.setEnabled(True)
-        self.quitButton.setStyleSheet("color: black")
-        """
-        
-    # Start Data Collection Callback
-    def connectXSensorCallback(self):
-        try:
-            status = self.XSensorForce.connect()
-            if status:
-                """
-                self.processDataButton.setEnabled(True)
-                self.processDataButton.setStyleSheet("color: black")
-                self.quitButton.setEnabled(True)
-                self.quitButton.setStyleSheet("color: black")
-                """
-                
-                self.XSensorStatus = "Connected"
-                self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
-                self.ready = True
-        except:
-            pass
-
-    # Sensor Update Status
-    def updateSensorStatus(self):
-        self.XSensorStatus = "Running"
-        self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
-
-    # Data Processing Callback
-    def processDataCallback(self):
-        self.XSensorForce.processData()
-
-    # Clearing Data Buffer
-    def resetBuffer(self):
-        self.XSensorForce.resetBuffer()
-
-    # Stop Data Collection
-    def stopDataCollection(self):
-        self.XSensorForce.stopDataCollection()
-        self.XSensorStatus = "Connected"
-        self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
-
-    # Releasing and Quitting Callback
-    def releaseAndQuit(self):
-        self.XSensorForce.releaseConfig()
-        self.XSensorForce.quit()
-
-    #-----------------------------------------------------------------------------------
-    # ---- XSensor Display Callbacks
-
-    # Getting color for display
-    def getQImage(self, data):
-        # Resetting Normalization
-        self.maxValue = np.max(data) if np.max(data) > self.maxValue else self.maxValue
-        mappedValue = abs((data - self.minValue) / (self.maxValue - self.minValue))
-        
-        # Creating Color Mapping (RGBA)
-        colormap = np.zeros((data.shape[0], data.shape[1], 4), dtype = np.uint8)
-
-        # Applying Mapping
-        colormap[..., 0] = (255 * (1 - mappedValue)).astype(np.uint8)  # Red channel
-        colormap[..., 1] = (255 * (1 - mappedValue)).astype(np.uint8)  # Green channel
-        colormap[..., 2] = 255  # Blue channel (always 255 for blue)
-        colormap[..., 3] = 255  # Alpha channel (fully opaque)
-
-        # Converting to QImage
-        height, width, channels = colormap.shape
-        bytesPerLine = channels * width
-        qImage = QImage(colormap.data, width, height, bytesPerLine, QImage.Format_RGBA8888)
-
-        # Scaling Image
-        return qImage.scaled(220, 620, Qt.KeepAspectRatio)
-    
-    # Updating Display for Example Sizes
-    def updateDisplayInit(self):
-        try:
-            for sensorID, label in self.sensorDisplayTrack.items():
-                # Getting Data From Sensor
-                data = np.zeros((31, 11))
-
-                # Creating Pixmap
-                qImage = self.getQImage(data)
-                pixmap = QPixmap.fromImage(qImage)
-
-                # Setting Pixmap
-                label.setPixmap(pixmap)
-
-        except Exception as e:
-            print(f"Error updating XSensor Display: {e}")
-
-    # Display Update Function
-    def updateDisplay(self):
-        try:
-            # Looping Through Each Sensor
-            for sensorID, label in self.sensorDisplayTrack.items():
-                # Getting Data From Sensor
-                data = np.array(self.XSensorForce.data[sensorID])
-
-                # Reshapping Data
-                reshappedData = data.reshape(31,11)
-
-                # Creating Pixmap
-                qImage = self.getQImage(reshappedData)
-                pixmap = QPixmap.fromImage(qImage)
-
-                # Setting Pixmap
-                label.setPixmap(pixmap)
-
-        except Exception as e:
-            print(f"Error updating XSensor Display: {e}")
-
-    #-----------------------------------------------------------------------------------
-    # ---- Archived
-
-        """
-        # Process Data Button
-        self.processDataButton = QPushButton("Process Data", self)
-        self.processDataButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.processDataButton.objectName = 'Process Data Button'
-        self.processDataButton.clicked.connect(self.processDataCallback)
-        self.processDataButton.setStyleSheet("color: grey")
-        self.processDataButton.setEnabled(False)
-        XSensorPanelLayout.addWidget(self.processDataButton)
-
-        # Stop Button
-        self.stopButton = QPushButton("Stop", self)
-        self.stopButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.stopButton.objectName = 'Stop Button'
-        self.stopButton.clicked.connect(self.stopDataCollection)
-        self.stopButton.setStyleSheet("color: grey")
-        self.stopButton.setEnabled(False)
-        XSensorPanelLayout.addWidget(self.stopButton)
-
-        # Quit Button
-        self.quitButton = QPushButton("Quit", self)
-        self.quitButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.quitButton.objectName = 'Quit Button'
-        self.quitButton.clicked.connect(self.XSensorForce.quit)
-        self.quitButton.setStyleSheet("color: grey")
-        self.quitButton.setEnabled(False)
-        XSensorPanelLayout.addWidget(self.quitButton)
-        """
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = XSensorWidget()
-    window.show()
+import sys
+import numpy as np
+import pyqtgraph as pg
+
+from PySide6.QtGui import *
+from PySide6.QtCore import *
+from PySide6.QtWidgets import *
+
+from RLDependencies.XSensorForce import *
+
+class XSensorWidget(QWidget):
+    """
+    This is a controller for the XSensorForce class to display the XSensor data on a PySide6 GUI.
+    This is used to display the data using a grid intensity graph and control the XSensor configuration
+    and data collection.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2023.11.27
+
+    Usage:
+
+        app = QApplication(sys.argv)
+        window = XSensorWidget()
+        window.show()
+        sys.exit(app.exec())
+
+    """
+    def __init__(self, recordingRate, colormap = 'default', displayBackend = 'qimage'):
+        super().__init__()
+        self.XSensorStatus = "Idle"
+        self.XSensorForce = XSensorForce(recordingRate = 1000//recordingRate)
+        # self.XSensorForce = XSensorForce()
+        self.sensorsConnected = 0
+        self.XSensorControlPanel = self.XSensorPanel()
+        self.sensorDisplayTrack = {}
+        self.splitter = QSplitter(self)
+        self.splitter.addWidget(self.XSensorControlPanel)
+        self.layout = QVBoxLayout(self)
+        self.layout.addWidget(self.splitter)
+        self.sensorData = []
+        self.frameDelay = recordingRate * 2
+        self.ready = False
+
+        # Display Size and Colormap Lookup Table, 'default' or a Matplotlib Colormap Name
+        self.displaySize = QSize(220, 620)
+        self.colormap = colormap
+        self.colorLUT = self.createColorLUT(colormap)
+
+        # Reused Display Buffers and QImages, Keyed by Sensor
+        self.scaleBuffers = {}
+        self.indexBuffers = {}
+        self.rgbaBuffers = {}
+        self.qImages = {}
+
+        # Display Backend, 'qimage' (PressureMapView) or 'pyqtgraph' (ImageItem With Fixed Lookup Table)
+        self.displayBackend = displayBackend
+        self.imageItems = {}
+        self.imageLevels = None
+
+    #-----------------------------------------------------------------------------------
+    # ---- XSensor Control and Display Widget
+
+    def XSensorPanel(self):
+        # Panel Layout
+        XSensorPanel = QWidget()
+        XSensorPanelLayout = QVBoxLayout()
+        XSensorPanel.setFixedSize(400, 200)
+
+        # Panel Label
+        self.XSensorPanelLabel = QLabel("<b>XSensor Force Insoles</b>", alignment = Qt.AlignCenter)
+        self.XSensorPanelLabel.setStyleSheet('QLabel {color: black; font-size: 20px}')
+        XSensorPanelLayout.addWidget(self.XSensorPanelLabel)
+
+        # Status Panel
+        self.XSensorStatusLabel = QLabel("<b>XSensor Status: " + self.XSensorStatus, alignment = Qt.AlignCenter)
+        self.XSensorStatusLabel.setStyleSheet('QLabel {color: black;}')
+        XSensorPanelLayout.addWidget(self.XSensorStatusLabel)
+        
+        # Sensors Connected
+        self.sensorsConnected = QLabel("<b>Sensors Connected: " + str(self.sensorsConnected), alignment = Qt.AlignCenter)
+        self.sensorsConnected.setStyleSheet('QLabel {color: black;}')
+        XSensorPanelLayout.addWidget(self.sensorsConnected)
+
+        # Weight Entry Layout
+        weightEntryLayout = QHBoxLayout()
+
+        # Weight Entry QLabel
+        self.weightEntryLabel = QLabel("<u>Participant Weight:</u>", alignment = Qt.AlignCenter)
+        self.weightEntryLabel.setStyleSheet('QLabel {color: black;}')
+        weightEntryLayout.addWidget(self.weightEntryLabel)
+
+        # Weight Entry Box
+        self.weightEntryBox = QLineEdit(self)
+        self.weightEntryBox.setText("Enter Participant Weight")
+        self.weightEntryBox.setAlignment(Qt.AlignCenter)
+        self.weightEntryBox.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.weightEntryBox.setStyleSheet('QLineEdit {color: black;}')
+        self.weightEntryBox.setDisabled(True)
+        weightEntryLayout.addWidget(self.weightEntryBox)
+
+        # Adding To Main Layout
+        XSensorPanelLayout.addLayout(weightEntryLayout)
+
+        # Configure Button
+        self.configureButton = QPushButton("Configure", self)
+        self.configureButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.configureButton.objectName = 'Configure Button'
+        self.configureButton.clicked.connect(self.configureXSensorCallback)
+        self.configureButton.setEnabled(False)
+        XSensorPanelLayout.addWidget(self.configureButton)
+
+        # Connect Button
+        self.connectButton = QPushButton("Connect", self)
+        self.connectButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.connectButton.objectName = 'Start Button'
+        self.connectButton.clicked.connect(self.connectXSensorCallback)
+        self.connectButton.setStyleSheet("color: grey")
+        self.connectButton.setEnabled(False)
+        XSensorPanelLayout.addWidget(self.connectButton)
+
+        # Setting Panel Layout
+        XSensorPanel.setLayout(XSensorPanelLayout)
+
+        return XSensorPanel
+    
+    def XSensorDisplay(self, sensor):
+        SensorDisplayPanel = QWidget()
+        SensorDisplayLayout = QVBoxLayout()
+        SensorDisplayLayout.setAlignment(Qt.AlignTop)
+        SensorDisplayPanel.setFixedSize(220, 620)
+
+        # Sensor Display Label
+        self.sensorDisplayLabel = QLabel(f"<b>Insole {sensor + 1}</b>", alignment = Qt.AlignCenter)
+        self.sensorDisplayLabel.setStyleSheet('QLabel {color: black;}')
+        SensorDisplayLayout.addWidget(self.sensorDisplayLabel)
+
+        # Creating Pressure Map View
+        if self.displayBackend == 'pyqtgraph':
+            sensorLabel = self.createImageItemView(sensor)
+        else:
+            # Upscaled While Painting
+            sensorLabel = PressureMapView(self.displaySize)
+        self.sensorDisplayTrack[sensor] = sensorLabel
+
+        # Adding to Sensor Display Panel
+        SensorDisplayLayout.addWidget(sensorLabel)
+
+        # Setting Layout as Panel
+        SensorDisplayPanel.setLayout(SensorDisplayLayout)
+
+        return SensorDisplayPanel
+
+    def createImageItemView(self, sensor):
+        """
+        Creates a pyqtgraph view with a row-major ImageItem for one insole. The lookup table and levels are
+        fixed, so frames are only color mapped, never rescanned for levels.
+        """
+        # View Box Keeping Sensel Aspect, Row 0 at Top
+        imageView = pg.GraphicsView()
+        imageView.setBackground(None)
+        viewBox = pg.ViewBox(lockAspect = True, invertY = True, enableMouse = False)
+        viewBox.setMenuEnabled(False)
+        imageView.setCentralItem(viewBox)
+
+        # Image Item With Fixed Lookup Table
+        imageItem = pg.ImageItem(axisOrder = 'row-major')
+        imageItem.setLookupTable(self.colorLUT)
+        imageItem.setLevels([self.minValue, self.maxValue])
+        viewBox.addItem(imageItem)
+        self.imageItems[sensor] = imageItem
+
+        return imageView
+
+    #-----------------------------------------------------------------------------------
+    # ---- XSensor Control Callbacks
+
+    # Configure Callback
+    def configureXSensorCallback(self):
+        try:
+            self.XSensorForce.configure()
+            self.XSensorStatus = "Configured"
+            self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
+            self.configureButton.setStyleSheet("color: black")
+
+            # Setting Metadata for Insoles
+            self.numRows = self.XSensorForce.senselRows.value
+            self.numCols = self.XSensorForce.senselColumns.value
+            self.minValue = self.XSensorForce.minPressureRange.value
+            # self.maxValue = self.XSensorForce.maxPressureRange.value
+            self.maxValue = 40
+
+            # Adding Display
+            for sensor in range(self.XSensorForce.numSensors):
+                # Checking if Panel already exists
+                sensorDisplay = self.XSensorDisplay(sensor)
+                self.splitter.addWidget(sensorDisplay)
+
+            # Adding Dummy Data
+            self.updateDisplayInit()
+
+        except Exception as e:
+            print(e)
+            self.XSensorStatus = "Configure Failed"
+            self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
+
+        # Updating Sensor Num
+        self.numSensors = self.XSensorForce.numSensors
+        self.sensorsConnected.setText("<b> Sensors Connected: " + str(self.numSensors))
+
+        # Updating Connect Button
+        self.connectButton.setEnabled(True)
+        self.connectButton.setStyleSheet("color: black")
+
+        """
+        self.stopButton.setEnabled(True)
+        self.stopButton.setStyleSheet("color: black")
+
+        self.quitButton.setEnabled(True)
+        self.quitButton.setStyleSheet("color: black")
+        """
+        
+    # Start Data Collection Callback
+    def connectXSensorCallback(self):
+        try:
+            status = self.XSensorForce.connect()
+            if status:
+                """
+                self.processDataButton.setEnabled(True)
+                self.processDataButton.setStyleSheet("color: black")
+                self.quitButton.setEnabled(True)
+                self.quitButton.setStyleSheet("color: black")
+                """
+                
+                self.XSensorStatus = "Connected"
+                self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
+                self.ready = True
+        except:
+            pass
+
+    # Sensor Update Status
+    def updateSensorStatus(self):
+        self.XSensorStatus = "Running"
+        self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
+
+    # Data Processing Callback
+    def processDataCallback(self):
+        self.XSensorForce.processData()
+
+    # Clearing Data Buffer
+    def resetBuffer(self):
+        self.XSensorForce.resetBuffer()
+
+    # Stop Data Collection
+    def stopDataCollection(self):
+        self.XSensorForce.stopDataCollection()
+        self.XSensorStatus = "Connected"
+        self.XSensorStatusLabel.setText("<b> XSensor Status: " + self.XSensorStatus)
+
+    # Releasing and Quitting Callback
+    def releaseAndQuit(self):
+        self.XSensorForce.releaseConfig()
+        self.XSensorForce.quit()
+
+    #-----------------------------------------------------------------------------------
+    # ---- XSensor Display Callbacks
+
+    # Creating Colormap Lookup Table
+    def createColorLUT(self, colormap = 'default'):
+        """
+        Returns a (256, 4) uint8 RGBA lookup table. 'default' is the original white to blue map, any other
+        name is looked up in the matplotlib colormaps.
+        """
+        # White to Blue, Red and Green Fade With Pressure
+        colorLUT = np.full((256, 4), 255, dtype = np.uint8)
+        colorLUT[:, 0] = 255 - np.arange(256)
+        colorLUT[:, 1] = 255 - np.arange(256)
+
+        if colormap != 'default':
+            try:
+                import matplotlib
+                colorLUT = (matplotlib.colormaps[colormap](np.linspace(0, 1, 256)) * 255).round().astype(np.uint8)
+
+            except Exception as e:
+                print(f"Unable to load colormap {colormap}, using default: {e}")
+
+        return colorLUT
+
+    # Changing Colormap
+    def setColormap(self, colormap):
+        self.colormap = colormap
+        self.colorLUT = self.createColorLUT(colormap)
+
+        # Updating Image Item Lookup Tables
+        for imageItem in self.imageItems.values():
+            imageItem.setLookupTable(self.colorLUT)
+
+    # Displaying Frame on Selected Backend
+    def setDisplayFrame(self, sensor, data):
+        if self.displayBackend == 'pyqtgraph':
+            # Resetting Normalization
+            frameMax = np.max(data)
+            self.maxValue = frameMax if frameMax > self.maxValue else self.maxValue
+
+            # Updating Levels Only When Range Changes
+            imageItem = self.imageItems[sensor]
+            if self.imageLevels != (self.minValue, self.maxValue):
+                self.imageLevels = (self.minValue, self.maxValue)
+                for item in self.imageItems.values():
+                    item.setLevels(self.imageLevels)
+
+            imageItem.setImage(data, autoLevels = False)
+
+        else:
+            self.sensorDisplayTrack[sensor].setImage(self.getQImage(data, sensor))
+
+    # Getting color for display
+    def getQImage(self, data, sensor = 0):
+        """
+        Maps a (rows, columns) pressure frame through the colormap lookup table into the sensor's reused RGBA
+        buffer, and returns the QImage wrapping that buffer. Scaling is left to the view.
+        """
+        # Creating Buffers on First Use or Size Change
+        if sensor not in self.qImages or self.rgbaBuffers[sensor].shape[:2] != data.shape:
+            self.createDisplayBuffers(sensor, data.shape)
+
+        # Resetting Normalization
+        frameMax = np.max(data)
+        self.maxValue = frameMax if frameMax > self.maxValue else self.maxValue
+
+        # Quantizing to Lookup Table Indices
+        scaleBuffer = self.scaleBuffers[sensor]
+        np.subtract(data, self.minValue, out = scaleBuffer)
+        np.multiply(scaleBuffer, 255 / (self.maxValue - self.minValue), out = scaleBuffer)
+        np.clip(scaleBuffer, 0, 255, out = scaleBuffer)
+
+        # Failed Sensor Frames Are NaN, Shown at the Bottom of the Colormap
+        np.nan_to_num(scaleBuffer, copy = False, nan = 0.0)
+        np.copyto(self.indexBuffers[sensor], scaleBuffer, casting = 'unsafe')
+
+        # Applying Mapping (RGBA)
+        np.take(self.colorLUT, self.indexBuffers[sensor], axis = 0, out = self.rgbaBuffers[sensor])
+
+        return self.qImages[sensor]
+
+    # Creating Reused Buffers for Sensor
+    def createDisplayBuffers(self, sensor, shape):
+        height, width = shape
+        self.scaleBuffers[sensor] = np.empty((height, width), dtype = np.float32)
+        self.indexBuffers[sensor] = np.empty((height, width), dtype = np.uint8)
+        self.rgbaBuffers[sensor] = np.zeros((height, width, 4), dtype = np.uint8)
+
+        # QImage Sharing RGBA Buffer Memory
+        self.qImages[sensor] = QImage(self.rgbaBuffers[sensor].data, width, height, 4 * width, QImage.Format_RGBA8888)
+    
+    # Updating Display for Example Sizes
+    def updateDisplayInit(self):
+        try:
+            for sensorID, label in self.sensorDisplayTrack.items():
+                # Getting Data From Sensor
+                data = np.zeros((self.numRows, self.numCols), dtype = np.float32)
+
+                # Setting Image
+                self.setDisplayFrame(sensorID, data)
+
+        except Exception as e:
+            print(f"Error updating XSensor Display: {e}")
+
+    # Display Update Function
+    def updateDisplay(self):
+        try:
+            # Nothing to Display Without New Frames
+            if len(self.XSensorForce.data) == 0:
+                return
+
+            # Looping Through Each Sensor
+            for sensorID, label in self.sensorDisplayTrack.items():
+                # Getting Latest Frame From Sensor
+                data = self.XSensorForce.data[-1, sensorID, :self.numRows * self.numCols]
+
+                # Reshapping Data
+                reshappedData = data.reshape(self.numRows, self.numCols)
+
+                # Setting Image
+                self.setDisplayFrame(sensorID, reshappedData)
+
+        except Exception as e:
+            print(f"Error updating XSensor Display: {e}")
+
+    #-----------------------------------------------------------------------------------
+    # ---- Archived
+
+        """
+        # Process Data Button
+        self.processDataButton = QPushButton("Process Data", self)
+        self.processDataButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.processDataButton.objectName = 'Process Data Button'
+        self.processDataButton.clicked.connect(self.processDataCallback)
+        self.processDataButton.setStyleSheet("color: grey")
+        self.processDataButton.setEnabled(False)
+        XSensorPanelLayout.addWidget(self.processDataButton)
+
+        # Stop Button
+        self.stopButton = QPushButton("Stop", self)
+        self.stopButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.stopButton.objectName = 'Stop Button'
+        self.stopButton.clicked.connect(self.stopDataCollection)
+        self.stopButton.setStyleSheet("color: grey")
+        self.stopButton.setEnabled(False)
+        XSensorPanelLayout.addWidget(self.stopButton)
+
+        # Quit Button
+        self.quitButton = QPushButton("Quit", self)
+        self.quitButton.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        self.quitButton.objectName = 'Quit Button'
+        self.quitButton.clicked.connect(self.XSensorForce.quit)
+        self.quitButton.setStyleSheet("color: grey")
+        self.quitButton.setEnabled(False)
+        XSensorPanelLayout.addWidget(self.quitButton)
+        """
+
+class PressureMapView(QWidget):
+    """
+    This is a view for one insole pressure map. It keeps a reference to the small sensor-resolution QImage
+    and scales it to the widget while painting (nearest neighbour, aspect ratio kept), so no scaled copy or
+    QPixmap is created per frame.
+
+    Author: Sonny Jones & Grange Simpson
+    Version: 2026.10.18
+
+    Usage:
+
+        view = PressureMapView(QSize(220, 620))
+        view.setImage(qImage)
+
+    """
+    def __init__(self, displaySize):
+        super().__init__()
+        self.qImage = None
+        self.displaySize = displaySize
+
+        # Filling Available Space, Image Aspect Ratio is Kept While Painting
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def sizeHint(self):
+        return self.displaySize
+
+    def setImage(self, qImage):
+        # Repainting With New Image Contents
+        self.qImage = qImage
+        self.update()
+
+    def paintEvent(self, event):
+        if self.qImage is None:
+            return
+
+        # Fitting Image in Widget, Keeping Aspect Ratio
+        targetSize = self.qImage.size().scaled(self.size(), Qt.KeepAspectRatio)
+        targetRect = QRect(QPoint(0, 0), targetSize)
+        targetRect.moveCenter(self.rect().center())
+
+        painter = QPainter(self)
+        painter.drawImage(targetRect, self.qImage)
+        painter.end()
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = XSensorWidget()
+    window.show()
     sys.exit(app.exec())
\ No newline at end of file